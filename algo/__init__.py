@@ -1,4 +1,10 @@
 from .sort import *
+from .parallel import parallelSort
+from .external import externalSort
+from .selection import nthElement, partialSort, topK
+from .profiling import SortStats, profileSort
+from .adaptive import SortDecision, smartSort
+from .sortedlist import SortedList, mergeSorted
 
 __all__ = [
     "insertionSort", 
@@ -6,6 +12,21 @@ __all__ = [
     "quickSort",
     "countSort",
     "mergeSort",
-    "selectionSort"
+    "selectionSort",
+    "binaryInsertionSort",
+    "shellSort",
+    "cocktailSort",
+    "radixSort",
+    "parallelSort",
+    "externalSort",
+    "nthElement",
+    "partialSort",
+    "topK",
+    "SortStats",
+    "profileSort",
+    "SortDecision",
+    "smartSort",
+    "SortedList",
+    "mergeSorted",
 ]
 __version__ = "1.0.0"
\ No newline at end of file
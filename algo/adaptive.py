@@ -0,0 +1,219 @@
+from dataclasses import dataclass
+from typing import List, Any, Callable, Optional
+
+from .sort import (
+    NUMPY_CUTOFF,
+    _sortByKey,
+    np,
+    countSort,
+    insertionSort,
+    mergeSort,
+    quickSort,
+    radixSort,
+)
+
+# Inputs up to this size always go to insertion sort.
+SMALL_SIZE = 32
+# Nearly sorted inputs up to this size go to insertion sort, larger ones to mergeSort.
+NEARLY_SORTED_INSERTION_SIZE = 256
+# Inputs estimated to consist of at most this many runs count as nearly sorted.
+NEARLY_SORTED_RUNS = 4
+# Non-integer inputs whose runs are this long on average go to mergeSort.
+LONG_RUN = 256
+# The sample is made of this many windows of consecutive elements...
+SAMPLE_WINDOWS = 16
+# ... of this length, so local order (runs) is visible in it.
+SAMPLE_WINDOW = 16
+# Integer inputs whose value range is at most this many times N use countSort.
+COUNT_RANGE_FACTOR = 4
+# Integer inputs with at most this fraction of distinct values use countSort too.
+FEW_UNIQUE_RATIO = 0.05
+
+@dataclass
+class SortDecision:
+    """
+    What `smartSort` saw in the input and what it did about it.
+
+    Attributes:
+        algorithm (str): "insertion", "merge", "quick", "count" or "radix".
+        reason (str): A human readable justification.
+        size (int): Number of elements.
+        sample_size (int): Number of elements inspected.
+        disorder (float): Fraction of adjacent sampled pairs out of order
+            (0.0 sorted, 1.0 reverse sorted).
+        runs (int): Estimated number of ascending or descending runs.
+        distinct_ratio (float): Distinct values / sampled values.
+        integer (bool): Whether the keys are all ints.
+        value_range (Optional[int]): max - min of the keys, for integers.
+        strategy (Optional[str]): countSort's histogram strategy, if used.
+    """
+    algorithm: str
+    reason: str
+    size: int
+    sample_size: int = 0
+    disorder: float = 0.0
+    runs: int = 1
+    distinct_ratio: float = 1.0
+    integer: bool = False
+    value_range: Optional[int] = None
+    strategy: Optional[str] = None
+
+def smartSort(lst: List[Any], key: Optional[Callable[[Any], Any]] = None, *,
+              reverse: bool = False, stable: bool = False) -> SortDecision:
+    """
+    Sorts a list in-place with the algorithm that best fits its contents.
+
+    A cheap sample (a few windows of consecutive elements) estimates how
+    presorted the input is and how many duplicates it has; integer inputs
+    additionally get their exact value range (C-level min/max). The decision:
+
+    - tiny inputs, or nearly sorted ones of moderate size: insertion sort;
+    - nearly sorted (ascending or descending) larger inputs: mergeSort,
+      whose natural run detection makes them close to O(N);
+    - integers with a small range or few distinct values (or any 64-bit
+      integers when NumPy is available): countSort;
+    - other integers, when few enough radix passes are needed: radixSort;
+    - long presorted runs, or `stable=True` without a key: mergeSort;
+    - anything else: quickSort (introsort).
+
+    With a key each key is computed exactly once and the decision is made on
+    the keys; the result is then stable whatever the engine.
+
+    Args:
+        lst (List[Any]): The list to sort.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element.
+        reverse (bool): If True the list is sorted in descending order.
+        stable (bool): Require equal elements to keep their order.
+
+    Returns:
+        SortDecision: The features seen and the algorithm used.
+    """
+    decisions: List[SortDecision] = []
+
+    def engine(values: List[Any]) -> None:
+        decisions.append(_dispatch(values, stable and key is None))
+
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, engine)
+    else:
+        engine(lst)
+    return decisions[0]
+
+def _dispatch(values: List[Any], stable: bool) -> SortDecision:
+    """Inspects `values`, sorts them in-place ascending and reports the decision."""
+    n = len(values)
+    if n <= SMALL_SIZE:
+        insertionSort(values)
+        return SortDecision("insertion", f"small input (N <= {SMALL_SIZE})", n, n)
+
+    decision = _inspect(values)
+    if decision.runs <= NEARLY_SORTED_RUNS:
+        if decision.disorder < 0.5 and n <= NEARLY_SORTED_INSERTION_SIZE:
+            decision.algorithm, decision.reason = "insertion", "nearly sorted, moderate size"
+            insertionSort(values)
+        else:
+            decision.algorithm, decision.reason = "merge", "nearly sorted"
+            mergeSort(values, inplace=True)
+        return decision
+
+    if decision.integer and _sortIntegers(values, decision):
+        return decision
+
+    if decision.runs * LONG_RUN <= n or stable:
+        decision.algorithm = "merge"
+        decision.reason = "stability requested" if stable else "long presorted runs"
+        mergeSort(values, inplace=True)
+        return decision
+
+    decision.algorithm = "quick"
+    decision.reason = ("many duplicates, three-way partitioning"
+                       if decision.distinct_ratio < 0.5 else "general input")
+    quickSort(values, 0, n - 1)
+    return decision
+
+def _sortIntegers(values: List[Any], decision: SortDecision) -> bool:
+    """Tries the non-comparison sorts on integer keys; False if none applies."""
+    n = decision.size
+    try:
+        low, high = min(values), max(values)
+        span = high - low
+    except TypeError:
+        decision.integer = False
+        return False
+    if not isinstance(span, int):
+        # The sample was all ints but the full input is not.
+        decision.integer = False
+        return False
+    decision.value_range = span
+
+    try:
+        if span <= COUNT_RANGE_FACTOR * n:
+            reason = "small value range"
+        elif decision.distinct_ratio <= FEW_UNIQUE_RATIO:
+            reason = "few distinct values"
+        elif np is not None and n >= NUMPY_CUTOFF and -2**63 <= low and high < 2**63:
+            reason = "64-bit integers, NumPy counting"
+        else:
+            reason = None
+
+        if reason is not None:
+            decision.algorithm, decision.reason = "count", reason
+            decision.strategy = countSort(values)
+            return True
+
+        # Radix needs ceil(bits / 8) linear passes against ~log2(N) for comparison sorts.
+        passes = -(-span.bit_length() // 8)
+        if 5 * passes < 4 * n.bit_length():
+            decision.algorithm = "radix"
+            decision.reason = f"integers needing {passes} radix passes"
+            radixSort(values)
+            return True
+    except (TypeError, ValueError):
+        # Non-integers further in: both sorts validate before writing anything.
+        decision.integer = False
+    return False
+
+def _inspect(values: List[Any]) -> SortDecision:
+    """Samples `values` and fills the features of a `SortDecision`."""
+    n = len(values)
+    if n <= SAMPLE_WINDOWS * SAMPLE_WINDOW:
+        windows = [values]
+    else:
+        step = (n - SAMPLE_WINDOW) // (SAMPLE_WINDOWS - 1)
+        windows = [values[start:start + SAMPLE_WINDOW] for start in range(0, step * SAMPLE_WINDOWS, step)]
+
+    sample = [x for window in windows for x in window]
+    descents = pairs = 0
+    for window in windows:
+        for i in range(1, len(window)):
+            descents += window[i] < window[i-1]
+        pairs += len(window) - 1
+    disorder = descents / pairs if pairs else 0.0
+    runs = 1 + round(min(disorder, 1.0 - disorder) * (n - 1))
+
+    # Short windows cannot see long ramps (e.g. a sawtooth), so before calling
+    # the input nearly sorted also check that a strided sample is monotone.
+    if runs <= NEARLY_SORTED_RUNS and n > len(sample):
+        stride = n // len(sample)
+        spread = values[::stride]
+        spread_descents = sum(spread[i] < spread[i-1] for i in range(1, len(spread)))
+        spread_disorder = spread_descents / (len(spread) - 1)
+        if min(spread_disorder, 1.0 - spread_disorder) * len(spread) > NEARLY_SORTED_RUNS:
+            runs = max(runs, round(min(spread_disorder, 1.0 - spread_disorder) * n))
+
+    try:
+        distinct = len(set(sample)) / len(sample)
+    except TypeError:
+        distinct = 1.0
+
+    return SortDecision(
+        algorithm="",
+        reason="",
+        size=n,
+        sample_size=len(sample),
+        disorder=disorder,
+        runs=runs,
+        distinct_ratio=distinct,
+        integer=all(type(x) is int for x in sample),
+    )
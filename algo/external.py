@@ -0,0 +1,217 @@
+from array import array
+from heapq import merge
+from itertools import islice
+import os
+import struct
+import sys
+import tempfile
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Union
+
+from .sort import mergeSort, quickSort
+
+# Default budget for the records held in memory while building a run.
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+# At most this many runs are merged at once; more runs are merged in several passes.
+MAX_FAN_IN = 64
+# Size of the reads/writes done on run files.
+IO_BUFFER_SIZE = 1 << 16
+
+RECORD_TYPES = ("int", "float", "bytes", "str")
+
+_LENGTH = struct.Struct("<I")
+_ARRAY_TYPECODES = {"int": "q", "float": "d"}
+# Tells an empty input apart from one whose first record is None.
+_EMPTY = object()
+
+def externalSort(source: Union[str, os.PathLike, Iterable[Any]],
+                 memory_limit: int = DEFAULT_MEMORY_LIMIT, *,
+                 record_type: Optional[str] = None,
+                 key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+                 algorithm: str = "merge", tmpdir: Optional[str] = None) -> Iterator[Any]:
+    """
+    Sorts more records than fit in memory (external merge sort).
+
+    Records are read from `source` into runs whose estimated in-memory size
+    stays below `memory_limit`. Each run is sorted with `mergeSort` (or
+    `quickSort`) and spilled to a temporary file in a compact binary format:
+    struct-packed 64-bit ints or doubles, or length-prefixed bytes / UTF-8
+    strings. The runs are then merged lazily with a k-way heap merge (in
+    several passes if there are more than `MAX_FAN_IN` of them).
+
+    Args:
+        source (Union[str, os.PathLike, Iterable[Any]]): An iterable of
+            records, or the path of a file written by `writeRecords`.
+        memory_limit (int): Approximate number of bytes of records kept in
+            memory per run.
+        record_type (Optional[str]): One of "int", "float", "bytes", "str".
+            Detected from the first record when omitted (required when
+            `source` is a path).
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each record.
+        reverse (bool): If True the records are yielded in descending order.
+        algorithm (str): "merge" (stable) or "quick" to sort the runs.
+        tmpdir (Optional[str]): Where to create the run files.
+
+    Yields:
+        Any: The records in sorted order.
+
+    Raises:
+        ValueError: If `record_type`, `algorithm` or `memory_limit` is invalid,
+            or `record_type` is missing for a path source.
+        TypeError: If a record does not match `record_type`.
+
+    Notes:
+        - Time Complexity: O(N * log(N)) comparisons, with about
+          log_{MAX_FAN_IN}(N / run size) + 1 passes over the data on disk.
+        - Space Complexity: O(memory_limit) in memory, O(N) on disk.
+        The temporary files are removed once the generator is exhausted or
+        closed.
+    """
+    if algorithm not in ("merge", "quick"):
+        raise ValueError(f"Unknown algorithm {algorithm!r}, expected 'merge' or 'quick'.")
+    if memory_limit <= 0:
+        raise ValueError("memory_limit must be positive.")
+
+    if isinstance(source, (str, os.PathLike)):
+        if record_type is None:
+            raise ValueError("record_type is required when sorting a file.")
+        records: Iterator[Any] = readRecords(source, record_type)
+    else:
+        records = iter(source)
+
+    if record_type is None:
+        first = next(records, _EMPTY)
+        if first is _EMPTY:
+            return
+        record_type = _detectRecordType(first)
+        records = _prepend(first, records)
+    elif record_type not in RECORD_TYPES:
+        raise ValueError(f"Unknown record_type {record_type!r}, expected one of {RECORD_TYPES}.")
+
+    with tempfile.TemporaryDirectory(prefix="dsa-external-", dir=tmpdir) as workdir:
+        runs: List[str] = []
+        for run in _runs(records, memory_limit):
+            if algorithm == "merge":
+                mergeSort(run, inplace=True, key=key, reverse=reverse)
+            else:
+                quickSort(run, 0, len(run) - 1, key=key, reverse=reverse)
+
+            path = os.path.join(workdir, f"run-{len(runs)}.bin")
+            writeRecords(path, run, record_type)
+            runs.append(path)
+            del run
+
+        # Merge passes until a single streaming merge is left.
+        while len(runs) > MAX_FAN_IN:
+            merged: List[str] = []
+            for start in range(0, len(runs), MAX_FAN_IN):
+                group = runs[start:start + MAX_FAN_IN]
+                path = os.path.join(workdir, f"merge-{len(runs)}-{start}.bin")
+                writeRecords(path, merge(*(readRecords(p, record_type) for p in group),
+                                         key=key, reverse=reverse), record_type)
+                for p in group:
+                    os.remove(p)
+                merged.append(path)
+            runs = merged
+
+        yield from merge(*(readRecords(p, record_type) for p in runs), key=key, reverse=reverse)
+
+def writeRecords(path: Union[str, os.PathLike], records: Iterable[Any], record_type: str) -> int:
+    """
+    Writes records to `path` in the binary format used by `externalSort`.
+
+    Ints and floats are packed as native 64-bit values; bytes and str (UTF-8)
+    records are each prefixed with their length as a 32-bit unsigned int.
+
+    Returns:
+        int: The number of records written.
+    """
+    if record_type not in RECORD_TYPES:
+        raise ValueError(f"Unknown record_type {record_type!r}, expected one of {RECORD_TYPES}.")
+
+    count = 0
+    with open(path, "wb", buffering=IO_BUFFER_SIZE) as file:
+        if record_type in _ARRAY_TYPECODES:
+            typecode = _ARRAY_TYPECODES[record_type]
+            records = iter(records)
+            while True:
+                batch = list(islice(records, IO_BUFFER_SIZE // 8))
+                if not batch:
+                    break
+                try:
+                    file.write(array(typecode, batch).tobytes())
+                except (TypeError, OverflowError) as error:
+                    raise TypeError(f"Records must be 64-bit {record_type}s.") from error
+                count += len(batch)
+        else:
+            encode = record_type == "str"
+            pack = _LENGTH.pack
+            for record in records:
+                if encode:
+                    if not isinstance(record, str):
+                        raise TypeError("Records must be str.")
+                    record = record.encode("utf-8")
+                elif not isinstance(record, (bytes, bytearray)):
+                    raise TypeError("Records must be bytes.")
+                file.write(pack(len(record)))
+                file.write(record)
+                count += 1
+
+    return count
+
+def readRecords(path: Union[str, os.PathLike], record_type: str) -> Iterator[Any]:
+    """Streams the records of a file written by `writeRecords`."""
+    if record_type not in RECORD_TYPES:
+        raise ValueError(f"Unknown record_type {record_type!r}, expected one of {RECORD_TYPES}.")
+
+    with open(path, "rb", buffering=IO_BUFFER_SIZE) as file:
+        if record_type in _ARRAY_TYPECODES:
+            typecode = _ARRAY_TYPECODES[record_type]
+            while True:
+                chunk = file.read(IO_BUFFER_SIZE)
+                if not chunk:
+                    break
+                values = array(typecode)
+                values.frombytes(chunk)
+                yield from values
+        else:
+            yield from _readLengthPrefixed(file, record_type == "str")
+
+def _readLengthPrefixed(file: BinaryIO, decode: bool) -> Iterator[Any]:
+    read, unpack, size = file.read, _LENGTH.unpack, _LENGTH.size
+    while True:
+        header = read(size)
+        if not header:
+            return
+        record = read(unpack(header)[0])
+        yield record.decode("utf-8") if decode else record
+
+def _runs(records: Iterator[Any], memory_limit: int) -> Iterator[List[Any]]:
+    """Cuts `records` into lists whose estimated size stays under `memory_limit`."""
+    getsizeof = sys.getsizeof
+    # Each record costs its own size plus a list slot, twice during keyed sorts.
+    slot = 2 * 8
+    run: List[Any] = []
+    used = 0
+    for record in records:
+        run.append(record)
+        used += getsizeof(record) + slot
+        if used >= memory_limit:
+            yield run
+            run, used = [], 0
+
+    if run:
+        yield run
+
+def _detectRecordType(record: Any) -> str:
+    if isinstance(record, bool) or not isinstance(record, (int, float, bytes, bytearray, str)):
+        raise TypeError(f"Cannot store records of type {type(record).__name__}.")
+    if isinstance(record, int):
+        return "int"
+    if isinstance(record, float):
+        return "float"
+    return "str" if isinstance(record, str) else "bytes"
+
+def _prepend(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
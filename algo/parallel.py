@@ -0,0 +1,155 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from itertools import repeat
+from multiprocessing import shared_memory
+import os
+from typing import List, Any, Callable, Dict, Optional
+
+from .sort import (
+    _mergeSortInPlace,
+    _quickSortAll,
+    binaryInsertionSort,
+    bubbleSort,
+    cocktailSort,
+    countSort,
+    insertionSort,
+    radixSort,
+    selectionSort,
+    shellSort,
+)
+
+# Inputs shorter than this are sorted serially, the process pool start-up and
+# the transfer of the chunks cost more than they save below it.
+# Re-tune with `python -m benchmarks.bench_parallel`.
+PARALLEL_THRESHOLD = 200_000
+
+# The algorithms parallelSort can run on each chunk, all sorting a list in-place.
+ALGORITHMS: Dict[str, Callable[[List[Any]], Any]] = {
+    "merge": _mergeSortInPlace,
+    "quick": _quickSortAll,
+    "insertion": insertionSort,
+    "bubble": bubbleSort,
+    "selection": selectionSort,
+    "binaryInsertion": binaryInsertionSort,
+    "shell": shellSort,
+    "cocktail": cocktailSort,
+    "count": countSort,
+    "radix": radixSort,
+}
+
+def parallelSort(lst: List[Any], workers: Optional[int] = None, algorithm: str = "merge",
+                 threshold: int = PARALLEL_THRESHOLD) -> List[Any]:
+    """
+    Sorts a list on several cores. This is not an in-place sort.
+
+    The input is split into one chunk per worker, every chunk is sorted in a
+    `ProcessPoolExecutor` with one of the algorithms from `algo.sort` and the
+    sorted chunks are combined with a heap-based k-way merge. Lists made only
+    of ints fitting in 64 bits or only of floats are shipped to the workers
+    through `multiprocessing.shared_memory` instead of being pickled.
+
+    Args:
+        lst (List[Any]): A list of elements to be sorted.
+        workers (Optional[int]): Number of worker processes, defaults to the
+            number of CPUs.
+        algorithm (str): The per-chunk algorithm, one of the `ALGORITHMS`
+            keys ("merge", "quick", "insertion", "bubble", "selection",
+            "binaryInsertion", "shell", "cocktail", "count", "radix").
+        threshold (int): Inputs shorter than this are sorted serially.
+
+    Returns:
+        List[Any]: A new list containing the sorted elements.
+
+    Raises:
+        ValueError: If `algorithm` is unknown or `workers` is not positive.
+
+    Notes:
+        With P workers the time complexity is that of the chosen algorithm on
+        N/P elements plus O(N * log(P)) for the merge. Stability holds for
+        stable algorithms, as the merge prefers earlier chunks on ties.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {sorted(ALGORITHMS)}.")
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    if workers == 1 or len(lst) < max(threshold, 2 * workers):
+        result = lst[:]
+        ALGORITHMS[algorithm](result)
+        return result
+
+    step = -(-len(lst) // workers)
+    bounds = [(start, min(start + step, len(lst))) for start in range(0, len(lst), step)]
+
+    packed = _packPrimitive(lst)
+    with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+        if packed is None:
+            chunks = list(executor.map(_sortChunk, (lst[start:stop] for start, stop in bounds),
+                                       repeat(algorithm)))
+            return list(merge(*chunks))
+
+        typecode, nbytes = packed.typecode, len(packed) * packed.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        try:
+            shm.buf[:nbytes] = memoryview(packed).cast("B")
+            del packed
+
+            jobs = [executor.submit(_sortSharedChunk, shm.name, typecode, start, stop, algorithm)
+                    for start, stop in bounds]
+            for job in jobs:
+                job.result()
+
+            view = shm.buf[:nbytes].cast(typecode)
+            try:
+                chunks = [view[start:stop].tolist() for start, stop in bounds]
+            finally:
+                view.release()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    return list(merge(*chunks))
+
+def _typecodeOf(lst: List[Any]) -> str:
+    """The `array` typecode used to share a list of ints ("q") or floats ("d")."""
+    return "q" if type(lst[0]) is int else "d"
+
+def _packPrimitive(lst: List[Any]) -> Optional[array]:
+    """
+    Packs `lst` into an `array.array` if it holds only 64-bit ints or only
+    floats, returns None otherwise (the chunks are pickled then).
+    """
+    if not lst:
+        return None
+
+    first = type(lst[0])
+    if first not in (int, float) or not all(type(x) is first for x in lst):
+        return None
+
+    try:
+        return array(_typecodeOf(lst), lst)
+    except OverflowError:
+        return None
+
+def _sortChunk(chunk: List[Any], algorithm: str) -> List[Any]:
+    """Worker: sorts a pickled chunk and sends it back."""
+    ALGORITHMS[algorithm](chunk)
+    return chunk
+
+def _sortSharedChunk(name: str, typecode: str, start: int, stop: int, algorithm: str) -> None:
+    """Worker: sorts view[start:stop] of the shared memory block `name` in place."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # The block may be rounded up to whole pages, only view what is used.
+        view = shm.buf[:stop * array(typecode).itemsize].cast(typecode)
+        try:
+            chunk = view[start:stop].tolist()
+            ALGORITHMS[algorithm](chunk)
+            view[start:stop] = array(typecode, chunk)
+        finally:
+            view.release()
+    finally:
+        shm.close()
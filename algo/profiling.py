@@ -0,0 +1,179 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from . import selection, sort
+
+@dataclass
+class SortStats:
+    """
+    Work done by one profiled sort.
+
+    Attributes:
+        comparisons (int): Element (or key) comparisons.
+        moves (int): Element writes into the list and into auxiliary buffers;
+            a swap counts as two moves.
+        max_depth (int): Deepest recursion of the recursive helpers
+            (0 for the iterative sorts).
+        allocations (int): Auxiliary buffers allocated.
+        allocated_slots (int): Total number of slots in those buffers.
+    """
+    comparisons: int = 0
+    moves: int = 0
+    max_depth: int = 0
+    allocations: int = 0
+    allocated_slots: int = 0
+
+# The functions whose recursion depth is tracked, per module.
+_RECURSIVE = ("_introSort", "_introSelect")
+# Sorts that need the raw integers, so their elements are not wrapped.
+_NON_COMPARISON = (sort.countSort, sort.radixSort)
+
+_active: Optional[SortStats] = None
+
+def profileSort(sorter: Callable[..., Any], lst: List[Any], *args: Any,
+                **kwargs: Any) -> Tuple[Any, SortStats]:
+    """
+    Runs `sorter(lst, *args, **kwargs)` with instrumentation and returns its
+    result together with the counted work.
+
+    Nothing in the sort functions themselves checks for profiling: the
+    elements are temporarily wrapped in objects that count comparisons, the
+    list in a list subclass that counts writes, and the recursive helpers and
+    the auxiliary buffer allocator of `algo.sort` are swapped for counting
+    versions while the call runs. The default code path therefore pays
+    nothing, while profiled runs are several times slower than plain ones.
+
+    Args:
+        sorter (Callable[..., Any]): Any sort function, e.g. `mergeSort`.
+        lst (List[Any]): The list to sort; it ends up exactly as after a
+            plain call.
+        *args, **kwargs: Passed on to `sorter` (a `key` function sees the
+            original elements).
+
+    Returns:
+        Tuple[Any, SortStats]: What `sorter` returned (lists unwrapped) and
+        the statistics.
+
+    Notes:
+        Not thread-safe: profiling patches module globals for the duration
+        of the call.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("profileSort calls cannot be nested.")
+
+    stats = SortStats()
+    wrap = sorter not in _NON_COMPARISON
+    probes = _ProbeList(map(_Probe, lst) if wrap else lst)
+
+    key = kwargs.get("key")
+    if key is not None:
+        kwargs["key"] = (lambda probe: _Probe(key(probe.value))) if wrap else key
+
+    _active = stats
+    try:
+        with _patched(stats):
+            result = sorter(probes, *args, **kwargs)
+    finally:
+        _active = None
+
+    lst[:] = _unwrap(probes) if wrap else probes
+    if isinstance(result, list):
+        result = lst if result is probes else (_unwrap(result) if wrap else list(result))
+    elif isinstance(result, _Probe):
+        result = result.value
+    return result, stats
+
+def _unwrap(values: List[Any]) -> List[Any]:
+    return [value.value if isinstance(value, _Probe) else value for value in values]
+
+@contextmanager
+def _patched(stats: SortStats) -> Iterator[None]:
+    """Swaps in depth-tracking recursive helpers and a counting buffer allocator."""
+    saved = []
+    for module in (sort, selection):
+        for name in _RECURSIVE:
+            if hasattr(module, name):
+                saved.append((module, name, getattr(module, name)))
+                setattr(module, name, _trackDepth(getattr(module, name), stats))
+    saved.append((sort, "_newBuffer", sort._newBuffer))
+    saved.append((sort, "_newKeyList", sort._newKeyList))
+
+    def newBuffer(size: int) -> List[Any]:
+        stats.allocations += 1
+        stats.allocated_slots += size
+        return _ProbeList([None] * size)
+
+    def newKeyList(keys: Iterable[Any]) -> List[Any]:
+        keys = _ProbeList(keys)
+        stats.allocations += 1
+        stats.allocated_slots += len(keys)
+        return keys
+
+    sort._newBuffer = newBuffer
+    sort._newKeyList = newKeyList
+    try:
+        yield
+    finally:
+        for module, name, original in saved:
+            setattr(module, name, original)
+
+def _trackDepth(function: Callable[..., Any], stats: SortStats) -> Callable[..., Any]:
+    depth = 0
+
+    def tracked(*args: Any) -> Any:
+        nonlocal depth
+        depth += 1
+        stats.max_depth = max(stats.max_depth, depth)
+        try:
+            return function(*args)
+        finally:
+            depth -= 1
+    return tracked
+
+class _Probe:
+    """Wraps an element and counts the comparisons made on it."""
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Probe") -> bool:
+        _active.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other: "_Probe") -> bool:
+        _active.comparisons += 1
+        return self.value > other.value
+
+    def __le__(self, other: "_Probe") -> bool:
+        _active.comparisons += 1
+        return self.value <= other.value
+
+    def __ge__(self, other: "_Probe") -> bool:
+        _active.comparisons += 1
+        return self.value >= other.value
+
+    # Equality and hashing are used to group keys, not to order them.
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Probe) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+class _ProbeList(list):
+    """A list that counts element writes; slices of it stay counted."""
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            _active.moves += len(value)
+        else:
+            _active.moves += 1
+        super().__setitem__(index, value)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return _ProbeList(super().__getitem__(index))
+        return super().__getitem__(index)
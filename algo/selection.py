@@ -0,0 +1,175 @@
+from heapq import heappush, heapreplace
+from typing import List, Any, Callable, Iterable, Optional
+
+from .sort import (
+    INSERTION_CUTOFF,
+    _choosePivot,
+    _insertionSortRange,
+    _introSort,
+    _partition3,
+    _sortByKey,
+    mergeSort,
+)
+
+def nthElement(lst: List[Any], k: int, *, key: Optional[Callable[[Any], Any]] = None,
+               reverse: bool = False) -> Any:
+    """
+    Rearranges a list in-place so that lst[k] holds the element that would be
+    there if the list were sorted, everything before it is not greater and
+    everything after it is not smaller (like C++'s std::nth_element).
+
+    Uses quickselect on the pivot selection and three-way partitioning of
+    `quickSort`; if the partitions keep coming out lopsided it switches to
+    median-of-medians pivots (introselect), which bounds the worst case.
+
+    Args:
+        lst (List[Any]): The list to rearrange.
+        k (int): The index to place; negative indices count from the end.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): Select as if the list were sorted in descending order.
+
+    Returns:
+        Any: The element now at index k.
+
+    Raises:
+        IndexError: If k is out of range.
+
+    Notes:
+        The time complexity is O(N) on average and in the worst case.
+    """
+    k = _checkIndex(lst, k)
+
+    def select(values: List[Any]) -> None:
+        target = len(values) - 1 - k if reverse else k
+        _introSelect(values, 0, len(values) - 1, target, 2 * len(values).bit_length())
+
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, select)
+    else:
+        select(lst)
+    return lst[k]
+
+def partialSort(lst: List[Any], k: int, *, key: Optional[Callable[[Any], Any]] = None,
+                reverse: bool = False) -> None:
+    """
+    Rearranges a list in-place so that lst[:k] holds its k smallest elements
+    in sorted order; the order of the remaining elements is unspecified.
+
+    The k smallest elements are first gathered with the selection of
+    `nthElement`, then only those are sorted with `quickSort`'s introsort.
+
+    Args:
+        lst (List[Any]): The list to rearrange.
+        k (int): How many leading elements to sort (clamped to [0, len(lst)]).
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): Gather and sort the k largest elements, descending.
+
+    Notes:
+        The time complexity is O(N + k * log(k)).
+    """
+    k = max(0, min(k, len(lst)))
+    if k == 0:
+        return
+
+    def gather(values: List[Any]) -> None:
+        n = len(values)
+        depth = 2 * n.bit_length()
+        # Ascending: lst[:k] are the k smallest. Reverse: build lst[n-k:] ascending,
+        # `_sortByKey` then flips the whole list.
+        low, high = (n - k, n - 1) if reverse else (0, k - 1)
+        if k < n:
+            _introSelect(values, 0, n - 1, low if reverse else high, depth)
+        _introSort(values, low, high, depth)
+
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, gather)
+    else:
+        gather(lst)
+
+def topK(iterable: Iterable[Any], k: int, key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    Returns the k largest items of an iterable, largest first.
+
+    Streams the input once while keeping a bounded min-heap of the best k
+    items seen so far, so the input may be a generator of any length.
+
+    Args:
+        iterable (Iterable[Any]): The items to scan.
+        k (int): How many items to keep.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each item. Every key is computed exactly once.
+
+    Returns:
+        List[Any]: Up to k items in descending order; among equal keys the
+        earlier items come first (and win a place in the top k).
+
+    Notes:
+        - Time Complexity: O(N * log(k)).
+        - Space Complexity: O(k).
+    """
+    if k <= 0:
+        return []
+
+    # Entries are (key, -index, item): the index breaks ties without ever
+    # comparing items, and makes later duplicates the first to be evicted.
+    heap: List[Any] = []
+    for index, item in enumerate(iterable):
+        value = item if key is None else key(item)
+        if len(heap) < k:
+            heappush(heap, (value, -index, item))
+        elif heap[0][0] < value:
+            heapreplace(heap, (value, -index, item))
+
+    mergeSort(heap, inplace=True, reverse=True)
+    return [item for _, _, item in heap]
+
+def _introSelect(lst: List[Any], low: int, high: int, k: int, depth: int) -> None:
+    """
+    Introselect on lst[low..high] (inclusive) for index k.
+
+    Uses `quickSort`'s pivot choice until `depth` runs out, then
+    median-of-medians pivots.
+    """
+    while high - low >= INSERTION_CUTOFF:
+        if depth == 0:
+            pivot = _medianOfMedians(lst, low, high)
+        else:
+            depth -= 1
+            pivot = lst[_choosePivot(lst, low, high)]
+
+        lt, gt = _partition3(lst, low, high, pivot)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return
+
+    _insertionSortRange(lst, low, high)
+
+def _medianOfMedians(lst: List[Any], low: int, high: int) -> Any:
+    """
+    Returns a pivot value for lst[low..high] that is guaranteed to have about
+    30% of the slice on either side (BFPRT). Moves elements around.
+    """
+    store = low
+    for group in range(low, high + 1, 5):
+        group_end = min(group + 4, high)
+        _insertionSortRange(lst, group, group_end)
+        middle = (group + group_end) // 2
+        lst[store], lst[middle] = lst[middle], lst[store]
+        store += 1
+
+    # The group medians now sit in lst[low..store-1]; select their median.
+    middle = (low + store - 1) // 2
+    _introSelect(lst, low, store - 1, middle, 0)
+    return lst[middle]
+
+def _checkIndex(lst: List[Any], k: int) -> int:
+    if k < 0:
+        k += len(lst)
+    if not 0 <= k < len(lst):
+        raise IndexError("Index out of range")
+    return k
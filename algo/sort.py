@@ -1,16 +1,44 @@
-from typing import List, Any
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import chain
+from typing import List, Any, Callable, Dict, Iterable, Iterator, MutableSequence, Optional, Tuple
 
-def insertionSort(lst: List[Any]) -> None:
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python paths are used without it.
+    np = None
+
+# Slices shorter than this are finished off with insertion sort by quickSort.
+INSERTION_CUTOFF = 16
+# Slices at least this long use the ninther instead of median-of-three.
+NINTHER_CUTOFF = 128
+# Natural runs shorter than this are extended with insertion sort by mergeSort.
+MIN_RUN = 32
+# With backend="auto", lists at least this long are handed to NumPy when it is installed.
+NUMPY_CUTOFF = 1024
+# countSort switches to a sparse histogram once the value range exceeds this many times N.
+SPARSE_FACTOR = 8
+
+def insertionSort(lst: List[Any], *, key: Optional[Callable[[Any], Any]] = None,
+                  reverse: bool = False) -> None:
     """
     Sorts a list in-place using the insertion sort algorithm.
 
     Args:
         lst (List[Any]): A list of elements to be sorted.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
 
     Notes:
         The time complexity is O(N^2) for average/worst cases and O(N)
         for the best case (already sorted list).
     """
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, insertionSort)
+        return
+
     for i in range(1, len(lst)):
         element, j = lst[i], i - 1
 
@@ -20,17 +48,25 @@ def insertionSort(lst: List[Any]) -> None:
         
         lst[j+1] = element
 
-def bubbleSort(lst: List[Any]) -> None:
+def bubbleSort(lst: List[Any], *, key: Optional[Callable[[Any], Any]] = None,
+               reverse: bool = False) -> None:
     """
     Sorts a list in-place using the bubble sort algorithm.
 
     Args:
         lst (List[Any]): A list of elements to be sorted.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
 
     Notes:
         The time complexity is O(N^2) for average/worst cases and O(N)
         for the best case (already sorted list) due to the swap check.
     """
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, bubbleSort)
+        return
+
     for amount_shifts in range(len(lst)):
         swapped = False
         for i in range(len(lst) - 1):
@@ -40,17 +76,25 @@ def bubbleSort(lst: List[Any]) -> None:
         if not swapped:
             break
 
-def selectionSort(lst: List[Any]) -> None:
+def selectionSort(lst: List[Any], *, key: Optional[Callable[[Any], Any]] = None,
+                  reverse: bool = False) -> None:
     """
     Sorts a list in-place using the selection sort algorithm.
 
     Args:
         lst (List[Any]): A list of elements to be sorted.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
 
     Notes:
         The time complexity is O(N^2) in all cases (average, worst, and best)
         because it always performs the same number of comparisons.
     """
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, selectionSort)
+        return
+
     for i in range(len(lst)):
         min_idx = i
         for j in range(i+1, len(lst)):
@@ -59,114 +103,485 @@ def selectionSort(lst: List[Any]) -> None:
         
         (lst[i], lst[min_idx]) = (lst[min_idx], lst[i])
     
-def mergeSort(lst: List[Any]) -> List[Any]:
+def binaryInsertionSort(lst: List[Any], *, key: Optional[Callable[[Any], Any]] = None,
+                        reverse: bool = False) -> None:
+    """
+    Sorts a list in-place using insertion sort with a binary search for the
+    insertion point.
+
+    The insertion point is found with `bisect` and the elements after it are
+    shifted in one slice assignment (a C-level memmove) instead of one by
+    one, which makes this the fastest of the quadratic sorts on the small
+    buffers (up to ~64 elements) it is meant for.
+
+    Args:
+        lst (List[Any]): A list of elements to be sorted.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
+
+    Notes:
+        O(N * log(N)) comparisons and O(N^2) element moves in the worst case,
+        O(N) for an already sorted list. The sort is stable.
+    """
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, binaryInsertionSort)
+        return
+
+    for i in range(1, len(lst)):
+        element = lst[i]
+        if not element < lst[i-1]:
+            continue
+
+        position = bisect_right(lst, element, 0, i)
+        lst[position+1:i+1] = lst[position:i]
+        lst[position] = element
+
+def shellSort(lst: List[Any], gaps: str = "ciura", *, key: Optional[Callable[[Any], Any]] = None,
+              reverse: bool = False) -> None:
+    """
+    Sorts a list in-place using Shell sort (gapped insertion sort).
+
+    Args:
+        lst (List[Any]): A list of elements to be sorted.
+        gaps (str): The gap sequence, "ciura" (1, 4, 10, 23, 57, 132, 301,
+            701, 1750, then x2.25) or "tokuda" (ceil((9^k - 4^k) / (5 * 4^(k-1)))).
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
+
+    Raises:
+        ValueError: If `gaps` is not a known sequence.
+
+    Notes:
+        No proven bound is known for these sequences, empirically they
+        behave like O(N^(4/3)). The sort is not stable (unless a key is given).
+    """
+    if gaps not in _GAP_SEQUENCES:
+        raise ValueError(f"Unknown gap sequence {gaps!r}, expected one of {sorted(_GAP_SEQUENCES)}.")
+
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, lambda keys: shellSort(keys, gaps))
+        return
+
+    n = len(lst)
+    for gap in reversed(_shellGaps(n, gaps)):
+        for i in range(gap, n):
+            element, j = lst[i], i - gap
+
+            while j >= 0 and lst[j] > element:
+                lst[j+gap] = lst[j]
+                j -= gap
+
+            lst[j+gap] = element
+
+def _ciuraGaps(n: int) -> List[int]:
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return gaps
+
+def _tokudaGaps(n: int) -> List[int]:
+    gaps, k = [1], 2
+    while gaps[-1] < n:
+        gaps.append(-(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1))))
+        k += 1
+    return gaps
+
+_GAP_SEQUENCES: Dict[str, Callable[[int], List[int]]] = {
+    "ciura": _ciuraGaps,
+    "tokuda": _tokudaGaps,
+}
+
+def _shellGaps(n: int, sequence: str) -> List[int]:
+    """The gaps of `sequence` smaller than n, ascending (always starting with 1)."""
+    return [gap for gap in _GAP_SEQUENCES[sequence](n) if gap < n] or [1]
+
+def cocktailSort(lst: List[Any], *, key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False) -> None:
+    """
+    Sorts a list in-place using cocktail shaker sort, a bidirectional bubble sort.
+
+    Passes alternate left-to-right and right-to-left, and each pass shrinks
+    the range to the position of its last swap: everything beyond it is
+    already in place, so partially sorted tails and heads are never scanned
+    again.
+
+    Args:
+        lst (List[Any]): A list of elements to be sorted.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
+
+    Notes:
+        The time complexity is O(N^2) for average/worst cases and O(N)
+        for the best case (already sorted list). The sort is stable.
     """
-    Sorts a list using the merge sort algorithm. This is not an in-place sort.
+    if key is not None or reverse:
+        _sortByKey(lst, key, reverse, cocktailSort)
+        return
+
+    low, high = 0, len(lst) - 1
+    while low < high:
+        last_swap = low
+        for i in range(low, high):
+            if lst[i+1] < lst[i]:
+                lst[i], lst[i+1] = lst[i+1], lst[i]
+                last_swap = i
+        high = last_swap
+
+        last_swap = high
+        for i in range(high, low, -1):
+            if lst[i] < lst[i-1]:
+                lst[i-1], lst[i] = lst[i], lst[i-1]
+                last_swap = i
+        low = last_swap
+
+def mergeSort(lst: List[Any], inplace: bool = False, *,
+              key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> List[Any]:
+    """
+    Sorts a list using a bottom-up (iterative) natural merge sort.
+
+    The input is first cut into its existing ascending and descending runs,
+    TimSort-style (descending runs are reversed, short runs are extended to
+    `MIN_RUN` with insertion sort). Neighbouring runs are then merged pass by
+    pass, ping-ponging between the working list and a single auxiliary buffer
+    that is allocated once.
 
     Args:
         lst (List[Any]): A list of elements to be sorted.
+        inplace (bool): If True the result is written back into `lst`,
+            otherwise `lst` is left untouched.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
 
     Returns:
-        List[Any]: A new list containing the sorted elements.
+        List[Any]: The sorted list (`lst` itself when `inplace` is True,
+        a new list otherwise).
 
     Notes:
-        The time complexity is O(N * log(N)) in all cases.
-        The space complexity is O(N) due to the need for temporary lists.
+        The time complexity is O(N * log(R)) where R is the number of natural
+        runs, so nearly sorted input costs close to O(N) and the worst case
+        is O(N * log(N)). The sort is stable. The extra space is a single
+        O(N) buffer (plus the copy of the input when not in-place).
     """
+    work = lst if inplace else lst[:]
+    if key is not None or reverse:
+        _sortByKey(work, key, reverse, _mergeSortInPlace)
+        return work
+    if len(work) < 2:
+        return work
 
-    if len(lst) < 2:
-        return lst[:]
-    
-    middle = len(lst) // 2
-    left  = mergeSort(lst[:middle])
-    right = mergeSort(lst[middle:])
-
-    i, j = 0, 0
-    merged = []
-    while i < len(left) and j < len(right):
-        if left[i] < right[j]:
-            merged.append(left[i])
-            i+=1
+    bounds = _collectRuns(work)
+    if len(bounds) == 2:
+        return work
+
+    buffer = _newBuffer(len(work))
+    source, target = work, buffer
+    while len(bounds) > 2:
+        merged = [0]
+        for k in range(0, len(bounds) - 1, 2):
+            low = bounds[k]
+            if k + 2 < len(bounds):
+                high = bounds[k+2]
+                _mergeRuns(source, target, low, bounds[k+1], high)
+            else:
+                # Odd run out: carry it over to the next pass as is.
+                high = bounds[k+1]
+                target[low:high] = source[low:high]
+            merged.append(high)
+
+        bounds = merged
+        source, target = target, source
+
+    if source is not work:
+        work[:] = source
+    return work
+
+def _newBuffer(size: int) -> List[Any]:
+    """Allocates an auxiliary buffer (a seam for `algo.profiling` to count allocations)."""
+    return [None] * size
+
+def _mergeSortInPlace(lst: List[Any]) -> None:
+    mergeSort(lst, inplace=True)
+
+def _collectRuns(lst: List[Any]) -> List[int]:
+    """
+    Splits `lst` into sorted runs in-place and returns their boundaries.
+
+    Strictly descending runs are reversed (strictness keeps the sort stable)
+    and runs shorter than `MIN_RUN` are extended with insertion sort.
+
+    Returns:
+        List[int]: Run boundaries [0, b1, b2, ..., len(lst)].
+    """
+    n = len(lst)
+    bounds = [0]
+    low = 0
+    while low < n:
+        high = low + 1
+        if high < n and lst[high] < lst[low]:
+            while high < n and lst[high] < lst[high-1]:
+                high += 1
+            lst[low:high] = lst[low:high][::-1]
         else:
-            merged.append(right[j])
-            j+=1
-    
-    while i < len(left):
-        merged.append(left[i])
-        i+=1
-    
-    while j < len(right):
-        merged.append(right[j])
-        j+=1
-    
-    return merged
+            while high < n and not lst[high] < lst[high-1]:
+                high += 1
+
+        if high - low < MIN_RUN and high < n:
+            high = min(n, low + MIN_RUN)
+            _insertionSortRange(lst, low, high - 1)
 
-def quickSort(lst: List[Any], start: int, end: int) -> None:
+        bounds.append(high)
+        low = high
+
+    return bounds
+
+def _mergeRuns(source: List[Any], target: List[Any], low: int, middle: int, high: int) -> None:
+    """
+    Stably merges the sorted runs source[low:middle] and source[middle:high]
+    into target[low:high].
+    """
+    if not source[middle] < source[middle-1]:
+        # The runs are already in order relative to each other.
+        target[low:high] = source[low:high]
+        return
+
+    i, j, k = low, middle, low
+    left, right = source[i], source[j]
+    while True:
+        if right < left:
+            target[k] = right
+            k += 1
+            j += 1
+            if j == high:
+                break
+            right = source[j]
+        else:
+            target[k] = left
+            k += 1
+            i += 1
+            if i == middle:
+                break
+            left = source[i]
+
+    target[k:k + middle - i] = source[i:middle]
+    k += middle - i
+    target[k:high] = source[j:high]
+
+def quickSort(lst: List[Any], start: int, end: int, *,
+              key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
     """
-    Sorts a portion of a list in-place using the quick sort algorithm.
+    Sorts a portion of a list in-place using an introsort flavoured quick sort.
+
+    Pivots are picked with median-of-three (ninther for larger slices), the
+    slice is split three ways so runs of duplicates are skipped, short slices
+    are finished with insertion sort and a heap sort takes over once the
+    recursion gets deeper than 2*log2(N).
 
     Args:
         lst (List[Any]): The list of elements to be sorted.
         start (int): The starting index of the portion to sort.
         end (int): The ending index of the portion to sort.
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each element. Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
 
     Notes:
-        The time complexity is O(N * log(N)) on average and O(N^2) in the
-        worst case (e.g., an already sorted list with a bad pivot choice).
+        The time complexity is O(N * log(N)) in all cases thanks to the heap
+        sort fallback. Only the smaller side of each partition is recursed on,
+        so the stack depth stays within O(log(N)).
     """
+    if start >= end:
+        return
 
-    def partition(lst: List[Any], low: int, high: int) -> int:
-        """
-        Partitions the list using the Lomuto partition scheme.
-        
-        It rearranges elements such that elements smaller than the pivot
-        are on its left, and elements greater are on its right.
+    if key is not None or reverse:
+        portion = lst[start:end+1]
+        _sortByKey(portion, key, reverse, _quickSortAll)
+        lst[start:end+1] = portion
+        return
 
-        Args:
-            sub_lst (List[Any]): The list being partitioned.
-            low (int): The starting index of the partition.
-            high (int): The ending index (and pivot element index).
+    _introSort(lst, start, end, 2 * (end - start + 1).bit_length())
 
-        Returns:
-            int: The final index of the pivot element.
-        """
-        pivot = lst[high]
-        pivotIdx = low - 1
+def _quickSortAll(lst: List[Any]) -> None:
+    quickSort(lst, 0, len(lst) - 1)
 
-        for i in range(low, high):
-            if lst[i] <= pivot:
-                pivotIdx+=1
-                lst[i], lst[pivotIdx] = lst[pivotIdx], lst[i]
-        
-        lst[pivotIdx], lst[high] = lst[high], lst[pivotIdx]
-        return pivotIdx
+def _introSort(lst: List[Any], low: int, high: int, depth: int) -> None:
+    """
+    Introsort driver for lst[low..high] (inclusive) used by `quickSort`.
 
-    if start >= end:
-        return
-    
-    pivot = partition(lst, start, end)
-    quickSort(lst, start, pivot-1)
-    quickSort(lst, pivot+1, end)
+    Recurses into the smaller partition and loops on the larger one, falling
+    back to heap sort when `depth` runs out.
+    """
+    while high - low >= INSERTION_CUTOFF:
+        if depth == 0:
+            _heapSortRange(lst, low, high)
+            return
+        depth -= 1
+
+        pivot = lst[_choosePivot(lst, low, high)]
+        lt, gt = _partition3(lst, low, high, pivot)
+
+        if lt - low < high - gt:
+            _introSort(lst, low, lt - 1, depth)
+            low = gt + 1
+        else:
+            _introSort(lst, gt + 1, high, depth)
+            high = lt - 1
 
-def countSort(lst: List[Any], MAX_NUM: int) -> None:
+    _insertionSortRange(lst, low, high)
+
+def _partition3(lst: List[Any], low: int, high: int, pivot: Any) -> Tuple[int, int]:
+    """
+    Partitions lst[low..high] around `pivot` (Dutch national flag scheme).
+
+    Afterwards lst[low..lt-1] < pivot, lst[lt..gt] == pivot and
+    lst[gt+1..high] > pivot.
+
+    Returns:
+        Tuple[int, int]: The bounds (lt, gt) of the block equal to the pivot.
+    """
+    lt, i, gt = low, low, high
+    while i <= gt:
+        element = lst[i]
+        if element < pivot:
+            lst[lt], lst[i] = element, lst[lt]
+            lt += 1
+            i += 1
+        elif pivot < element:
+            lst[i], lst[gt] = lst[gt], element
+            gt -= 1
+        else:
+            i += 1
+
+    return lt, gt
+
+def _medianOfThree(lst: List[Any], a: int, b: int, c: int) -> int:
+    """Returns whichever of the indices a, b, c holds the median value."""
+    x, y, z = lst[a], lst[b], lst[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+def _choosePivot(lst: List[Any], low: int, high: int) -> int:
+    """
+    Picks a pivot index for lst[low..high]: median-of-three for short slices
+    and Tukey's ninther (median of three medians) for long ones.
+    """
+    middle = (low + high) // 2
+    if high - low < NINTHER_CUTOFF:
+        return _medianOfThree(lst, low, middle, high)
+
+    step = (high - low + 1) // 8
+    return _medianOfThree(
+        lst,
+        _medianOfThree(lst, low, low + step, low + 2 * step),
+        _medianOfThree(lst, middle - step, middle, middle + step),
+        _medianOfThree(lst, high - 2 * step, high - step, high),
+    )
+
+def _insertionSortRange(lst: List[Any], low: int, high: int) -> None:
+    """Insertion sort restricted to lst[low..high] (inclusive)."""
+    for i in range(low + 1, high + 1):
+        element, j = lst[i], i - 1
+
+        while j >= low and lst[j] > element:
+            lst[j+1] = lst[j]
+            j -= 1
+
+        lst[j+1] = element
+
+def _siftDown(lst: List[Any], offset: int, root: int, size: int) -> None:
+    """Restores the max-heap property below `root` for a heap stored at lst[offset:offset+size]."""
+    element = lst[offset + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and lst[offset + child] < lst[offset + child + 1]:
+            child += 1
+        if not element < lst[offset + child]:
+            break
+        lst[offset + root] = lst[offset + child]
+        root = child
+
+    lst[offset + root] = element
+
+def _heapSortRange(lst: List[Any], low: int, high: int) -> None:
+    """Heap sort restricted to lst[low..high] (inclusive)."""
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _siftDown(lst, low, root, size)
+
+    for last in range(size - 1, 0, -1):
+        lst[low], lst[low + last] = lst[low + last], lst[low]
+        _siftDown(lst, low, 0, last)
+
+def countSort(lst: List[Any], MAX_NUM: Optional[int] = None, *,
+              key: Optional[Callable[[Any], int]] = None, reverse: bool = False,
+              backend: str = "auto") -> str:
     """
-    Sorts a list of non-negative integers in-place using the counting sort algorithm.
+    Sorts a list of integers in-place using the counting sort algorithm.
 
     This algorithm is efficient when the range of input data (k) is not
     significantly larger than the number of elements (N).
 
+    With an explicit `MAX_NUM` the values must lie in [0, MAX_NUM] and a
+    histogram of MAX_NUM+1 slots is used. Without it the range is discovered
+    in a single pass (validating the elements on the way), the histogram is
+    offset by the minimum so negative numbers are accepted, and when the range
+    is more than `SPARSE_FACTOR` times larger than N a sparse histogram (a dict
+    walked in sorted key order) is used instead, keeping memory proportional
+    to the data rather than to the largest key.
+
     Args:
-        lst (List[int]): A list of non-negative integers to be sorted.
-        max_value (int): The maximum possible value in the list.
+        lst (List[int]): A list, `array.array` or NumPy array of integers to be sorted.
+        MAX_NUM (Optional[int]): The maximum possible value in the list, or
+            None to discover the range automatically.
+        key (Optional[Callable[[Any], int]]): Extracts an integer key from
+            each element; the elements themselves may be anything.
+            Every key is computed exactly once.
+        reverse (bool): If True the list is sorted in descending order.
+        backend (str): "python", "numpy" or "auto". "auto" uses NumPy
+            (`bincount` for the histogram, `repeat` for the write-back) for
+            arrays and lists of at least `NUMPY_CUTOFF` elements when it is
+            installed, and pure Python otherwise.
+
+    Returns:
+        str: The strategy that was used: "dense" or "sparse", prefixed with
+        "numpy-" when the NumPy backend did the work.
 
     Raises:
-        ValueError: If the list contains negative numbers.
+        ValueError: If the list contains non-integers, or negative numbers
+            while `MAX_NUM` is given.
+        ImportError: If backend="numpy" but NumPy is not installed.
 
     Notes:
         - Time Complexity: O(N + k), where N is the number of elements
-          and k is the `max_value`.
-        - Space Complexity: O(k) to store the count of elements.
+          and k is the range of the values (O(N + U * log(U)) for the sparse
+          strategy, U being the number of distinct values).
+        - Space Complexity: O(k) to store the count of elements, or O(U)
+          for the sparse strategy.
     """
+    if key is not None or reverse:
+        strategy: List[str] = []
+        _sortByKey(lst, key, reverse,
+                   lambda keys: strategy.append(countSort(keys, MAX_NUM, backend=backend)))
+        return strategy[0]
+
+    if _useNumpy(lst, backend):
+        values = _asIntegerArray(lst)
+        if values is not None:
+            return _countSortNumpy(lst, values, MAX_NUM)
+
+    if MAX_NUM is None:
+        return _countSortAuto(lst)
+
     if not all(isinstance(x, int) and x >= 0 for x in lst):
         raise ValueError("All elements in the list must be non-negative integers.")
     
@@ -178,8 +593,298 @@ def countSort(lst: List[Any], MAX_NUM: int) -> None:
     j = 0
     for i in range(len(count)):
         repeats = count[i]
-        while repeats > 0:
-            lst[j] = i
-            j+=1
-            repeats -= 1
-            
\ No newline at end of file
+        if repeats:
+            lst[j:j+repeats] = _run(lst, i, repeats)
+            j += repeats
+
+    return "dense"
+
+def _countSortAuto(lst: List[Any]) -> str:
+    """Pure Python countSort without a caller supplied range (see `countSort`)."""
+    if not lst:
+        return "dense"
+
+    low = high = lst[0]
+    for x in lst:
+        if not isinstance(x, int):
+            raise ValueError("All elements in the list must be integers.")
+        if x < low:
+            low = x
+        elif x > high:
+            high = x
+
+    if high - low >= SPARSE_FACTOR * len(lst):
+        counts = Counter(lst)
+        j = 0
+        for value in sorted(counts):
+            repeats = counts[value]
+            lst[j:j+repeats] = _run(lst, value, repeats)
+            j += repeats
+        return "sparse"
+
+    count = [0] * (high - low + 1)
+    for x in lst:
+        count[x - low] += 1
+
+    j = 0
+    for offset, repeats in enumerate(count):
+        if repeats:
+            lst[j:j+repeats] = _run(lst, low + offset, repeats)
+            j += repeats
+    return "dense"
+
+def _countSortNumpy(lst: Any, values: Any, MAX_NUM: Optional[int]) -> str:
+    """NumPy countSort on `values`, the integer array view of `lst` (see `countSort`)."""
+    if not len(values):
+        return "numpy-dense"
+
+    low, high = int(values.min()), int(values.max())
+    if MAX_NUM is not None:
+        if low < 0:
+            raise ValueError("All elements in the list must be non-negative integers.")
+        low, high = 0, max(high, MAX_NUM)
+
+    if high - low >= SPARSE_FACTOR * len(values):
+        distinct, counts = np.unique(values, return_counts=True)
+        result = np.repeat(distinct, counts)
+        strategy = "numpy-sparse"
+    else:
+        # Offsets are at most SPARSE_FACTOR * N here, widen first so they cannot wrap.
+        if values.dtype.kind == "u":
+            offsets = values - values.dtype.type(low)
+        else:
+            offsets = values.astype(np.int64) - low
+        counts = np.bincount(offsets.astype(np.intp, copy=False), minlength=high - low + 1)
+        result = np.repeat(np.arange(low, high + 1, dtype=values.dtype), counts)
+        strategy = "numpy-dense"
+
+    if isinstance(lst, list):
+        lst[:] = result.tolist()
+    else:
+        values[:] = result
+    return strategy
+
+def _run(lst: MutableSequence[int], value: int, repeats: int) -> MutableSequence[int]:
+    """`repeats` copies of value, as an array of the same type if `lst` is an `array.array`."""
+    if isinstance(lst, array):
+        return array(lst.typecode, [value]) * repeats
+    return [value] * repeats
+
+def radixSort(lst: MutableSequence[int], radix_bits: int = 8, *,
+              key: Optional[Callable[[Any], int]] = None, reverse: bool = False,
+              backend: str = "auto") -> None:
+    """
+    Sorts integers in-place using an LSD (least significant digit first) radix sort.
+
+    Each pass is a stable bucket distribution on one digit of `radix_bits`
+    bits (one byte by default). Negative numbers are handled by biasing the
+    keys (offset by the minimum in pure Python, flipping the sign bit with
+    NumPy), so the full signed and unsigned 64-bit ranges are supported.
+
+    Args:
+        lst (MutableSequence[int]): A list, `array.array` or NumPy array of
+            integers. With NumPy installed, `array.array` and ndarray inputs
+            are sorted through a zero-copy view of their buffer, without
+            boxing the elements into Python ints.
+        radix_bits (int): Bits per digit (1-16); the radix is 2**radix_bits.
+        key (Optional[Callable[[Any], int]]): Extracts an integer key from each
+            element (lists only). Every key is computed exactly once.
+        reverse (bool): If True the sequence is sorted in descending order.
+        backend (str): "python", "numpy" or "auto" (NumPy when installed and
+            the input is an array or a list of at least `NUMPY_CUTOFF` items).
+
+    Raises:
+        ValueError: If `radix_bits` is out of range or `backend` is unknown.
+        TypeError: If the elements are not integers, or `key` is given for
+            something other than a list.
+        ImportError: If backend="numpy" but NumPy is not installed.
+
+    Notes:
+        - Time Complexity: O(d * (N + 2**radix_bits)) where d is the number of
+          digits of the largest (biased) key.
+        - Space Complexity: O(N + 2**radix_bits).
+    """
+    if not 1 <= radix_bits <= 16:
+        raise ValueError("radix_bits must be between 1 and 16.")
+
+    if key is not None:
+        if not isinstance(lst, list):
+            raise TypeError("key= is only supported when sorting a list.")
+        _sortByKey(lst, key, reverse, lambda keys: radixSort(keys, radix_bits, backend=backend))
+        return
+
+    if len(lst) > 1:
+        if not (_useNumpy(lst, backend) and _radixSortNumpy(lst, radix_bits)):
+            _radixSortPython(lst, radix_bits)
+
+    if reverse:
+        _reverse(lst)
+
+def _radixSortPython(lst: MutableSequence[int], radix_bits: int) -> None:
+    """Pure Python LSD radix sort on a list or `array.array` (see `radixSort`)."""
+    values = list(lst)
+    low = min(values)
+    span = max(values) - low
+    mask = (1 << radix_bits) - 1
+
+    shift = 0
+    while span >> shift:
+        buckets: List[List[int]] = [[] for _ in range(mask + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for x in values:
+            appends[((x - low) >> shift) & mask](x)
+
+        values = list(chain.from_iterable(buckets))
+        shift += radix_bits
+
+    if isinstance(lst, array):
+        lst[:] = array(lst.typecode, values)
+    else:
+        lst[:] = values
+
+def _radixSortNumpy(lst: Any, radix_bits: int) -> bool:
+    """
+    NumPy LSD radix sort (see `radixSort`).
+
+    Returns:
+        bool: False if the input could not be viewed as an integer array and
+        the pure Python implementation has to be used instead.
+    """
+    values = _asIntegerArray(lst)
+    if values is None:
+        return False
+
+    # Bias signed keys by flipping the sign bit so they order as unsigned.
+    width = values.dtype.itemsize * 8
+    unsigned = np.dtype(f"u{values.dtype.itemsize}")
+    keys = np.ascontiguousarray(values).view(unsigned).copy()
+    if values.dtype.kind == "i":
+        keys ^= unsigned.type(1 << (width - 1))
+
+    mask = unsigned.type((1 << radix_bits) - 1)
+    significant = int(keys.max() ^ keys.min()).bit_length()
+    for shift in range(0, significant, radix_bits):
+        digits = (keys >> unsigned.type(shift)) & mask
+        keys = keys[np.argsort(digits, kind="stable")]
+
+    if values.dtype.kind == "i":
+        keys ^= unsigned.type(1 << (width - 1))
+    result = keys.view(values.dtype)
+
+    if isinstance(lst, list):
+        lst[:] = result.tolist()
+    else:
+        values[:] = result
+    return True
+
+def _useNumpy(lst: Any, backend: str) -> bool:
+    """Decides whether the NumPy code path should be tried for `lst`."""
+    if backend == "python":
+        return False
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("backend='numpy' requires NumPy to be installed.")
+        return True
+    if backend != "auto":
+        raise ValueError(f"Unknown backend {backend!r}, expected 'auto', 'python' or 'numpy'.")
+
+    if np is None:
+        return False
+    return isinstance(lst, (np.ndarray, array)) or len(lst) >= NUMPY_CUTOFF
+
+def _asIntegerArray(lst: Any) -> Any:
+    """
+    Returns `lst` as a one-dimensional NumPy integer array, or None if its
+    dtype is not an integer one.
+
+    ndarrays are returned as is and `array.array` buffers are wrapped without
+    copying, so writing into the result writes into `lst`. Lists are
+    converted (and validated) by NumPy's dtype inference.
+    """
+    if isinstance(lst, np.ndarray):
+        values = lst
+    elif isinstance(lst, array):
+        values = np.frombuffer(lst, dtype=lst.typecode) if len(lst) else np.asarray(lst)
+    else:
+        try:
+            values = np.asarray(lst)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    if values.ndim != 1 or values.dtype.kind not in "iu":
+        return None
+    return values
+
+def _sortByKey(lst: List[Any], key: Optional[Callable[[Any], Any]], reverse: bool,
+               engine: Callable[[List[Any]], None]) -> None:
+    """
+    Shared key=/reverse= driver for the sorts in this module (decorate once).
+
+    Each key is computed exactly once into a list parallel to `lst`, that list
+    is sorted by `engine` as plain values (so comparisons cost no more than in
+    the default path) and the payloads are then permuted into place in one
+    go. Equal keys are handed back their elements in original order, which
+    makes the result stable whatever the engine, also with `reverse`.
+
+    Args:
+        lst (List[Any]): The list to sort in-place.
+        key (Optional[Callable[[Any], Any]]): Key function, or None to sort
+            the elements themselves.
+        reverse (bool): Sort in descending order.
+        engine (Callable[[List[Any]], None]): Sorts a list in-place, ascending.
+
+    Notes:
+        The permutation is recovered through a dict keyed by the sort keys, so
+        it is O(N) for hashable keys. Unhashable keys fall back to sorting
+        (key, index) pairs.
+    """
+    if key is None:
+        # Reverse, sort, reverse keeps equal elements in their original order.
+        _reverse(lst)
+        engine(lst)
+        _reverse(lst)
+        return
+
+    keys = _newKeyList(map(key, lst))
+    try:
+        groups: Dict[Any, List[int]] = {}
+        for index, k in enumerate(keys):
+            group = groups.get(k)
+            if group is None:
+                groups[k] = [index]
+            else:
+                group.append(index)
+    except TypeError:
+        order = _sortByDecoratedKey(keys, reverse, engine)
+    else:
+        engine(keys)
+        if reverse:
+            keys.reverse()
+        positions: Dict[Any, Iterator[int]] = {k: iter(group) for k, group in groups.items()}
+        order = list(map(next, map(positions.__getitem__, keys)))
+
+    lst[:] = list(map(lst.__getitem__, order))
+
+def _reverse(lst: MutableSequence[Any]) -> None:
+    """Reverses a list, `array.array` or NumPy array in-place."""
+    if np is not None and isinstance(lst, np.ndarray):
+        lst[:] = lst[::-1].copy()
+    else:
+        lst.reverse()
+
+def _newKeyList(keys: Iterable[Any]) -> List[Any]:
+    """Materialises the decorated keys (a seam for `algo.profiling`, like `_newBuffer`)."""
+    return list(keys)
+
+def _sortByDecoratedKey(keys: List[Any], reverse: bool,
+                        engine: Callable[[List[Any]], None]) -> List[int]:
+    """Fallback of `_sortByKey` for unhashable keys; returns the sorted order of indices."""
+    if reverse:
+        decorated = [(k, -index) for index, k in enumerate(keys)]
+        engine(decorated)
+        decorated.reverse()
+        return [-index for _, index in decorated]
+
+    decorated = [(k, index) for index, k in enumerate(keys)]
+    engine(decorated)
+    return [index for _, index in decorated]
@@ -0,0 +1,301 @@
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+from itertools import accumulate, chain
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .sort import mergeSort
+
+T = TypeVar('T')
+
+# Target chunk length; chunks are split at twice this and merged below half of it.
+DEFAULT_LOAD = 1000
+# update() merges the whole batch linearly once it is this large a fraction of the list.
+BULK_MERGE_RATIO = 0.1
+
+def mergeSorted(*iterables: Iterable[Any], key: Optional[Callable[[Any], Any]] = None,
+                reverse: bool = False) -> Iterator[Any]:
+    """
+    Lazily merges already sorted iterables into one sorted stream.
+
+    Two inputs are merged with a plain two-way merge, more go through a
+    heap-based k-way merge (`heapq.merge`). On ties, items from earlier
+    iterables come first, so the merge is stable.
+
+    Args:
+        *iterables (Iterable[Any]): Sorted inputs (descending if `reverse`).
+        key (Optional[Callable[[Any], Any]]): Extracts the comparison key
+            from each item.
+        reverse (bool): The inputs are sorted in descending order.
+
+    Yields:
+        Any: The items of all inputs in sorted order.
+
+    Notes:
+        O(N * log(k)) comparisons for k inputs, O(k) memory.
+    """
+    if len(iterables) != 2:
+        yield from merge(*iterables, key=key, reverse=reverse)
+        return
+
+    left, right = iter(iterables[0]), iter(iterables[1])
+    sentinel = object()
+    a, b = next(left, sentinel), next(right, sentinel)
+    if key is None:
+        key = lambda item: item
+    while a is not sentinel and b is not sentinel:
+        # Take from the right only when strictly before the left item.
+        if (key(a) < key(b)) if reverse else (key(b) < key(a)):
+            yield b
+            b = next(right, sentinel)
+        else:
+            yield a
+            a = next(left, sentinel)
+
+    if a is not sentinel:
+        yield a
+        yield from left
+    if b is not sentinel:
+        yield b
+        yield from right
+
+class SortedList(Generic[T]):
+    """
+    A list that keeps its elements sorted as they are added.
+
+    The elements live in a list of sorted chunks of about `load` elements,
+    plus the maximum of every chunk. Finding a position is a bisect over the
+    maxima and one inside a chunk, and inserting or deleting only moves the
+    elements of one chunk instead of the whole list.
+
+    Time Complexity: O(log(N)) search, O(log(N) + load) insertion/deletion,
+    O(N + k * log(k)) to merge in a batch of k elements with `update`.
+    Rank and positional queries are O(log(N)) after an O(N / load) refresh of
+    the chunk offsets following a modification.
+    """
+    def __init__(self, iterable: Optional[Iterable[T]] = None, load: int = DEFAULT_LOAD) -> None:
+        """Initializes the list, optionally with the elements of `iterable`."""
+        if load < 4:
+            raise ValueError("load must be at least 4.")
+        self._load = load
+        self._lists: List[List[T]] = []
+        self._maxes: List[T] = []
+        self._offsets: Optional[List[int]] = None
+        self._len = 0
+        if iterable is not None:
+            self.update(iterable)
+
+    def add(self, value: T) -> None:
+        """Inserts a value at its sorted position (after any equal values)."""
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            self._split(pos)
+
+        self._len += 1
+        self._offsets = None
+
+    def update(self, iterable: Iterable[T]) -> None:
+        """
+        Adds all values of an iterable.
+
+        The batch is sorted on its own (with `mergeSort`); a large batch is
+        then merged linearly with the existing elements and re-chunked, a
+        small one is inserted value by value.
+        """
+        values = mergeSort(list(iterable), inplace=True)
+        if not values:
+            return
+
+        if len(values) < BULK_MERGE_RATIO * self._len:
+            for value in values:
+                self.add(value)
+            return
+
+        merged = list(mergeSorted(chain.from_iterable(self._lists), values))
+        load = self._load
+        self._lists = [merged[start:start + load] for start in range(0, len(merged), load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._len = len(merged)
+        self._offsets = None
+
+    def remove(self, value: T) -> None:
+        """Removes one occurrence of value. Raises ValueError if it is absent."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def discard(self, value: T) -> bool:
+        """Removes one occurrence of value if present; returns whether one was removed."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+
+        chunk = self._lists[pos]
+        index = bisect_left(chunk, value)
+        if chunk[index] != value:
+            return False
+
+        self._delete(pos, index)
+        return True
+
+    def pop(self, index: int = -1) -> T:
+        """Removes and returns the value at index (the largest by default)."""
+        pos, offset = self._locate(index)
+        value = self._lists[pos][offset]
+        self._delete(pos, offset)
+        return value
+
+    def bisect_left(self, value: T) -> int:
+        """The number of elements strictly smaller than value."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value: T) -> int:
+        """The number of elements smaller than or equal to value."""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_right(self._lists[pos], value)
+
+    def count(self, value: T) -> int:
+        """The number of occurrences of value."""
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value: T) -> int:
+        """The position of the first occurrence of value. Raises ValueError if absent."""
+        position = self.bisect_left(value)
+        if position == self._len or self[position] != value:
+            raise ValueError(f"{value!r} not in SortedList")
+        return position
+
+    def irange(self, minimum: Optional[T] = None, maximum: Optional[T] = None,
+               inclusive: Tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        """
+        Yields the values between minimum and maximum in order. A bound of
+        None is open; `inclusive` says whether each bound itself is included.
+        """
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        return self._slice(start, stop)
+
+    def __getitem__(self, index: Any) -> Any:
+        """Returns the value at index, or a list of values for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._slice(start, stop))
+            return list(self)[index]
+
+        pos, offset = self._locate(index)
+        return self._lists[pos][offset]
+
+    def __delitem__(self, index: int) -> None:
+        """Deletes the value at index."""
+        pos, offset = self._locate(index)
+        self._delete(pos, offset)
+
+    def __len__(self) -> int:
+        """Returns the number of elements. Time Complexity: O(1)"""
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the values in ascending order."""
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator[T]:
+        """Iterates over the values in descending order."""
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __contains__(self, value: T) -> bool:
+        """Checks if value is in the list. Time Complexity: O(log(N))"""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        return chunk[bisect_left(chunk, value)] == value
+
+    def __bool__(self) -> bool:
+        """Returns True if the list is not empty, False otherwise."""
+        return self._len > 0
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the sorted list."""
+        return f"SortedList({list(self)!r})"
+
+    def _slice(self, start: int, stop: int) -> Iterator[T]:
+        if start >= stop:
+            return
+        pos, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._lists[pos]
+            taken = chunk[offset:offset + remaining]
+            yield from taken
+            remaining -= len(taken)
+            pos, offset = pos + 1, 0
+
+    def _chunkOffsets(self) -> List[int]:
+        """Prefix sums of the chunk lengths, rebuilt lazily after modifications."""
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(map(len, self._lists))]
+        return self._offsets
+
+    def _offset(self, pos: int) -> int:
+        return self._chunkOffsets()[pos]
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Maps a (possibly negative) position to (chunk, offset in chunk)."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Index out of range")
+
+        offsets = self._chunkOffsets()
+        pos = bisect_right(offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def _split(self, pos: int) -> None:
+        chunk = self._lists[pos]
+        if len(chunk) > 2 * self._load:
+            half = chunk[self._load:]
+            del chunk[self._load:]
+            self._lists.insert(pos + 1, half)
+            self._maxes.insert(pos + 1, half[-1])
+            self._maxes[pos] = chunk[-1]
+
+    def _delete(self, pos: int, index: int) -> None:
+        chunk = self._lists[pos]
+        del chunk[index]
+        self._len -= 1
+        self._offsets = None
+
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+            return
+
+        self._maxes[pos] = chunk[-1]
+        # Fold small chunks into a neighbour to keep the number of chunks bounded.
+        if len(chunk) < self._load // 2 and len(self._lists) > 1:
+            neighbour = pos - 1 if pos > 0 else pos + 1
+            first, second = min(pos, neighbour), max(pos, neighbour)
+            self._lists[first].extend(self._lists[second])
+            self._maxes[first] = self._lists[first][-1]
+            del self._lists[second]
+            del self._maxes[second]
+            self._split(first)
@@ -0,0 +1,5 @@
+"""
+Benchmark scripts for the DSA packages.
+
+Run them from the repository root, e.g. `python -m benchmarks.bench_key`.
+"""
@@ -0,0 +1,55 @@
+"""
+Per-element cost of moving items through Queue and Stack one call at a time
+versus with push_many/pop_many, for batch sizes 1 to 10k.
+
+    python -m benchmarks.bench_batch --items 100000
+"""
+import argparse
+import time
+from typing import Any, Callable, List, Optional
+
+from consecutive import Queue, Stack
+
+BATCH_SIZES = [1, 10, 100, 1_000, 10_000]
+
+def _best(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def single(container: Any, items: int, batch: int) -> None:
+    """Pushes and pops `items` elements in rounds of `batch`, one call per element."""
+    push, pop = container.push, container.pop
+    values = list(range(batch))
+    for _ in range(items // batch):
+        for value in values:
+            push(value)
+        for _ in values:
+            pop()
+
+def batched(container: Any, items: int, batch: int) -> None:
+    """Pushes and pops `items` elements in rounds of `batch`, one call per batch."""
+    values = list(range(batch))
+    for _ in range(items // batch):
+        container.push_many(values)
+        container.pop_many(batch)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for cls in (Queue, Stack):
+        print(f"--- {cls.__name__}, {args.items} elements ---")
+        for batch in BATCH_SIZES:
+            one = _best(lambda: single(cls(), args.items, batch), args.repeat)
+            many = _best(lambda: batched(cls(), args.items, batch), args.repeat)
+            print(f"  batch {batch:>6}  push/pop {one / args.items * 1e9:7.1f} ns/elem"
+                  f"   push_many/pop_many {many / args.items * 1e9:7.1f} ns/elem   {one / many:5.1f}x")
+
+if __name__ == "__main__":
+    main()
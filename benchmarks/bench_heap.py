@@ -0,0 +1,83 @@
+"""
+Compares the consecutive priority queues with plain heapq: heapify, a push
+then pop-all workload, and a monotone Dijkstra-like workload where every pop
+pushes a few larger priorities.
+
+    python -m benchmarks.bench_heap --items 200000
+"""
+import argparse
+from heapq import heapify, heappop, heappush
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from consecutive import IndexedPriorityQueue, PriorityQueue, RadixHeap
+
+def _seconds(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+def push_pop(make: Callable[[], Any], values: List[int]) -> None:
+    """Pushes every value, then pops them all."""
+    queue = make()
+    if isinstance(queue, list):
+        for val in values:
+            heappush(queue, val)
+        while queue:
+            heappop(queue)
+        return
+    push, pop = queue.push, queue.pop
+    for val in values:
+        push(val, val)
+    for _ in values:
+        pop()
+
+def monotone(make: Callable[[], Any], values: List[int], fanout: int = 3) -> None:
+    """Pops the minimum and pushes `fanout` larger priorities, until `values` is used up."""
+    queue = make()
+    is_heapq = isinstance(queue, list)
+    if is_heapq:
+        heappush(queue, 0)
+    else:
+        queue.push(0, 0)
+    steps = iter(values)
+    while queue:
+        current = heappop(queue) if is_heapq else queue.pop()
+        for _ in range(fanout):
+            step = next(steps, None)
+            if step is None:
+                break
+            if is_heapq:
+                heappush(queue, current + step)
+            else:
+                queue.push(current + step, current + step)
+
+QUEUES: Dict[str, Callable[[], Any]] = {
+    "heapq": list,
+    "PriorityQueue(2)": lambda: PriorityQueue(arity=2),
+    "PriorityQueue(4)": lambda: PriorityQueue(arity=4),
+    "IndexedPriorityQueue(4)": IndexedPriorityQueue,
+    "RadixHeap": RadixHeap,
+}
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    values = [rng.randrange(args.items * 16) for _ in range(args.items)]
+
+    print(f"items={args.items}")
+    print(f"  heapify: heapq {_seconds(lambda: heapify(values[:])) * 1e3:8.1f} ms"
+          f"   PriorityQueue(2) {_seconds(lambda: PriorityQueue(values)) * 1e3:8.1f} ms"
+          f"   PriorityQueue(4) {_seconds(lambda: PriorityQueue(values, arity=4)) * 1e3:8.1f} ms")
+    for name, make in QUEUES.items():
+        # Random priorities are not monotone, the radix heap only runs the monotone workload.
+        random_order = _seconds(lambda: push_pop(make, values)) if name != "RadixHeap" else None
+        steps = _seconds(lambda: monotone(make, [val % 1000 + 1 for val in values]))
+        random_text = f"{random_order / args.items * 1e9:7.0f} ns/item" if random_order else " " * 15
+        print(f"  {name:<24} push+pop random {random_text}   monotone {steps / args.items * 1e9:7.0f} ns/item")
+
+if __name__ == "__main__":
+    main()
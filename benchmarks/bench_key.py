@@ -0,0 +1,57 @@
+"""
+Compares sorting records with `key=` against the old workaround of building a
+list of (key, index, record) tuples and sorting that.
+"""
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from algo.sort import countSort, insertionSort, mergeSort, quickSort
+
+MAX_SCORE = 1000
+
+def _records(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [{"id": i, "score": rng.randint(0, MAX_SCORE)} for i in range(n)]
+
+def _sorters() -> Dict[str, Callable[..., Any]]:
+    return {
+        "insertionSort": lambda lst, **kw: insertionSort(lst, **kw),
+        "mergeSort": lambda lst, **kw: mergeSort(lst, inplace=True, **kw),
+        "quickSort": lambda lst, **kw: quickSort(lst, 0, len(lst) - 1, **kw),
+    }
+
+def _timeit(fn: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main() -> None:
+    score = lambda record: record["score"]
+    for n in (1_000, 20_000, 100_000):
+        records = _records(n)
+        print(f"--- N = {n} ---")
+        for name, sort in _sorters().items():
+            if name == "insertionSort" and n > 1_000:
+                continue
+
+            def with_key() -> None:
+                sort(records.copy(), key=score)
+
+            def with_tuples() -> None:
+                decorated = [(r["score"], i, r) for i, r in enumerate(records)]
+                sort(decorated)
+                [r for _, _, r in decorated]
+
+            keyed, tupled = _timeit(with_key), _timeit(with_tuples)
+            print(f"  {name:<14} key=: {keyed * 1e3:9.2f} ms   tuples: {tupled * 1e3:9.2f} ms"
+                  f"   ratio: {tupled / keyed:5.2f}x")
+
+        keyed = _timeit(lambda: countSort(records.copy(), MAX_SCORE, key=score))
+        print(f"  {'countSort':<14} key=: {keyed * 1e3:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
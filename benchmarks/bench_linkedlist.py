@@ -0,0 +1,151 @@
+"""
+Memory per element (tracemalloc) and node churn cost of scattered.LinkedList.
+
+Compares the slot-based nodes with nodes carrying a __dict__ (the old
+layout), a FIFO churn workload (insert_end + delete_front) with and
+without the node pool, and draining from the tail with delete_end, which
+is O(N) per call on LinkedList and O(1) on DoublyLinkedList. Finally
+LinkedList against UnrolledLinkedList (list and array chunks) and the
+indexable SkipList on memory, iteration and random positional reads, and
+removing every other element by index against one pass of a cursor or
+remove_if.
+
+    python -m benchmarks.bench_linkedlist --items 200000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional
+
+from scattered import DoublyLinkedList, LinkedList, SkipList, UnrolledLinkedList
+from scattered.LinkedList import Node
+
+class DictNode:
+    """A node with the layout LinkedList used before __slots__."""
+    def __init__(self, data: Any, next_node: Optional["DictNode"] = None) -> None:
+        self.data = data
+        self.next = next_node
+
+def bytes_per_element(build: Callable[[], Any], items: int) -> float:
+    """Traced memory of what `build` returns, per element."""
+    tracemalloc.start()
+    try:
+        built = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del built
+    return size / items
+
+def chain(node_type: type, items: int) -> Any:
+    head = None
+    for value in range(items):
+        head = node_type(value, head)
+    return head
+
+def churn(ll: LinkedList, items: int, window: int) -> float:
+    """Seconds for `items` rounds of insert_end + delete_front on a list of `window` elements."""
+    for value in range(window):
+        ll.insert_end(value)
+    started = time.perf_counter()
+    for value in range(items):
+        ll.insert_end(value)
+        ll.delete_front()
+    return time.perf_counter() - started
+
+def drain_from_tail(ll: Any, items: int) -> float:
+    """Seconds to fill `ll` with `items` elements and delete them all with delete_end."""
+    for value in range(items):
+        ll.insert_end(value)
+    started = time.perf_counter()
+    while len(ll):
+        ll.delete_end()
+    return time.perf_counter() - started
+
+def reads(ll: Any, indices: List[int]) -> float:
+    """Seconds per ll[i] read over `indices`."""
+    started = time.perf_counter()
+    for index in indices:
+        ll[index]
+    return (time.perf_counter() - started) / len(indices)
+
+def remove_every_other(ll: LinkedList, how: str) -> float:
+    """Seconds to remove the odd values of ll by index, with a cursor, or with remove_if."""
+    started = time.perf_counter()
+    if how == "del ll[i]":
+        for index in range(len(ll) // 2, 0, -1):
+            del ll[2 * index - 1]
+    elif how == "cursor":
+        cursor = ll.cursor()
+        while cursor:
+            if cursor.value % 2:
+                cursor.remove_current()
+            else:
+                cursor.advance()
+    else:
+        ll.remove_if(lambda value: value % 2)
+    return time.perf_counter() - started
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    items = args.items
+
+    def build_list() -> LinkedList:
+        ll = LinkedList()
+        for value in range(items):
+            ll.insert_end(value)
+        return ll
+
+    print(f"items={items} (bytes include the int values, ~28 bytes each above 256)")
+    print(f"  DictNode chain       {bytes_per_element(lambda: chain(DictNode, items), items):6.1f} bytes/element")
+    print(f"  Node chain (slots)   {bytes_per_element(lambda: chain(Node, items), items):6.1f} bytes/element")
+    print(f"  LinkedList           {bytes_per_element(build_list, items):6.1f} bytes/element")
+
+    for pool_size in (0, 1024):
+        seconds = churn(LinkedList(pool_size=pool_size), items, 1000)
+        print(f"  churn, pool_size={pool_size:<5} {seconds / items * 1e9:7.0f} ns/round")
+
+    # The singly linked drain is quadratic, keep it small.
+    drained = min(items, 5000)
+    for cls in (LinkedList, DoublyLinkedList):
+        seconds = drain_from_tail(cls(), drained)
+        print(f"  drain {drained} with delete_end, {cls.__name__:<16} {seconds * 1e3:9.1f} ms")
+
+    rng = random.Random(0)
+    indices = [rng.randrange(items) for _ in range(200)]
+    variants = {
+        "LinkedList": LinkedList,
+        "UnrolledLinkedList": UnrolledLinkedList,
+        "UnrolledLinkedList('q')": lambda: UnrolledLinkedList(typecode='q'),
+        "SkipList": lambda: SkipList(seed=0),
+    }
+    for name, make in variants.items():
+        def build() -> Any:
+            ll = make()
+            for value in range(10 ** 12, 10 ** 12 + items):
+                ll.insert_end(value)
+            return ll
+
+        memory = bytes_per_element(build, items)
+        ll = build()
+        started = time.perf_counter()
+        for _ in ll:
+            pass
+        iteration = (time.perf_counter() - started) / items
+        print(f"  {name:<24} {memory:6.1f} bytes/element   iterate {iteration * 1e9:6.1f} ns/element"
+              f"   ll[i] {reads(ll, indices) * 1e6:9.1f} us")
+
+    # Removing by index is quadratic, keep it small.
+    edited = min(items, 5000)
+    for how in ("del ll[i]", "cursor", "remove_if"):
+        ll = LinkedList()
+        ll.extend(range(edited))
+        seconds = remove_every_other(ll, how)
+        assert list(ll) == list(range(0, edited, 2))
+        print(f"  remove every other of {edited}, {how:<10} {seconds * 1e3:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Times parallelSort against the serial algorithm over growing input sizes to
+find where the process pool starts paying off (see PARALLEL_THRESHOLD).
+"""
+import os
+import random
+import time
+from typing import Any, Callable
+
+from algo.parallel import ALGORITHMS, PARALLEL_THRESHOLD, parallelSort
+
+def _best(fn: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main(algorithm: str = "merge") -> None:
+    workers = max(2, os.cpu_count() or 1)
+    rng = random.Random(0)
+    print(f"workers={workers} algorithm={algorithm} current PARALLEL_THRESHOLD={PARALLEL_THRESHOLD}")
+
+    crossover = None
+    for n in (10_000, 50_000, 100_000, 200_000, 500_000, 1_000_000):
+        data = [rng.randint(-2**40, 2**40) for _ in range(n)]
+        serial = _best(lambda: ALGORITHMS[algorithm](data[:]))
+        parallel = _best(lambda: parallelSort(data, workers=workers, algorithm=algorithm, threshold=0))
+        print(f"  N={n:>9}  serial {serial * 1e3:9.1f} ms   parallel {parallel * 1e3:9.1f} ms"
+              f"   speedup {serial / parallel:5.2f}x")
+        # The threshold is the smallest size from which parallel keeps winning.
+        if parallel < serial:
+            crossover = crossover or n
+        else:
+            crossover = None
+
+    if crossover is None:
+        print("parallelSort never won on this machine, keep a high threshold.")
+    else:
+        print(f"suggested PARALLEL_THRESHOLD ~ {crossover}")
+
+if __name__ == "__main__":
+    main()
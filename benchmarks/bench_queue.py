@@ -0,0 +1,81 @@
+"""
+Throughput of the consecutive queues against the standard library: one
+producer and one consumer thread through BoundedQueue, SPSCQueue and
+queue.Queue, then one producer and one consumer task through AsyncQueue and
+asyncio.Queue.
+
+    python -m benchmarks.bench_queue --items 200000 --maxsize 1024
+"""
+import argparse
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from consecutive import AsyncQueue, BoundedQueue, SPSCQueue
+
+THREADED: Dict[str, Callable[[int], Any]] = {
+    "queue.Queue": lambda maxsize: queue.Queue(maxsize),
+    "BoundedQueue": BoundedQueue,
+    "SPSCQueue": SPSCQueue,
+}
+ASYNC: Dict[str, Callable[[int], Any]] = {
+    "asyncio.Queue": lambda maxsize: asyncio.Queue(maxsize),
+    "AsyncQueue": AsyncQueue,
+}
+
+def threaded(make: Callable[[int], Any], items: int, maxsize: int) -> float:
+    """Seconds to pass `items` ints from a producer thread to a consumer thread."""
+    q = make(maxsize)
+    push = q.put if isinstance(q, queue.Queue) else q.push
+    pop = q.get if isinstance(q, queue.Queue) else q.pop
+
+    def consume() -> None:
+        for _ in range(items):
+            pop()
+
+    consumer = threading.Thread(target=consume)
+    started = time.perf_counter()
+    consumer.start()
+    for i in range(items):
+        push(i)
+    consumer.join()
+    return time.perf_counter() - started
+
+def asynchronous(make: Callable[[int], Any], items: int, maxsize: int) -> float:
+    """Seconds to pass `items` ints from a producer task to a consumer task."""
+    async def scenario() -> float:
+        q = make(maxsize)
+        push = q.put if isinstance(q, asyncio.Queue) else q.push
+        pop = q.get if isinstance(q, asyncio.Queue) else q.pop
+
+        async def produce() -> None:
+            for i in range(items):
+                await push(i)
+
+        async def consume() -> None:
+            for _ in range(items):
+                await pop()
+
+        started = time.perf_counter()
+        await asyncio.gather(produce(), consume())
+        return time.perf_counter() - started
+
+    return asyncio.run(scenario())
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--maxsize", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"items={args.items} maxsize={args.maxsize}")
+    for runner, queues in ((threaded, THREADED), (asynchronous, ASYNC)):
+        for name, make in queues.items():
+            seconds = min(runner(make, args.items, args.maxsize) for _ in range(args.repeat))
+            print(f"  {name:<14} {args.items / seconds:12,.0f} items/s  {seconds / args.items * 1e9:8.0f} ns/item")
+
+if __name__ == "__main__":
+    main()
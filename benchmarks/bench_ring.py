@@ -0,0 +1,64 @@
+"""
+Memory per element (tracemalloc) and push/pop throughput of the array-backed
+RingQueue against the deque-backed Queue, filled with distinct ints.
+
+    python -m benchmarks.bench_ring --items 1000000
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional
+
+from consecutive import Queue, RingQueue
+
+def bytes_per_element(fill: Callable[[], Any], items: int) -> float:
+    """Traced memory of the filled container (elements included) per element."""
+    tracemalloc.start()
+    try:
+        container = fill()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del container
+    return size / items
+
+def throughput(make: Callable[[], Any], items: int, batch: int) -> float:
+    """Seconds to push and pop `items` elements in rounds of `batch`."""
+    container = make()
+    push, pop = container.push, container.pop
+    started = time.perf_counter()
+    for start in range(0, items, batch):
+        for value in range(start, start + batch):
+            push(value)
+        for _ in range(batch):
+            pop()
+    return time.perf_counter() - started
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    # Values above the small-int cache, so every deque slot holds its own int object.
+    offset = 10 ** 12
+
+    def fill_queue() -> Queue:
+        q = Queue[int]()
+        q.push_many(range(offset, offset + args.items))
+        return q
+
+    def fill_ring() -> RingQueue:
+        q = RingQueue('q')
+        q.push_many(range(offset, offset + args.items))
+        return q
+
+    print(f"items={args.items}")
+    print(f"  Queue          {bytes_per_element(fill_queue, args.items):6.1f} bytes/element")
+    print(f"  RingQueue('q') {bytes_per_element(fill_ring, args.items):6.1f} bytes/element")
+    for batch in (1, 1000):
+        queue_seconds = throughput(Queue, args.items, batch)
+        ring_seconds = throughput(RingQueue, args.items, batch)
+        print(f"  push/pop in rounds of {batch:>4}: Queue {queue_seconds / args.items * 1e9:6.1f} ns/elem"
+              f"   RingQueue {ring_seconds / args.items * 1e9:6.1f} ns/elem")
+
+if __name__ == "__main__":
+    main()
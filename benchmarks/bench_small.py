@@ -0,0 +1,45 @@
+"""
+Compares the quadratic sorts and their variants on the small buffers
+(8 to 64 elements) they are used for inside larger pipelines.
+"""
+import random
+import timeit
+
+from algo.sort import (
+    binaryInsertionSort,
+    bubbleSort,
+    cocktailSort,
+    insertionSort,
+    selectionSort,
+    shellSort,
+)
+
+SORTERS = {
+    "insertionSort": insertionSort,
+    "binaryInsertionSort": binaryInsertionSort,
+    "shellSort/ciura": lambda lst: shellSort(lst, "ciura"),
+    "shellSort/tokuda": lambda lst: shellSort(lst, "tokuda"),
+    "bubbleSort": bubbleSort,
+    "cocktailSort": cocktailSort,
+    "selectionSort": selectionSort,
+}
+
+def main() -> None:
+    rng = random.Random(0)
+    for n in (8, 16, 32, 64):
+        inputs = {
+            "random": [rng.random() for _ in range(n)],
+            "nearly sorted": sorted(rng.random() for _ in range(n)),
+        }
+        inputs["nearly sorted"][n // 2], inputs["nearly sorted"][-1] = (
+            inputs["nearly sorted"][-1], inputs["nearly sorted"][n // 2])
+
+        for shape, data in inputs.items():
+            print(f"--- N = {n}, {shape} ---")
+            for name, sorter in SORTERS.items():
+                runs = 2000
+                seconds = min(timeit.repeat(lambda: sorter(data[:]), number=runs, repeat=3))
+                print(f"  {name:<20} {seconds / runs * 1e6:8.2f} us/sort")
+
+if __name__ == "__main__":
+    main()
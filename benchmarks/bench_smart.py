@@ -0,0 +1,67 @@
+"""
+Validates the smartSort heuristics: for every distribution and size it times
+smartSort against each fixed algorithm and reports how far its pick is from
+the fastest one.
+
+    python -m benchmarks.bench_smart --max-size 100000
+"""
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from algo.adaptive import smartSort
+from algo.sort import countSort, insertionSort, mergeSort, quickSort, radixSort
+from benchmarks.generators import DISTRIBUTIONS, generate
+
+SIZES = [10 ** exponent for exponent in range(2, 7)]
+FIXED: Dict[str, Callable[[List[Any]], Any]] = {
+    "insertion": insertionSort,
+    "merge": lambda lst: mergeSort(lst, inplace=True),
+    "quick": lambda lst: quickSort(lst, 0, len(lst) - 1),
+    "count": countSort,
+    "radix": radixSort,
+}
+# Insertion sort is only timed up to this size.
+INSERTION_LIMIT = 10 ** 4
+# Differences below this many seconds are not counted as misses.
+NOISE_FLOOR = 0.0005
+
+def _best(sorter: Callable[[List[Any]], Any], data: List[Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        work = data[:]
+        started = time.perf_counter()
+        sorter(work)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=2.0,
+                        help="smartSort may be this many times slower than the best fixed algorithm")
+    args = parser.parse_args(argv)
+
+    misses = 0
+    for size in (size for size in SIZES if size <= args.max_size):
+        for distribution in DISTRIBUTIONS:
+            data = generate(distribution, size)
+            times = {name: _best(sorter, data, args.repeat) for name, sorter in FIXED.items()
+                     if name != "insertion" or size <= INSERTION_LIMIT}
+            smart = _best(smartSort, data, args.repeat)
+            picked = smartSort(data[:]).algorithm
+
+            fastest = min(times, key=times.get)
+            ratio = smart / times[fastest]
+            verdict = "ok" if ratio <= args.tolerance or smart - times[fastest] < NOISE_FLOOR else "MISS"
+            misses += verdict == "MISS"
+            print(f"{size:>8} {distribution:<15} picked {picked:<10} fastest {fastest:<10}"
+                  f" smart {smart * 1e3:9.2f} ms  best {times[fastest] * 1e3:9.2f} ms  {ratio:5.2f}x  {verdict}")
+
+    print(f"{misses} heuristic misses (tolerance {args.tolerance}x)")
+    return 1 if misses else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Benchmark harness for algo.sort with a regression gate.
+
+Runs every sorter over the distributions of `benchmarks.generators` at sizes
+10^2 .. 10^7 and records wall time, comparisons, element moves and peak
+memory (tracemalloc), the counters coming from `algo.profiling`.
+`list.sort` is measured as the reference line.
+
+    python -m benchmarks.bench_sort --max-size 10000 --output results.json
+    python -m benchmarks.bench_sort --max-size 10000 --baseline benchmarks/baseline.json
+
+With --baseline the run exits with status 1 when a sorter does more
+comparisons or element moves than the baseline by more than --threshold, or
+when a measured sorter / distribution / size is missing from the baseline.
+These counts are deterministic, so the gate does not flake. Wall times are
+only gated with --time-threshold, against a baseline recorded on the same
+machine.
+"""
+import argparse
+from dataclasses import asdict, dataclass
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from algo.sort import (
+    binaryInsertionSort,
+    bubbleSort,
+    cocktailSort,
+    countSort,
+    insertionSort,
+    mergeSort,
+    quickSort,
+    radixSort,
+    selectionSort,
+    shellSort,
+)
+from algo.profiling import profileSort
+from benchmarks.generators import DISTRIBUTIONS, generate
+
+SIZES = [10 ** exponent for exponent in range(2, 8)]
+# The O(N^2) sorters are skipped above this size.
+QUADRATIC_LIMIT = 10 ** 4
+# Comparisons, moves and memory are only measured up to this size, the
+# instrumented runs are much slower than the timed ones.
+COUNT_LIMIT = 10 ** 5
+# Slowdowns smaller than this many seconds are treated as noise by the gate.
+NOISE_FLOOR = 0.002
+
+REFERENCE = "list.sort"
+SORTERS: Dict[str, Callable[[List[Any]], Any]] = {
+    REFERENCE: lambda lst: lst.sort(),
+    "insertionSort": insertionSort,
+    "bubbleSort": bubbleSort,
+    "selectionSort": selectionSort,
+    "binaryInsertionSort": binaryInsertionSort,
+    "shellSort": shellSort,
+    "cocktailSort": cocktailSort,
+    "mergeSort": lambda lst: mergeSort(lst, inplace=True),
+    "quickSort": lambda lst: quickSort(lst, 0, len(lst) - 1),
+    "countSort": countSort,
+    "radixSort": radixSort,
+}
+QUADRATIC = {"insertionSort", "bubbleSort", "selectionSort", "binaryInsertionSort", "cocktailSort"}
+
+@dataclass
+class Measurement:
+    """One sorter on one input. Counters are None when they were not measured."""
+    sorter: str
+    distribution: str
+    size: int
+    seconds: float
+    relative: Optional[float] = None
+    comparisons: Optional[int] = None
+    moves: Optional[int] = None
+    max_depth: Optional[int] = None
+    allocations: Optional[int] = None
+    peak_bytes: Optional[int] = None
+
+def measure(name: str, distribution: str, data: List[Any], repeat: int = 3) -> Measurement:
+    """Times `name` on copies of `data` (best of `repeat`) and, for small inputs, counts its work."""
+    sorter = SORTERS[name]
+    best = float("inf")
+    for _ in range(repeat):
+        work = data[:]
+        started = time.perf_counter()
+        sorter(work)
+        best = min(best, time.perf_counter() - started)
+
+    result = Measurement(name, distribution, len(data), best)
+    if len(data) > COUNT_LIMIT:
+        return result
+
+    _, stats = profileSort(sorter, data[:])
+    result.comparisons, result.moves = stats.comparisons, stats.moves
+    result.max_depth, result.allocations = stats.max_depth, stats.allocations
+
+    work = data[:]
+    tracemalloc.start()
+    try:
+        sorter(work)
+        result.peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result
+
+def run(sizes: Iterable[int], distributions: Iterable[str], sorters: Iterable[str],
+        repeat: int = 3, log: Callable[[str], Any] = print) -> List[Measurement]:
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            data = generate(distribution, size)
+            reference: Optional[float] = None
+            for name in sorters:
+                if name in QUADRATIC and size > QUADRATIC_LIMIT:
+                    continue
+                measurement = measure(name, distribution, data, repeat)
+                results.append(measurement)
+
+                if name == REFERENCE:
+                    reference = measurement.seconds
+                if reference:
+                    measurement.relative = measurement.seconds / reference
+                ratio = f"{measurement.relative:8.1f}x" if measurement.relative else " " * 9
+                log(f"{size:>9} {distribution:<15} {name:<14} {measurement.seconds * 1e3:11.3f} ms {ratio}"
+                    f"  cmp={measurement.comparisons}  moves={measurement.moves}  depth={measurement.max_depth}"
+                    f"  peak={measurement.peak_bytes}")
+    return results
+
+def compare(results: List[Measurement], baseline: List[Dict[str, Any]],
+            threshold: float, time_threshold: Optional[float] = None) -> List[str]:
+    """
+    Returns a description of every result that regressed against `baseline`,
+    and of every result the baseline has no entry for.
+
+    Comparison and move counts are deterministic and portable, they are
+    allowed to grow by `threshold`. Wall times are noisy and depend on the
+    machine, so they are only compared when `time_threshold` is given (and
+    then slowdowns below `NOISE_FLOOR` seconds are ignored).
+    """
+    previous = {(b["sorter"], b["distribution"], b["size"]): b for b in baseline}
+    regressions = []
+    for result in results:
+        label = f"{result.sorter} / {result.distribution} / N={result.size}"
+        before = previous.get((result.sorter, result.distribution, result.size))
+        if before is None:
+            regressions.append(f"{label}: not in the baseline")
+            continue
+
+        if (time_threshold is not None
+                and result.seconds > before["seconds"] * (1 + time_threshold)
+                and result.seconds - before["seconds"] > NOISE_FLOOR):
+            regressions.append(f"{label}: {before['seconds'] * 1e3:.3f} ms -> {result.seconds * 1e3:.3f} ms")
+        for counter in ("comparisons", "moves"):
+            now, then = getattr(result, counter), before.get(counter)
+            if now is not None and then is not None and now > then * (1 + threshold):
+                regressions.append(f"{label}: {then} -> {now} {counter}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS), choices=list(DISTRIBUTIONS))
+    parser.add_argument("--sorters", nargs="+", default=list(SORTERS), choices=list(SORTERS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results as JSON to this file ('-' for stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.0,
+                        help="allowed relative increase in comparisons or moves (default 0)")
+    parser.add_argument("--time-threshold", type=float,
+                        help="also fail on a relative slowdown larger than this")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in SIZES if size <= args.max_size]
+    log = (lambda line: print(line, file=sys.stderr)) if args.output == "-" else print
+    results = run(sizes, args.distributions, args.sorters, args.repeat, log)
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": [asdict(result) for result in results],
+        }
+        if args.output == "-":
+            json.dump(report, sys.stdout, indent=2)
+        else:
+            with open(args.output, "w") as file:
+                json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file)["results"], args.threshold, args.time_threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against the baseline.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
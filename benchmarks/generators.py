@@ -0,0 +1,92 @@
+"""
+Input distributions for the sorting benchmarks, including adversarial ones.
+
+Every generator takes the size and a seeded `random.Random` and returns a
+new list of ints.
+"""
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+from algo.sort import quickSort
+
+def randomInts(n: int, rng: random.Random) -> List[int]:
+    """Uniform random ints over a range much wider than n."""
+    return [rng.randrange(n * 16 + 1) for _ in range(n)]
+
+def sortedInts(n: int, rng: random.Random) -> List[int]:
+    return list(range(n))
+
+def reversedInts(n: int, rng: random.Random) -> List[int]:
+    return list(range(n, 0, -1))
+
+def organPipe(n: int, rng: random.Random) -> List[int]:
+    """Ascending to the middle, then descending: 0 1 2 ... 2 1 0."""
+    half = (n + 1) // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+def fewUnique(n: int, rng: random.Random) -> List[int]:
+    """Only 8 distinct values, so most comparisons are between equal keys."""
+    return [rng.randrange(8) for _ in range(n)]
+
+def sawtooth(n: int, rng: random.Random) -> List[int]:
+    """Repeated ascending ramps, i.e. about sqrt(N) presorted runs."""
+    period = max(1, int(n ** 0.5))
+    return [i % period for i in range(n)]
+
+def mcilroyKiller(n: int, rng: random.Random, sorter: Optional[Callable[[List[Any]], Any]] = None) -> List[int]:
+    """
+    Builds the input that drives `sorter` (by default `quickSort`) to its worst
+    case, following M. D. McIlroy's "A Killer Adversary for Quicksort".
+
+    All values start as "gas" and are frozen to increasing "solid" values
+    lazily: when two gas elements are compared, the current pivot candidate
+    is frozen, so it ends up small and the partition around it lopsided.
+    Replaying the frozen values is then adversarial for the same pivot rule.
+    (quickSort's heap sort fallback keeps it O(N * log(N)) anyway.)
+    """
+    if sorter is None:
+        sorter = lambda lst: quickSort(lst, 0, len(lst) - 1)
+
+    gas = n
+    values = [gas] * n
+    state = {"solid": 0, "candidate": 0}
+
+    def compare(x: int, y: int) -> int:
+        if values[x] == gas and values[y] == gas:
+            frozen = x if x == state["candidate"] else y
+            values[frozen] = state["solid"]
+            state["solid"] += 1
+        if values[x] == gas:
+            state["candidate"] = x
+        elif values[y] == gas:
+            state["candidate"] = y
+        return values[x] - values[y]
+
+    class Probe:
+        __slots__ = ("index",)
+
+        def __init__(self, index: int) -> None:
+            self.index = index
+
+        def __lt__(self, other: "Probe") -> bool:
+            return compare(self.index, other.index) < 0
+
+        def __gt__(self, other: "Probe") -> bool:
+            return compare(self.index, other.index) > 0
+
+    sorter([Probe(i) for i in range(n)])
+    return values
+
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[int]]] = {
+    "random": randomInts,
+    "sorted": sortedInts,
+    "reversed": reversedInts,
+    "organ-pipe": organPipe,
+    "few-unique": fewUnique,
+    "sawtooth": sawtooth,
+    "mcilroy-killer": mcilroyKiller,
+}
+
+def generate(distribution: str, n: int, seed: int = 0) -> List[int]:
+    """Generates `n` values from the named distribution."""
+    return DISTRIBUTIONS[distribution](n, random.Random(seed))
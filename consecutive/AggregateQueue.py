@@ -0,0 +1,247 @@
+from collections import deque
+from itertools import chain
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from .Queue import Queue
+
+T = TypeVar('T')
+
+class MonotonicQueue(Queue[T]):
+    """
+    A Queue that also answers min() and max() in O(1), for sliding windows.
+
+    Next to the elements it keeps two monotonic deques: the candidates for the
+    minimum in increasing order and those for the maximum in decreasing order.
+    A pushed element evicts the candidates it beats (they leave the window
+    before it does), so every element enters and leaves each deque at most
+    once: amortized O(1) per operation. Candidates carry the sequence number
+    of their push, and a pop matches them by that number rather than by
+    value, which keeps duplicates and unordered values such as NaN in step.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        # (sequence number, element) pairs.
+        self._mins: deque[Tuple[int, T]] = deque()
+        self._maxs: deque[Tuple[int, T]] = deque()
+        self._pushed = 0
+        self._popped = 0
+
+    def push(self, val: T) -> None:
+        """Adds an element to the back of the queue."""
+        self._container.appendleft(val)
+        entry = (self._pushed, val)
+        self._pushed += 1
+        mins, maxs = self._mins, self._maxs
+        while mins and val < mins[-1][1]:
+            mins.pop()
+        mins.append(entry)
+        while maxs and maxs[-1][1] < val:
+            maxs.pop()
+        maxs.append(entry)
+
+    def pop(self) -> T:
+        """
+        Removes and returns the element from the front of the queue.
+        Raises IndexError if the queue is empty.
+        """
+        val = self._container.pop()
+        seq = self._popped
+        self._popped += 1
+        if self._mins[0][0] == seq:
+            self._mins.popleft()
+        if self._maxs[0][0] == seq:
+            self._maxs.popleft()
+        return val
+
+    def push_many(self, iterable: Iterable[T]) -> None:
+        """Adds all elements of an iterable to the back of the queue, in order."""
+        for val in iterable:
+            self.push(val)
+
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Removes and returns up to n elements from the front of the queue,
+        in the order successive pop() calls would return them.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return [self.pop() for _ in range(min(n, len(self._container)))]
+
+    def drain(self) -> List[T]:
+        """Removes and returns all elements, front first."""
+        self._mins.clear()
+        self._maxs.clear()
+        self._popped = self._pushed
+        return super().drain()
+
+    def min(self) -> T:
+        """Returns the smallest element. Raises IndexError if the queue is empty."""
+        if not self._mins:
+            raise IndexError("min() of an empty MonotonicQueue")
+        return self._mins[0][1]
+
+    def max(self) -> T:
+        """Returns the largest element. Raises IndexError if the queue is empty."""
+        if not self._maxs:
+            raise IndexError("max() of an empty MonotonicQueue")
+        return self._maxs[0][1]
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the MonotonicQueue object."""
+        return f"MonotonicQueue({self._container})"
+
+class AggregateQueue(Generic[T]):
+    """
+    A FIFO queue that folds its elements with any associative operation
+    (sum, gcd, min, matrix product, ...) in amortized O(1).
+
+    The queue is made of two stacks. New elements go onto the back stack,
+    whose fold is kept as a running value. Pops come from the front stack,
+    whose entries each carry the fold of themselves and everything behind
+    them in that stack; when it runs empty the back stack is moved over
+    once, recomputing those folds. The fold of the queue combines the front
+    stack's top entry with the back stack's running value. The operation
+    need not be commutative: elements are always combined front to back.
+    """
+    def __init__(self, op: Callable[[Any, Any], Any], identity: Any = None) -> None:
+        """
+        Initializes an empty queue folding with `op`; `identity` is what
+        aggregate() returns for an empty queue (None means raise IndexError).
+        """
+        self._op = op
+        self._identity = identity
+        self._front: deque[Tuple[T, Any]] = deque()  # (element, fold from it to the back of _front)
+        self._back: deque[T] = deque()
+        self._back_fold: Any = None
+
+    def push(self, val: T) -> None:
+        """Adds an element to the back of the queue."""
+        self._back_fold = self._op(self._back_fold, val) if self._back else val
+        self._back.append(val)
+
+    def pop(self) -> T:
+        """
+        Removes and returns the element from the front of the queue.
+        Raises IndexError if the queue is empty.
+        """
+        if not self._front:
+            if not self._back:
+                raise IndexError("pop from an empty AggregateQueue")
+            self._transfer()
+        return self._front.pop()[0]
+
+    def aggregate(self) -> Any:
+        """
+        Returns op folded over the elements from front to back.
+        Raises IndexError if the queue is empty and no identity was given.
+        """
+        if self._front and self._back:
+            return self._op(self._front[-1][1], self._back_fold)
+        if self._front:
+            return self._front[-1][1]
+        if self._back:
+            return self._back_fold
+        if self._identity is None:
+            raise IndexError("aggregate() of an empty AggregateQueue")
+        return self._identity
+
+    def _transfer(self) -> None:
+        op, front, back = self._op, self._front, self._back
+        val = back.pop()
+        fold = val
+        front.append((val, fold))
+        while back:
+            val = back.pop()
+            fold = op(val, fold)
+            front.append((val, fold))
+        self._back_fold = None
+
+    def __iter__(self) -> Iterator[T]:
+        """Returns an iterator over the elements, front first."""
+        return chain((val for val, _ in reversed(self._front)), self._back)
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue."""
+        return len(self._front) + len(self._back)
+
+    def __bool__(self) -> bool:
+        """Returns True if the queue is not empty, False otherwise."""
+        return bool(self._front or self._back)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the AggregateQueue object."""
+        return f"AggregateQueue({list(self)})"
+
+
+def test_aggregate_queue():
+    """
+    Tests MonotonicQueue and AggregateQueue using assertions.
+    Prints a success message only if all tests pass.
+    """
+    import math
+    import random
+    from functools import reduce
+    rng = random.Random(19)
+    values = [rng.randint(0, 50) for _ in range(2000)]
+
+    # 1. Sliding window minimum and maximum
+    window = MonotonicQueue[int]()
+    for i, val in enumerate(values):
+        window.push(val)
+        if len(window) > 25:
+            assert window.pop() == values[i - 25]
+        current = values[max(0, i - 24):i + 1]
+        assert window.min() == min(current) and window.max() == max(current)
+    assert str(window).startswith("Queue -> (") and len(window) == 25
+    window.push_many([-1, 99])
+    assert window.min() == -1 and window.max() == 99
+    assert window.pop_many(2) == values[-25:-23]
+    assert window.drain()[-1] == 99
+    for operation in (window.min, window.max, window.pop):
+        try:
+            operation()
+            assert False, "IndexError was not raised on an empty MonotonicQueue"
+        except IndexError:
+            pass
+
+    # A NaN that left the window no longer shows up in min() or max()
+    window.push(float("nan"))
+    window.push(5.0)
+    window.pop()
+    assert window.min() == 5.0 and window.max() == 5.0
+    window.drain()
+    window.push(1.0)
+    assert window.pop() == 1.0 and not window
+
+    # 2. Sliding window sum and gcd
+    for op, identity in ((lambda a, b: a + b, 0), (math.gcd, 0)):
+        q = AggregateQueue[int](op, identity)
+        assert q.aggregate() == identity
+        for i, val in enumerate(values[:500]):
+            q.push(val)
+            if len(q) > 10:
+                assert q.pop() == values[i - 10]
+            assert q.aggregate() == reduce(op, values[max(0, i - 9):i + 1])
+
+    # 3. A non-commutative operation is folded front to back
+    words = AggregateQueue[str](lambda a, b: a + b)
+    for word in "the quick brown fox".split():
+        words.push(word)
+    assert words.pop() == "the"
+    words.push("jumps")
+    assert words.aggregate() == "quickbrownfoxjumps"
+    assert list(words) == ["quick", "brown", "fox", "jumps"]
+    assert repr(words) == "AggregateQueue(['quick', 'brown', 'fox', 'jumps'])"
+    while words:
+        words.pop()
+    try:
+        words.aggregate()
+        assert False, "IndexError was not raised for aggregate() without an identity"
+    except IndexError:
+        pass
+
+    print("All tests passed -> AggregateQueue -> ! :)")
+
+
+if __name__ == "__main__":
+    test_aggregate_queue()
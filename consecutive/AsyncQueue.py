@@ -0,0 +1,235 @@
+import asyncio
+from collections import deque
+from itertools import islice, repeat, starmap
+from typing import Iterable, List, Optional, TypeVar
+
+from .Queue import Queue
+
+T = TypeVar('T')
+
+class AsyncQueue(Queue[T]):
+    """
+    A FIFO queue for asyncio code, with an optional capacity.
+
+    `await push()` suspends the calling task while the queue is full and
+    `await pop()` while it is empty; the other side wakes exactly one waiter.
+    When an operation can go ahead it completes without suspending. A
+    `maxsize` of 0 or less means unbounded. Not thread-safe: use it from the
+    tasks of one event loop.
+    """
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initializes an empty queue holding at most `maxsize` items."""
+        super().__init__()
+        self.maxsize = maxsize
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+
+    async def push(self, val: T, timeout: Optional[float] = None) -> None:
+        """
+        Adds an element to the back of the queue, waiting for room if it is full.
+        Raises asyncio.QueueFull if no room appeared within `timeout` seconds.
+        """
+        deadline = _deadline(timeout)
+        while self.full():
+            await self._wait(self._putters, deadline, asyncio.QueueFull)
+        self.push_nowait(val)
+
+    async def pop(self, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns the front element, waiting for one if the queue is empty.
+        Raises asyncio.QueueEmpty if none arrived within `timeout` seconds.
+        """
+        deadline = _deadline(timeout)
+        while not self._container:
+            await self._wait(self._getters, deadline, asyncio.QueueEmpty)
+        return self.pop_nowait()
+
+    def push_nowait(self, val: T) -> None:
+        """Adds an element without waiting. Raises asyncio.QueueFull if the queue is full."""
+        if self.full():
+            raise asyncio.QueueFull
+        self._container.appendleft(val)
+        self._wake_next(self._getters)
+
+    def pop_nowait(self) -> T:
+        """Removes and returns the front element without waiting. Raises asyncio.QueueEmpty if empty."""
+        if not self._container:
+            raise asyncio.QueueEmpty
+        val = self._container.pop()
+        self._wake_next(self._putters)
+        return val
+
+    async def push_many(self, iterable: Iterable[T], timeout: Optional[float] = None) -> None:
+        """
+        Adds all elements of an iterable to the back of the queue, in order, one
+        bulk extend per stretch of free room. Raises asyncio.QueueFull if room ran
+        out within `timeout` seconds; the elements pushed until then stay queued.
+        """
+        items = iter(iterable)
+        deadline = _deadline(timeout)
+        if self.maxsize <= 0:
+            before = len(self._container)
+            self._container.extendleft(items)
+            self._wake_many(self._getters, len(self._container) - before)
+            return
+
+        # Only wait for room once the next element is known to exist.
+        for val in items:
+            while self.full():
+                await self._wait(self._putters, deadline, asyncio.QueueFull)
+            before = len(self._container)
+            self._container.appendleft(val)
+            self._container.extendleft(islice(items, self.maxsize - before - 1))
+            self._wake_many(self._getters, len(self._container) - before)
+
+    async def pop_many(self, n: int, timeout: Optional[float] = None) -> List[T]:
+        """
+        Removes and returns up to n elements from the front of the queue, waiting
+        until at least one is available. Raises asyncio.QueueEmpty if none arrived.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        deadline = _deadline(timeout)
+        while not self._container and n:
+            await self._wait(self._getters, deadline, asyncio.QueueEmpty)
+        items = list(starmap(self._container.pop, repeat((), min(n, len(self._container)))))
+        self._wake_many(self._putters, len(items))
+        return items
+
+    def drain(self) -> List[T]:
+        """Removes and returns all elements, front first, without waiting."""
+        items = super().drain()
+        self._wake_many(self._putters, len(items))
+        return items
+
+    def full(self) -> bool:
+        """Returns True if the queue holds `maxsize` items."""
+        return 0 < self.maxsize <= len(self._container)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the AsyncQueue object."""
+        return f"AsyncQueue({self._container}, maxsize={self.maxsize})"
+
+    async def _wait(self, waiters: deque, deadline: Optional[float], error: type) -> None:
+        """Parks the current task in `waiters` until woken, or raises `error` at the deadline."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters.append(future)
+        try:
+            if deadline is None:
+                await future
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise error
+                try:
+                    await asyncio.wait_for(future, remaining)
+                except asyncio.TimeoutError:
+                    raise error from None
+        except BaseException:
+            future.cancel()
+            try:
+                waiters.remove(future)
+            except ValueError:
+                # Already woken: hand the wake-up on to the next waiter.
+                self._wake_next(waiters)
+            raise
+
+    @staticmethod
+    def _wake_next(waiters: deque) -> None:
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+
+    @classmethod
+    def _wake_many(cls, waiters: deque, count: int) -> None:
+        for _ in range(min(count, len(waiters))):
+            cls._wake_next(waiters)
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    if timeout is None:
+        return None
+    if timeout < 0:
+        raise ValueError("'timeout' must be a non-negative number")
+    return asyncio.get_running_loop().time() + timeout
+
+
+def test_async_queue():
+    """
+    Tests all functionalities of the AsyncQueue class using assertions.
+    Prints a success message only if all tests pass.
+    """
+    async def scenario() -> None:
+        # 1. FIFO order and the Queue interface
+        q = AsyncQueue[int](maxsize=2)
+        await q.push(1)
+        q.push_nowait(2)
+        assert len(q) == 2 and q.full()
+        assert str(q) == "Queue -> (1, 2) ->"
+        assert repr(q) == "AsyncQueue(deque([2, 1]), maxsize=2)"
+
+        # 2. Full and empty queues refuse, with or without a timeout
+        try:
+            q.push_nowait(3)
+            assert False, "QueueFull was not raised for push_nowait() on a full queue"
+        except asyncio.QueueFull:
+            pass
+        try:
+            await q.push(3, timeout=0.01)
+            assert False, "QueueFull was not raised for push() on a full queue"
+        except asyncio.QueueFull:
+            pass
+        assert await q.pop() == 1
+        assert q.pop_nowait() == 2
+        try:
+            await q.pop(timeout=0.01)
+            assert False, "QueueEmpty was not raised for pop() on an empty queue"
+        except asyncio.QueueEmpty:
+            pass
+        assert not q._getters and not q._putters
+
+        # 3. A producer task blocking on the capacity and a consumer task
+        async def produce() -> None:
+            for i in range(1000):
+                await q.push(i)
+                assert len(q) <= 2
+
+        async def consume() -> list:
+            return [await q.pop() for _ in range(1000)]
+
+        _, received = await asyncio.gather(produce(), consume())
+        assert received == list(range(1000))
+
+        # 4. Batches, the producer waiting whenever the capacity is reached
+        async def consume_batches() -> list:
+            batches = []
+            while sum(map(len, batches)) < 1000:
+                batches.append(await q.pop_many(3))
+            return batches
+
+        _, batches = await asyncio.gather(q.push_many(range(1000)), consume_batches())
+        assert [x for batch in batches for x in batch] == list(range(1000))
+        assert all(1 <= len(batch) <= 2 for batch in batches)
+        await q.push_many([1, 2])
+        try:
+            await q.push_many([3], timeout=0)
+            assert False, "QueueFull was not raised for push_many() on a full queue"
+        except asyncio.QueueFull:
+            pass
+        assert q.drain() == [1, 2] and q.drain() == []
+
+        # 5. A cancelled waiter does not swallow an element
+        waiter = asyncio.ensure_future(q.pop())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await q.push(42)
+        assert await q.pop() == 42
+
+    asyncio.run(scenario())
+    print("All tests passed -> AsyncQueue -> ! :)")
+
+
+if __name__ == "__main__":
+    test_async_queue()
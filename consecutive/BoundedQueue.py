@@ -0,0 +1,325 @@
+import threading
+import time
+from itertools import islice, repeat, starmap
+from queue import Empty, Full
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from .Queue import Queue
+
+T = TypeVar('T')
+
+# Longest pause of the SPSCQueue spin-wait between two checks, in seconds.
+SPIN_MAX_SLEEP = 0.001
+
+class BoundedQueue(Queue[T]):
+    """
+    A thread-safe FIFO queue with an optional capacity and blocking operations.
+
+    `push` blocks while the queue is full and `pop` while it is empty, both on
+    condition variables (no busy polling), optionally up to a timeout. Like
+    the standard library's `queue.Queue` they raise `queue.Full` and
+    `queue.Empty` when they give up. A `maxsize` of 0 or less means unbounded.
+    """
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initializes an empty queue holding at most `maxsize` items."""
+        super().__init__()
+        self.maxsize = maxsize
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+
+    def push(self, val: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds an element to the back of the queue, waiting for room if it is full.
+        Raises queue.Full if no room appeared (at once when `block` is False).
+        """
+        with self._not_full:
+            if 0 < self.maxsize <= len(self._container):
+                _check_timeout(timeout)
+                if not block or not self._not_full.wait_for(lambda: not self.full(), timeout):
+                    raise Full
+            self._container.appendleft(val)
+            self._not_empty.notify()
+
+    def pop(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns the front element, waiting for one if the queue is empty.
+        Raises queue.Empty if none arrived (at once when `block` is False).
+        """
+        with self._not_empty:
+            if not self._container:
+                _check_timeout(timeout)
+                if not block or not self._not_empty.wait_for(lambda: self._container, timeout):
+                    raise Empty
+            val = self._container.pop()
+            self._not_full.notify()
+            return val
+
+    def push_many(self, iterable: Iterable[T], block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds all elements of an iterable to the back of the queue, in order,
+        taking the lock once per stretch of free room rather than per element.
+        Raises queue.Full if room ran out; the elements pushed until then stay queued.
+        """
+        items = iter(iterable)
+        deadline = _deadline(timeout)
+        with self._not_full:
+            if self.maxsize <= 0:
+                before = len(self._container)
+                self._container.extendleft(items)
+                self._not_empty.notify(len(self._container) - before)
+                return
+
+            # Only wait for room once the next element is known to exist.
+            for val in items:
+                if self.full():
+                    if not block or not self._not_full.wait_for(lambda: not self.full(), _remaining(deadline)):
+                        raise Full
+                before = len(self._container)
+                self._container.appendleft(val)
+                self._container.extendleft(islice(items, self.maxsize - before - 1))
+                self._not_empty.notify(len(self._container) - before)
+
+    def pop_many(self, n: int, block: bool = True, timeout: Optional[float] = None) -> List[T]:
+        """
+        Removes and returns up to n elements from the front of the queue, waiting
+        until at least one is available. Raises queue.Empty if none arrived.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        with self._not_empty:
+            if not self._container and n:
+                _check_timeout(timeout)
+                if not block or not self._not_empty.wait_for(lambda: self._container, timeout):
+                    raise Empty
+            items = list(starmap(self._container.pop, repeat((), min(n, len(self._container)))))
+            self._not_full.notify(len(items))
+            return items
+
+    def drain(self) -> List[T]:
+        """Removes and returns all elements, front first, without waiting."""
+        with self._mutex:
+            items = list(reversed(self._container))
+            self._container.clear()
+            self._not_full.notify_all()
+            return items
+
+    def full(self) -> bool:
+        """Returns True if the queue holds `maxsize` items."""
+        return 0 < self.maxsize <= len(self._container)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the BoundedQueue object."""
+        return f"BoundedQueue({self._container}, maxsize={self.maxsize})"
+
+class SPSCQueue(Queue[T]):
+    """
+    A lock-free bounded FIFO queue for exactly one producer and one consumer thread.
+
+    Appending to and popping from a deque are atomic, so with a single thread
+    on each end no lock is needed: only the producer makes the queue grow and
+    only the consumer makes it shrink, so a "has room" or "has items" check
+    stays true until the same thread acts on it. Operations that can go ahead
+    cost about as much as on a plain `Queue`; waiting is a spin with an
+    exponential back-off of at most SPIN_MAX_SLEEP seconds.
+    """
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initializes an empty queue holding at most `maxsize` items."""
+        super().__init__()
+        self.maxsize = maxsize
+
+    def push(self, val: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds an element to the back of the queue, waiting for room if it is full.
+        Raises queue.Full if no room appeared (at once when `block` is False).
+        """
+        if self.full():
+            _spin_until(lambda: not self.full(), block, timeout, Full)
+        self._container.appendleft(val)
+
+    def pop(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns the front element, waiting for one if the queue is empty.
+        Raises queue.Empty if none arrived (at once when `block` is False).
+        """
+        try:
+            return self._container.pop()
+        except IndexError:
+            _spin_until(lambda: self._container, block, timeout, Empty)
+            return self._container.pop()
+
+    def push_many(self, iterable: Iterable[T], block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds all elements of an iterable to the back of the queue, in order,
+        one bulk extend per stretch of free room.
+        Raises queue.Full if room ran out; the elements pushed until then stay queued.
+        """
+        if self.maxsize <= 0:
+            self._container.extendleft(iterable)
+            return
+
+        items = iter(iterable)
+        deadline = _deadline(timeout)
+        # Only wait for room once the next element is known to exist.
+        for val in items:
+            if self.full():
+                _spin_until(lambda: not self.full(), block, _remaining(deadline), Full)
+            # Only this thread makes the queue grow, so the room can only get larger.
+            room = self.maxsize - len(self._container)
+            self._container.appendleft(val)
+            self._container.extendleft(islice(items, room - 1))
+
+    def pop_many(self, n: int, block: bool = True, timeout: Optional[float] = None) -> List[T]:
+        """
+        Removes and returns up to n elements from the front of the queue, waiting
+        until at least one is available. Raises queue.Empty if none arrived.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if not self._container and n:
+            _spin_until(lambda: self._container, block, timeout, Empty)
+        return list(starmap(self._container.pop, repeat((), min(n, len(self._container)))))
+
+    def drain(self) -> List[T]:
+        """Removes and returns all elements, front first, without waiting."""
+        return list(starmap(self._container.pop, repeat((), len(self._container))))
+
+    def full(self) -> bool:
+        """Returns True if the queue holds `maxsize` items."""
+        return 0 < self.maxsize <= len(self._container)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the SPSCQueue object."""
+        return f"SPSCQueue({self._container}, maxsize={self.maxsize})"
+
+def _check_timeout(timeout: Optional[float]) -> None:
+    if timeout is not None and timeout < 0:
+        raise ValueError("'timeout' must be a non-negative number")
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    _check_timeout(timeout)
+    return None if timeout is None else time.monotonic() + timeout
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+def _spin_until(ready: Callable[[], object], block: bool, timeout: Optional[float],
+                error: type) -> None:
+    """Waits until ready() is true, or raises `error` once the timeout has passed."""
+    _check_timeout(timeout)
+    if not block:
+        if not ready():
+            raise error
+        return
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pause = 0.0
+    while not ready():
+        if deadline is not None and time.monotonic() >= deadline:
+            raise error
+        # The first rounds only yield the GIL, then back off exponentially.
+        time.sleep(pause)
+        pause = min(SPIN_MAX_SLEEP, pause * 2 or 1e-6)
+
+
+def test_bounded_queue():
+    """
+    Tests BoundedQueue and SPSCQueue using assertions.
+    Prints a success message only if all tests pass.
+    """
+    for cls in (BoundedQueue, SPSCQueue):
+        # 1. FIFO order and the Queue interface
+        q = cls[int](maxsize=2)
+        q.push(1)
+        q.push(2)
+        assert len(q) == 2 and q.full()
+        assert str(q) == "Queue -> (1, 2) ->"
+        assert 2 in q
+
+        # 2. A full queue refuses, with or without a timeout
+        for kwargs in ({"block": False}, {"timeout": 0.01}):
+            try:
+                q.push(3, **kwargs)
+                assert False, "queue.Full was not raised for push() on a full queue"
+            except Full:
+                pass
+        assert q.pop() == 1 and q.pop() == 2
+
+        # 3. An empty queue refuses, with or without a timeout
+        for kwargs in ({"block": False}, {"timeout": 0.01}):
+            try:
+                q.pop(**kwargs)
+                assert False, "queue.Empty was not raised for pop() on an empty queue"
+            except Empty:
+                pass
+
+        # 4. A producer and a consumer thread, the producer blocking on the capacity
+        received = []
+
+        def consume() -> None:
+            for _ in range(1000):
+                received.append(q.pop(timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(1000):
+            q.push(i, timeout=5)
+            assert len(q) <= 2
+        consumer.join()
+        assert received == list(range(1000))
+        assert not q
+
+        # 5. Batches, the producer blocking whenever the capacity is reached
+        batches = []
+
+        def consume_batches() -> None:
+            while sum(map(len, batches)) < 1000:
+                batches.append(q.pop_many(3, timeout=5))
+
+        consumer = threading.Thread(target=consume_batches)
+        consumer.start()
+        q.push_many(range(1000), timeout=5)
+        consumer.join()
+        assert [x for batch in batches for x in batch] == list(range(1000))
+        assert all(1 <= len(batch) <= 2 for batch in batches)
+
+        q.push_many([1, 2])
+        try:
+            q.push_many([3], block=False)
+            assert False, "queue.Full was not raised for push_many() on a full queue"
+        except Full:
+            pass
+        assert q.drain() == [1, 2] and q.drain() == []
+        try:
+            q.pop_many(2, timeout=0.01)
+            assert False, "queue.Empty was not raised for pop_many() on an empty queue"
+        except Empty:
+            pass
+
+    assert repr(BoundedQueue[int](3)) == "BoundedQueue(deque([]), maxsize=3)"
+
+    # 6. Several producers and consumers on one BoundedQueue
+    q = BoundedQueue[int](maxsize=4)
+    results = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(500):
+            val = q.pop()
+            with lock:
+                results.append(val)
+
+    consumers = [threading.Thread(target=worker) for _ in range(2)]
+    producers = [threading.Thread(target=lambda start=start: [q.push(v) for v in range(start, start + 500)])
+                 for start in (0, 500)]
+    for thread in consumers + producers:
+        thread.start()
+    for thread in consumers + producers:
+        thread.join()
+    assert sorted(results) == list(range(1000))
+
+    print("All tests passed -> BoundedQueue -> ! :)")
+
+
+if __name__ == "__main__":
+    test_bounded_queue()
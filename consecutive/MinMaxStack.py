@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Iterable, List, Tuple, TypeVar
+
+from .Stack import Stack
+
+T = TypeVar('T')
+
+class MinMaxStack(Stack[T]):
+    """
+    A Stack that also answers min() and max() in O(1).
+
+    Two auxiliary stacks hold the running minima and maxima: a pushed item
+    goes onto the minima stack, together with its position in the stack, if
+    it is not greater than the current minimum, and popping the item at that
+    position pops it from there again; the same for the maxima. Matching by
+    position rather than by value keeps duplicates and unordered values
+    such as NaN in step.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        # (item, position in the stack) pairs.
+        self._mins: deque[Tuple[T, int]] = deque()
+        self._maxs: deque[Tuple[T, int]] = deque()
+
+    def push(self, item: T) -> None:
+        """Adds an item to the top of the stack."""
+        position = len(self._container)
+        self._container.append(item)
+        if not self._mins or not self._mins[-1][0] < item:
+            self._mins.append((item, position))
+        if not self._maxs or not item < self._maxs[-1][0]:
+            self._maxs.append((item, position))
+
+    def pop(self) -> T:
+        """
+        Removes and returns the item from the top of the stack.
+        Raises IndexError if the stack is empty.
+        """
+        item = self._container.pop()
+        position = len(self._container)
+        if self._mins[-1][1] == position:
+            self._mins.pop()
+        if self._maxs[-1][1] == position:
+            self._maxs.pop()
+        return item
+
+    def push_many(self, iterable: Iterable[T]) -> None:
+        """Pushes all items of an iterable in order; the last one ends up on top."""
+        for item in iterable:
+            self.push(item)
+
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Removes and returns up to n items from the top of the stack,
+        in the order successive pop() calls would return them.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return [self.pop() for _ in range(min(n, len(self._container)))]
+
+    def drain(self) -> List[T]:
+        """Removes and returns all items, top first."""
+        self._mins.clear()
+        self._maxs.clear()
+        return super().drain()
+
+    def min(self) -> T:
+        """Returns the smallest item. Raises IndexError if the stack is empty."""
+        if not self._mins:
+            raise IndexError("min() of an empty MinMaxStack")
+        return self._mins[-1][0]
+
+    def max(self) -> T:
+        """Returns the largest item. Raises IndexError if the stack is empty."""
+        if not self._maxs:
+            raise IndexError("max() of an empty MinMaxStack")
+        return self._maxs[-1][0]
+
+    def __repr__(self) -> str:
+        """Provides an unambiguous string representation of the stack, bottom to top."""
+        return f"MinMaxStack({self._container})"
+
+
+def test_min_max_stack():
+    """
+    Tests all functionalities of the MinMaxStack class using assertions.
+    Prints a success message only if all tests pass.
+    """
+    import random
+    rng = random.Random(19)
+
+    stack = MinMaxStack[int]()
+    reference: List[int] = []
+    for _ in range(2000):
+        if reference and rng.random() < 0.45:
+            assert stack.pop() == reference.pop()
+        else:
+            item = rng.randint(0, 20)  # many duplicates
+            stack.push(item)
+            reference.append(item)
+        if reference:
+            assert stack.min() == min(reference) and stack.max() == max(reference)
+        assert len(stack) == len(reference)
+
+    stack.push_many([-5, 100, 7])
+    assert stack.min() == -5 and stack.max() == 100
+    assert stack.pop_many(2) == [7, 100]
+    assert stack.max() == max(reference + [-5])
+    assert stack.drain()[0] == -5
+    assert not stack
+
+    for operation in (stack.min, stack.max, stack.pop):
+        try:
+            operation()
+            assert False, "IndexError was not raised on an empty MinMaxStack"
+        except IndexError:
+            pass
+
+    # A popped NaN leaves the aggregates of what is below it
+    stack.push_many([2.0, 5.0])
+    stack.push(float("nan"))
+    stack.pop()
+    assert stack.min() == 2.0 and stack.max() == 5.0
+    stack.drain()
+
+    stack.push(3)
+    assert str(stack) == "Stack[3 ->" and repr(stack) == "MinMaxStack(deque([3]))"
+
+    print("All tests passed -> MinMaxStack -> ! :)")
+
+
+if __name__ == "__main__":
+    test_min_max_stack()
@@ -0,0 +1,208 @@
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# A version of the stack is a chain of immutable (item, rest) cells ending in None.
+_Cell = Optional[Tuple[Any, Any]]
+
+class PersistentStack(Generic[T]):
+    """
+    An immutable Last-In-First-Out (LIFO) stack with structural sharing.
+
+    `push` and `pop` return a new version in O(1) and leave the old one
+    untouched: versions share their common bottom part, a chain of immutable
+    cells. Keeping a version around is therefore an O(1) checkpoint, e.g. for
+    undo or speculative execution. Use `transient()` to build or edit a stack
+    in bulk without creating a version per operation.
+    """
+    __slots__ = ("_top", "_len")
+
+    def __init__(self, iterable: Optional[Iterable[T]] = None) -> None:
+        """Initializes a stack by pushing the items of `iterable` in order."""
+        top: _Cell = None
+        size = 0
+        if iterable is not None:
+            for item in iterable:
+                top = (item, top)
+                size += 1
+        self._top = top
+        self._len = size
+
+    @classmethod
+    def _make(cls, top: _Cell, size: int) -> "PersistentStack[T]":
+        stack = cls.__new__(cls)
+        stack._top = top
+        stack._len = size
+        return stack
+
+    def push(self, item: T) -> "PersistentStack[T]":
+        """Returns a new version with item on top. Time Complexity: O(1)"""
+        return self._make((item, self._top), self._len + 1)
+
+    def pop(self) -> "PersistentStack[T]":
+        """
+        Returns a new version without the top item. Time Complexity: O(1)
+        Raises IndexError if the stack is empty.
+        """
+        if self._top is None:
+            raise IndexError("pop from an empty PersistentStack")
+        return self._make(self._top[1], self._len - 1)
+
+    def peek(self) -> T:
+        """Returns the top item. Raises IndexError if the stack is empty."""
+        if self._top is None:
+            raise IndexError("peek at an empty PersistentStack")
+        return self._top[0]
+
+    def transient(self) -> "TransientStack[T]":
+        """Returns a mutable builder starting from this version. Time Complexity: O(1)"""
+        return TransientStack(self)
+
+    def _items_top_first(self) -> Iterator[T]:
+        cell = self._top
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1]
+
+    def __iter__(self) -> Iterator[T]:
+        """Provides an iterator from bottom to top of the stack, like Stack."""
+        return reversed(list(self._items_top_first()))
+
+    def __reversed__(self) -> Iterator[T]:
+        """Provides an iterator from top to bottom of the stack, without copying."""
+        return self._items_top_first()
+
+    def __len__(self) -> int:
+        """Returns the number of items in the stack."""
+        return self._len
+
+    def __bool__(self) -> bool:
+        """Returns True if the stack is not empty, False otherwise."""
+        return self._top is not None
+
+    def __contains__(self, item: T) -> bool:
+        """Checks if an item is in the stack."""
+        return any(val == item for val in self._items_top_first())
+
+    def __repr__(self) -> str:
+        """Provides an unambiguous string representation of the stack, bottom to top."""
+        return f"PersistentStack({list(self)})"
+
+    def __str__(self) -> str:
+        """Provides a user-friendly string representation of the stack, e.g. PersistentStack[a, b, c ->"""
+        return f"PersistentStack[{', '.join(map(str, self))} ->" if self else "PersistentStack[ ->"
+
+class TransientStack(Generic[T]):
+    """
+    A mutable builder for PersistentStack.
+
+    It edits its own pointer to the chain of cells in place, so bulk pushes
+    and pops allocate no intermediate versions; `persistent()` snapshots the
+    current contents as a PersistentStack in O(1). The cells are immutable, so
+    the builder can go on being used after a snapshot without affecting it.
+    """
+    __slots__ = ("_top", "_len")
+
+    def __init__(self, base: Optional[PersistentStack[T]] = None) -> None:
+        """Initializes a builder holding the items of `base` (or nothing)."""
+        self._top: _Cell = None if base is None else base._top
+        self._len = 0 if base is None else base._len
+
+    def push(self, item: T) -> None:
+        """Adds an item to the top of the stack."""
+        self._top = (item, self._top)
+        self._len += 1
+
+    def push_many(self, iterable: Iterable[T]) -> None:
+        """Pushes all items of an iterable in order; the last one ends up on top."""
+        top, size = self._top, self._len
+        for item in iterable:
+            top = (item, top)
+            size += 1
+        self._top, self._len = top, size
+
+    def pop(self) -> T:
+        """
+        Removes and returns the item from the top of the stack.
+        Raises IndexError if the stack is empty.
+        """
+        if self._top is None:
+            raise IndexError("pop from an empty TransientStack")
+        item, self._top = self._top
+        self._len -= 1
+        return item
+
+    def peek(self) -> T:
+        """Returns the top item. Raises IndexError if the stack is empty."""
+        if self._top is None:
+            raise IndexError("peek at an empty TransientStack")
+        return self._top[0]
+
+    def persistent(self) -> PersistentStack[T]:
+        """Returns the current contents as a PersistentStack. Time Complexity: O(1)"""
+        return PersistentStack._make(self._top, self._len)
+
+    def __len__(self) -> int:
+        """Returns the number of items in the stack."""
+        return self._len
+
+    def __bool__(self) -> bool:
+        """Returns True if the stack is not empty, False otherwise."""
+        return self._top is not None
+
+    def __repr__(self) -> str:
+        """Provides an unambiguous string representation of the builder, bottom to top."""
+        return f"TransientStack({list(self.persistent())})"
+
+
+def test_persistent_stack():
+    """
+    Tests PersistentStack and TransientStack using assertions.
+    Prints a success message only if all tests pass.
+    """
+    # 1. Versions are independent and share structure
+    empty = PersistentStack[int]()
+    assert not empty and len(empty) == 0
+    assert str(empty) == "PersistentStack[ ->"
+    one = empty.push(1)
+    two = one.push(2)
+    other = one.push(20)
+    assert list(two) == [1, 2] and list(other) == [1, 20] and list(one) == [1]
+    assert two._top[1] is other._top[1]  # shared bottom cell
+    assert two.peek() == 2 and len(two) == 2
+    assert list(two.pop()) == [1] and list(two) == [1, 2]
+    assert 20 in other and 20 not in two
+    assert list(reversed(two)) == [2, 1]
+    assert str(two) == "PersistentStack[1, 2 ->" and repr(two) == "PersistentStack([1, 2])"
+
+    # 2. Empty versions refuse pop and peek
+    for operation in (empty.pop, empty.peek, TransientStack().pop, TransientStack().peek):
+        try:
+            operation()
+            assert False, "IndexError was not raised on an empty stack"
+        except IndexError:
+            pass
+
+    # 3. Checkpoints for undo: every version stays valid
+    history: List[PersistentStack[str]] = [PersistentStack()]
+    for action in ("a", "b", "c"):
+        history.append(history[-1].push(action))
+    history.append(history[-1].pop())
+    assert [list(version) for version in history] == [[], ["a"], ["a", "b"], ["a", "b", "c"], ["a", "b"]]
+
+    # 4. The transient builder edits in place; snapshots are O(1) and stay frozen
+    builder = PersistentStack(range(3)).transient()
+    builder.push_many(range(3, 1000))
+    snapshot = builder.persistent()
+    assert builder.pop() == 999 and builder.peek() == 998
+    builder.push(-1)
+    assert len(snapshot) == 1000 and snapshot.peek() == 999
+    assert list(snapshot) == list(range(1000))
+    assert list(builder.persistent()) == list(range(999)) + [-1]
+    assert repr(TransientStack(PersistentStack([1]))) == "TransientStack([1])"
+
+    print("All tests passed -> PersistentStack -> ! :)")
+
+
+if __name__ == "__main__":
+    test_persistent_stack()
@@ -0,0 +1,450 @@
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+class PriorityQueue(Generic[T]):
+    """
+    A min-priority queue on a d-ary heap.
+
+    Elements come out lowest priority first, and in insertion order among
+    equal priorities. The priority of an element is the element itself, its
+    `key`, or the one passed to `push`. With the default arity of 2 the heap
+    operations are `heapq`'s C functions; a higher arity makes the heap
+    shallower, which pays off when pushes outnumber pops.
+
+    Time Complexity: O(log(N)) push and pop, O(1) peek, O(N) construction.
+    """
+    def __init__(self, iterable: Optional[Iterable[T]] = None,
+                 key: Optional[Callable[[T], Any]] = None, arity: int = 2) -> None:
+        """Initializes the queue, heapifying the elements of `iterable` in O(N)."""
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self._key = key
+        self._arity = arity
+        self._counter = count()
+        # Entries are (priority, insertion number, element), so elements never get compared.
+        self._heap: List[Tuple[Any, int, T]] = []
+        if iterable is not None:
+            self._heap = [(self._priority(val), next(self._counter), val) for val in iterable]
+            if arity == 2:
+                heapify(self._heap)
+            else:
+                for pos in reversed(range((len(self._heap) - 2) // arity + 1)):
+                    _sift_down(self._heap, pos, arity)
+
+    def push(self, val: T, priority: Any = None) -> None:
+        """Adds an element, with its own priority if one is given."""
+        entry = (self._priority(val) if priority is None else priority, next(self._counter), val)
+        if self._arity == 2:
+            heappush(self._heap, entry)
+        else:
+            self._heap.append(entry)
+            _sift_up(self._heap, len(self._heap) - 1, self._arity)
+
+    def pop(self) -> T:
+        """
+        Removes and returns the element with the lowest priority.
+        Raises IndexError if the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("pop from an empty PriorityQueue")
+        if self._arity == 2:
+            return heappop(self._heap)[2]
+
+        last = self._heap.pop()
+        if not self._heap:
+            return last[2]
+        top, self._heap[0] = self._heap[0], last
+        _sift_down(self._heap, 0, self._arity)
+        return top[2]
+
+    def peek(self) -> T:
+        """
+        Returns the element with the lowest priority without removing it.
+        Raises IndexError if the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("peek at an empty PriorityQueue")
+        return self._heap[0][2]
+
+    def _priority(self, val: T) -> Any:
+        return val if self._key is None else self._key(val)
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue."""
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        """Returns True if the queue is not empty, False otherwise."""
+        return bool(self._heap)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the PriorityQueue object."""
+        return f"PriorityQueue({[val for _, _, val in self._heap]}, arity={self._arity})"
+
+class IndexedPriorityQueue(Generic[T]):
+    """
+    A min-priority queue on a d-ary heap whose entries can be changed or removed.
+
+    `push` returns a handle for the new entry; `decrease_key`, `update` and
+    `remove` take it and find the entry's heap slot through a position map,
+    as Dijkstra's and Prim's algorithms need. Among equal priorities entries
+    come out in insertion order.
+
+    Time Complexity: O(log(N)) push, pop, decrease_key, update and remove.
+    """
+    def __init__(self, arity: int = 4) -> None:
+        """Initializes an empty queue."""
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self._arity = arity
+        # Entries are (priority, handle); handles increase, which makes ties FIFO.
+        self._heap: List[Tuple[Any, int]] = []
+        self._position: Dict[int, int] = {}
+        self._items: Dict[int, T] = {}
+        self._next_handle = 0
+
+    def push(self, item: T, priority: Any) -> int:
+        """Adds an item with the given priority and returns its handle."""
+        handle = self._next_handle
+        self._next_handle += 1
+        self._items[handle] = item
+        self._heap.append((priority, handle))
+        self._position[handle] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+        return handle
+
+    def pop(self) -> T:
+        """
+        Removes and returns the item with the lowest priority.
+        Raises IndexError if the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("pop from an empty IndexedPriorityQueue")
+        return self._remove_at(0)
+
+    def peek(self) -> T:
+        """
+        Returns the item with the lowest priority without removing it.
+        Raises IndexError if the queue is empty.
+        """
+        if not self._heap:
+            raise IndexError("peek at an empty IndexedPriorityQueue")
+        return self._items[self._heap[0][1]]
+
+    def priority(self, handle: int) -> Any:
+        """Returns the current priority of an entry. Raises KeyError for unknown handles."""
+        return self._heap[self._position[handle]][0]
+
+    def decrease_key(self, handle: int, priority: Any) -> None:
+        """
+        Lowers the priority of an entry.
+        Raises ValueError if it would increase, KeyError for unknown handles.
+        """
+        pos = self._position[handle]
+        if self._heap[pos][0] < priority:
+            raise ValueError("decrease_key() cannot increase the priority")
+        self._heap[pos] = (priority, handle)
+        self._sift_up(pos)
+
+    def update(self, handle: int, priority: Any) -> None:
+        """Sets the priority of an entry, up or down. Raises KeyError for unknown handles."""
+        pos = self._position[handle]
+        self._heap[pos] = (priority, handle)
+        self._sift_down(self._sift_up(pos))
+
+    def remove(self, handle: int) -> T:
+        """Removes an entry and returns its item. Raises KeyError for unknown handles."""
+        return self._remove_at(self._position[handle])
+
+    def _remove_at(self, pos: int) -> T:
+        handle = self._heap[pos][1]
+        last = self._heap.pop()
+        if pos < len(self._heap):
+            self._heap[pos] = last
+            self._position[last[1]] = pos
+            self._sift_down(self._sift_up(pos))
+        del self._position[handle]
+        return self._items.pop(handle)
+
+    def _sift_up(self, pos: int) -> int:
+        """Moves the entry at pos towards the root; returns its final slot."""
+        heap, position, arity = self._heap, self._position, self._arity
+        entry = heap[pos]
+        while pos > 0:
+            parent = (pos - 1) // arity
+            if not entry < heap[parent]:
+                break
+            heap[pos] = heap[parent]
+            position[heap[pos][1]] = pos
+            pos = parent
+        heap[pos] = entry
+        position[entry[1]] = pos
+        return pos
+
+    def _sift_down(self, pos: int) -> int:
+        """Moves the entry at pos towards the leaves; returns its final slot."""
+        heap, position, arity = self._heap, self._position, self._arity
+        n = len(heap)
+        entry = heap[pos]
+        while True:
+            first = arity * pos + 1
+            if first >= n:
+                break
+            best = first
+            for child in range(first + 1, min(first + arity, n)):
+                if heap[child] < heap[best]:
+                    best = child
+            if not heap[best] < entry:
+                break
+            heap[pos] = heap[best]
+            position[heap[pos][1]] = pos
+            pos = best
+        heap[pos] = entry
+        position[entry[1]] = pos
+        return pos
+
+    def __contains__(self, handle: int) -> bool:
+        """Checks if a handle still refers to an entry in the queue."""
+        return handle in self._position
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue."""
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        """Returns True if the queue is not empty, False otherwise."""
+        return bool(self._heap)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the IndexedPriorityQueue object."""
+        entries = [(self._items[handle], priority) for priority, handle in self._heap]
+        return f"IndexedPriorityQueue({entries}, arity={self._arity})"
+
+class RadixHeap(Generic[T]):
+    """
+    A min-priority queue for non-negative integer priorities that never go
+    below the last popped one (monotone), as in Dijkstra's algorithm.
+
+    Entries sit in buckets by the highest bit in which their priority differs
+    from the last popped priority. Popping only rescans a bucket when the
+    lowest one is empty, and every entry moves to a lower bucket each time it
+    is rescanned, so no comparisons between entries are needed beyond that.
+
+    Time Complexity: O(1) push, amortized O(log(C)) pop for priorities up to C.
+    """
+    def __init__(self) -> None:
+        """Initializes an empty heap."""
+        self._buckets: List[List[Tuple[int, T]]] = [[]]
+        self._last = 0
+        self._size = 0
+
+    def push(self, item: T, priority: int) -> None:
+        """
+        Adds an item with the given priority.
+        Raises ValueError if the priority is below the last popped one.
+        """
+        if priority < self._last:
+            raise ValueError("priority is below the last popped priority")
+        index = (priority ^ self._last).bit_length()
+        while len(self._buckets) <= index:
+            self._buckets.append([])
+        self._buckets[index].append((priority, item))
+        self._size += 1
+
+    def pop(self) -> T:
+        """
+        Removes and returns an item with the lowest priority.
+        Raises IndexError if the heap is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty RadixHeap")
+        self._settle()
+        self._size -= 1
+        return self._buckets[0].pop()[1]
+
+    def peek(self) -> T:
+        """
+        Returns an item with the lowest priority without removing it.
+        Raises IndexError if the heap is empty.
+        """
+        if not self._size:
+            raise IndexError("peek at an empty RadixHeap")
+        self._settle()
+        return self._buckets[0][-1][1]
+
+    def _settle(self) -> None:
+        """Makes bucket 0 hold the entries with the lowest priority."""
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        index = 1
+        while not buckets[index]:
+            index += 1
+        entries, buckets[index] = buckets[index], []
+        self._last = last = min(priority for priority, _ in entries)
+        for entry in entries:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    def __len__(self) -> int:
+        """Returns the number of items in the heap."""
+        return self._size
+
+    def __bool__(self) -> bool:
+        """Returns True if the heap is not empty, False otherwise."""
+        return self._size > 0
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the RadixHeap object."""
+        return f"RadixHeap(size={self._size}, last={self._last})"
+
+def _sift_up(heap: List[Any], pos: int, arity: int) -> None:
+    entry = heap[pos]
+    while pos > 0:
+        parent = (pos - 1) // arity
+        if not entry < heap[parent]:
+            break
+        heap[pos] = heap[parent]
+        pos = parent
+    heap[pos] = entry
+
+def _sift_down(heap: List[Any], pos: int, arity: int) -> None:
+    n = len(heap)
+    entry = heap[pos]
+    while True:
+        first = arity * pos + 1
+        if first >= n:
+            break
+        best = first
+        for child in range(first + 1, min(first + arity, n)):
+            if heap[child] < heap[best]:
+                best = child
+        if not heap[best] < entry:
+            break
+        heap[pos] = heap[best]
+        pos = best
+    heap[pos] = entry
+
+
+def test_priority_queue():
+    """
+    Tests PriorityQueue, IndexedPriorityQueue and RadixHeap using assertions.
+    Prints a success message only if all tests pass.
+    """
+    import random
+    rng = random.Random(17)
+    values = [rng.randint(0, 1000) for _ in range(500)]
+
+    # 1. Heapify, push and pop in priority order, for several arities
+    for arity in (2, 3, 4, 8):
+        pq = PriorityQueue(values, arity=arity)
+        assert len(pq) == 500 and pq.peek() == min(values)
+        for val in range(0, 1000, 7):
+            pq.push(val)
+        assert [pq.pop() for _ in range(len(pq))] == sorted(values + list(range(0, 1000, 7)))
+        assert not pq
+
+    # 2. Explicit priorities and keys; ties come out in insertion order
+    tasks = PriorityQueue[str](arity=3)
+    for name, priority in (("write", 2), ("read", 1), ("sync", 2), ("log", 1)):
+        tasks.push(name, priority)
+    assert [tasks.pop() for _ in range(4)] == ["read", "log", "write", "sync"]
+    words = PriorityQueue(["ccc", "a", "bb"], key=len)
+    assert [words.pop() for _ in range(3)] == ["a", "bb", "ccc"]
+    assert repr(PriorityQueue([2, 1])) == "PriorityQueue([1, 2], arity=2)"
+
+    for empty in (PriorityQueue(), IndexedPriorityQueue(), RadixHeap()):
+        for operation in (empty.pop, empty.peek):
+            try:
+                operation()
+                assert False, "IndexError was not raised on an empty queue"
+            except IndexError:
+                pass
+
+    # 3. Indexed queue: decrease_key, update and remove by handle
+    ipq = IndexedPriorityQueue[int]()
+    handles = {val: ipq.push(val, val) for val in range(100)}
+    for val in range(50, 100, 5):
+        ipq.decrease_key(handles[val], val - 100)
+    ipq.update(handles[0], 1000)
+    assert ipq.priority(handles[0]) == 1000
+    assert ipq.remove(handles[1]) == 1 and handles[1] not in ipq
+    try:
+        ipq.decrease_key(handles[2], 500)
+        assert False, "ValueError was not raised for an increasing decrease_key()"
+    except ValueError:
+        pass
+    try:
+        ipq.remove(handles[1])
+        assert False, "KeyError was not raised for a removed handle"
+    except KeyError:
+        pass
+    expected = list(range(50, 100, 5)) + [v for v in range(2, 100) if v < 50 or v % 5] + [0]
+    assert ipq.peek() == 50
+    assert [ipq.pop() for _ in range(len(ipq))] == expected
+
+    # 4. Dijkstra with decrease_key, checked against a radix heap run
+    graph = {node: [(rng.randrange(60), rng.randint(1, 20)) for _ in range(4)] for node in range(60)}
+
+    def dijkstra_indexed() -> Dict[int, int]:
+        dist = {0: 0}
+        queue, handle = IndexedPriorityQueue[int](), {0: None}
+        handle[0] = queue.push(0, 0)
+        done = set()
+        while queue:
+            node = queue.pop()
+            done.add(node)
+            for target, weight in graph[node]:
+                candidate = dist[node] + weight
+                if target in done or candidate >= dist.get(target, candidate + 1):
+                    continue
+                dist[target] = candidate
+                if target in handle and handle[target] in queue:
+                    queue.decrease_key(handle[target], candidate)
+                else:
+                    handle[target] = queue.push(target, candidate)
+        return dist
+
+    def dijkstra_radix() -> Dict[int, int]:
+        dist, heap = {}, RadixHeap[Tuple[int, int]]()
+        heap.push((0, 0), 0)
+        while heap:
+            distance, node = heap.pop()
+            if node in dist:
+                continue
+            dist[node] = distance
+            for target, weight in graph[node]:
+                if target not in dist:
+                    heap.push((distance + weight, target), distance + weight)
+        return dist
+
+    assert dijkstra_indexed() == dijkstra_radix()
+
+    # 5. Radix heap pops in priority order and rejects non-monotone pushes
+    heap = RadixHeap[int]()
+    for val in values:
+        heap.push(val, val)
+    popped = [heap.pop() for _ in range(250)]
+    for val in range(popped[-1], 2000, 9):
+        heap.push(val, val)
+    popped += [heap.pop() for _ in range(len(heap))]
+    assert popped == sorted(values + list(range(popped[249], 2000, 9)))
+    try:
+        heap.push(0, 0)
+        assert False, "ValueError was not raised for a priority below the last popped one"
+    except ValueError:
+        pass
+
+    # Items with equal priorities are never compared with each other
+    heap = RadixHeap[dict]()
+    for index in range(4):
+        heap.push({"index": index}, 5 + index // 2)
+    assert sorted(heap.pop()["index"] for _ in range(4)) == [0, 1, 2, 3]
+
+    print("All tests passed -> PriorityQueue -> ! :)")
+
+
+if __name__ == "__main__":
+    test_priority_queue()
@@ -1,5 +1,6 @@
 from collections import deque
-from typing import TypeVar, Generic, Iterator
+from itertools import repeat, starmap
+from typing import TypeVar, Generic, Iterable, Iterator, List
 
 # Define a generic TypeVar to allow the Queue to hold any type of element.
 T = TypeVar('T')
@@ -26,6 +27,25 @@ class Queue(Generic[T]):
         """
         return self._container.pop()
 
+    def push_many(self, iterable: Iterable[T]) -> None:
+        """Adds all elements of an iterable to the back of the queue, in order."""
+        self._container.extendleft(iterable)
+
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Removes and returns up to n elements from the front of the queue,
+        in the order successive pop() calls would return them.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return list(starmap(self._container.pop, repeat((), min(n, len(self._container)))))
+
+    def drain(self) -> List[T]:
+        """Removes and returns all elements, front first."""
+        items = list(reversed(self._container))
+        self._container.clear()
+        return items
+
     def __iter__(self) -> Iterator[T]:
         """Returns an iterator for the queue's elements."""
         return iter(self._container)
@@ -115,6 +135,21 @@ def test_queue():
     assert "hello" in q_str
     assert q_str.pop() == "hello"
     assert repr(q_str) == "Queue(deque(['world']))"
+
+    # 9. Test batch operations keep the FIFO order
+    q = Queue[int]()
+    q.push(0)
+    q.push_many(range(1, 6))
+    q.push_many(iter([6, 7]))
+    assert str(q) == "Queue -> (0, 1, 2, 3, 4, 5, 6, 7) ->"
+    assert q.pop_many(3) == [0, 1, 2]
+    assert q.pop() == 3
+    assert q.pop_many(0) == []
+    assert q.pop_many(10) == [4, 5, 6, 7]
+    assert q.pop_many(1) == []
+    q.push_many("abc")
+    assert q.drain() == ["a", "b", "c"]
+    assert not q and q.drain() == []
     
     print("All tests passed -> Queue -> ! :)")
 
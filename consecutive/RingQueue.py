@@ -0,0 +1,236 @@
+from array import array
+from queue import Full
+from typing import Any, Iterable, Iterator, List
+
+# Capacity of a RingQueue created without one.
+DEFAULT_CAPACITY = 16
+
+class RingQueue:
+    """
+    A First-In-First-Out (FIFO) queue of primitive values in a ring buffer.
+
+    The elements are stored unboxed in an `array.array` of the given typecode
+    (e.g. 'q' for signed 64-bit ints, 'd' for doubles), so each one costs its
+    native width instead of a pointer plus a Python object. The capacity is a
+    power of two and the head/tail counters are mapped to slots with a mask.
+    A full queue doubles its buffer, or raises queue.Full if `growable` is False.
+    """
+    def __init__(self, typecode: str = 'q', capacity: int = DEFAULT_CAPACITY, growable: bool = True) -> None:
+        """Initializes an empty queue with room for at least `capacity` elements."""
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        capacity = 1 << (capacity - 1).bit_length()
+        self._buffer = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._mask = capacity - 1
+        self._head = 0  # Counter of popped elements; the front is at _head & _mask.
+        self._tail = 0  # Counter of pushed elements; the next slot is _tail & _mask.
+        self.growable = growable
+
+    @property
+    def typecode(self) -> str:
+        """The array typecode of the elements."""
+        return self._buffer.typecode
+
+    @property
+    def capacity(self) -> int:
+        """The number of elements that fit before the buffer has to grow."""
+        return self._mask + 1
+
+    def push(self, val: Any) -> None:
+        """Adds an element to the back of the queue."""
+        if self._tail - self._head > self._mask:
+            self._reserve(1)
+        self._buffer[self._tail & self._mask] = val
+        self._tail += 1
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the element from the front of the queue.
+        Raises IndexError if the queue is empty.
+        """
+        if self._head == self._tail:
+            raise IndexError("pop from an empty RingQueue")
+        val = self._buffer[self._head & self._mask]
+        self._head += 1
+        return val
+
+    def push_many(self, iterable: Iterable[Any]) -> None:
+        """
+        Adds all elements of an iterable to the back of the queue, in order,
+        with at most two slice copies. Either all elements are added or none.
+        """
+        values = array(self.typecode, iterable)
+        count = len(values)
+        self._reserve(count)
+
+        start = self._tail & self._mask
+        first = min(count, self.capacity - start)
+        # Same-length slice assignments, so a view from `readable` may be alive.
+        if first:
+            self._buffer[start:start + first] = values[:first]
+        if count > first:
+            self._buffer[:count - first] = values[first:]
+        self._tail += count
+
+    def pop_many(self, n: int) -> List[Any]:
+        """Removes and returns up to n elements from the front of the queue, front first."""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        count = min(n, len(self))
+        start = self._head & self._mask
+        first = min(count, self.capacity - start)
+        items = self._buffer[start:start + first].tolist()
+        items += self._buffer[:count - first].tolist()
+        self._head += count
+        return items
+
+    def drain(self) -> List[Any]:
+        """Removes and returns all elements, front first."""
+        return self.pop_many(len(self))
+
+    def readable(self) -> memoryview:
+        """
+        Returns a zero-copy view of the elements from the front of the queue up
+        to the end of the buffer or of the queue, whichever comes first.
+
+        Call `consume` with the number of elements used. The view stays valid
+        until then; pushing meanwhile may make the queue move to a new buffer,
+        which leaves the view looking at the old one.
+        """
+        start = self._head & self._mask
+        stop = start + min(len(self), self.capacity - start)
+        return memoryview(self._buffer)[start:stop]
+
+    def consume(self, n: int) -> None:
+        """Drops n elements from the front of the queue, e.g. after reading them via `readable`."""
+        if not 0 <= n <= len(self):
+            raise ValueError("n must be between 0 and the length of the queue")
+        self._head += n
+
+    def _reserve(self, count: int) -> None:
+        """Makes room for `count` more elements, growing the buffer if allowed."""
+        size = len(self)
+        if size + count <= self.capacity:
+            return
+        if not self.growable:
+            raise Full
+
+        capacity = 1 << (size + count - 1).bit_length()
+        buffer = array(self.typecode, bytes(self._buffer.itemsize * capacity))
+        start = self._head & self._mask
+        first = min(size, self.capacity - start)
+        buffer[:first] = self._buffer[start:start + first]
+        buffer[first:size] = self._buffer[:size - first]
+        self._buffer = buffer
+        self._mask = capacity - 1
+        self._head, self._tail = 0, size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Returns an iterator over the elements, front first."""
+        buffer, mask = self._buffer, self._mask
+        return (buffer[i & mask] for i in range(self._head, self._tail))
+
+    def __str__(self) -> str:
+        """Returns an informal, user-friendly string representation of the queue."""
+        if not self:
+            return "RingQueue -> ( ) ->"
+        return f"RingQueue -> ({', '.join(map(str, self))}) ->"
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue."""
+        return self._tail - self._head
+
+    def __bool__(self) -> bool:
+        """Returns True if the queue is not empty, False otherwise."""
+        return self._tail != self._head
+
+    def __contains__(self, item: Any) -> bool:
+        """Checks if an item is present in the queue."""
+        return any(val == item for val in self)
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the RingQueue object."""
+        return f"RingQueue({self.typecode!r}, {list(self)})"
+
+
+def test_ring_queue():
+    """
+    Tests all functionalities of the RingQueue class using assertions.
+    Prints a success message only if all tests pass.
+    """
+    # 1. Test empty queue initialization; the capacity is rounded to a power of two
+    q = RingQueue('q', capacity=5)
+    assert q.capacity == 8 and len(q) == 0 and not q
+    assert str(q) == "RingQueue -> ( ) ->"
+    assert repr(q) == "RingQueue('q', [])"
+
+    # 2. Test FIFO order while the head and tail wrap around the buffer
+    expected = []
+    for round_ in range(20):
+        for i in range(5):
+            q.push(round_ * 10 + i)
+            expected.append(round_ * 10 + i)
+        for _ in range(4):
+            assert q.pop() == expected.pop(0)
+        assert list(q) == expected
+    assert q.capacity == 32 and len(q) == 20
+    assert 193 in q and 5 not in q
+    assert q.pop_many(3) == expected[:3]
+    del expected[:3]
+
+    # 3. Test batches across the wrap-around point and growth
+    q.push_many(range(100, 140))
+    expected.extend(range(100, 140))
+    assert list(q) == expected and q.capacity == 64
+    assert q.pop_many(100) == expected and not q
+    assert q.drain() == []
+
+    # 4. Test popping from an empty queue
+    try:
+        q.pop()
+        assert False, "IndexError was not raised for pop() on an empty queue"
+    except IndexError:
+        pass
+
+    # 5. Test the fixed-capacity mode; a failed batch adds nothing
+    fixed = RingQueue('d', capacity=4, growable=False)
+    fixed.push_many([0.5, 1.5, 2.5])
+    for values in ([3.5, 4.5], [3.5]):
+        try:
+            fixed.push_many(values)
+            fixed.push(9.5)
+            assert False, "queue.Full was not raised for a full RingQueue"
+        except Full:
+            pass
+    assert fixed.drain() == [0.5, 1.5, 2.5, 3.5]
+
+    # 6. Test the zero-copy view of the readable region
+    q = RingQueue('i', capacity=8)
+    q.push_many(range(6))
+    q.consume(4)
+    q.push_many(range(6, 10))
+    view = q.readable()
+    assert view.format == 'i' and view.tolist() == [4, 5, 6, 7]
+    q.consume(len(view))
+    view.release()
+    assert q.readable().tolist() == [8, 9]
+    try:
+        q.consume(3)
+        assert False, "ValueError was not raised for consume() past the end"
+    except ValueError:
+        pass
+
+    # 7. Test the element type is enforced and stored at its native width
+    try:
+        q.push("text")
+        assert False, "TypeError was not raised for a str in an int RingQueue"
+    except TypeError:
+        pass
+    big = RingQueue('q', capacity=1 << 16)
+    assert big._buffer.itemsize * big.capacity == 8 * (1 << 16)
+
+    print("All tests passed -> RingQueue -> ! :)")
+
+
+if __name__ == "__main__":
+    test_ring_queue()
@@ -0,0 +1,214 @@
+import multiprocessing
+import pickle
+import struct
+from multiprocessing import shared_memory
+from queue import Empty, Full
+from typing import Any, Dict, Optional
+
+# Head and tail counters (pops and pushes so far) at the start of the segment.
+_COUNTERS = struct.Struct("<QQ")
+# Every slot starts with the payload length; the top bit marks pickled objects.
+_LENGTH = struct.Struct("<I")
+_PICKLED = 1 << 31
+
+class SharedQueue:
+    """
+    A First-In-First-Out (FIFO) queue shared between processes.
+
+    The elements live in a `multiprocessing.shared_memory` segment laid out as
+    a ring of `slots` fixed-size slots, each holding a length-prefixed payload,
+    behind two counters (pops and pushes so far). Two semaphores count the
+    free and the filled slots, so `push` and `pop` block only when the ring is
+    full or empty; one lock per end orders concurrent producers or consumers.
+    Bytes are copied into the slots as they are, other objects are pickled.
+
+    Pass the queue to child processes when creating them (`Process(args=...)`);
+    the creating process should call `unlink` once every user is done.
+    """
+    def __init__(self, slots: int = 1024, slot_size: int = 256, name: Optional[str] = None) -> None:
+        """Creates a new shared segment with `slots` slots of `slot_size` bytes."""
+        if slots < 1:
+            raise ValueError("slots must be positive")
+        if slot_size <= _LENGTH.size:
+            raise ValueError(f"slot_size must be larger than {_LENGTH.size}")
+        self._slots = slots
+        self._slot_size = slot_size
+        self._shm = shared_memory.SharedMemory(name, create=True, size=_COUNTERS.size + slots * slot_size)
+        _COUNTERS.pack_into(self._shm.buf, 0, 0, 0)
+        self._free = multiprocessing.Semaphore(slots)
+        self._filled = multiprocessing.Semaphore(0)
+        self._push_lock = multiprocessing.Lock()
+        self._pop_lock = multiprocessing.Lock()
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment."""
+        return self._shm.name
+
+    @property
+    def max_payload(self) -> int:
+        """The largest payload in bytes that fits into one slot."""
+        return self._slot_size - _LENGTH.size
+
+    def push(self, val: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds an element to the back of the queue, waiting for a free slot if it is full.
+        Raises queue.Full if none freed up, ValueError if the payload exceeds `max_payload`.
+        """
+        if isinstance(val, memoryview):
+            # Count and copy bytes, not elements, for views of wider items.
+            payload, flag = val.cast('B'), 0
+        elif isinstance(val, (bytes, bytearray)):
+            payload, flag = val, 0
+        else:
+            payload, flag = pickle.dumps(val, pickle.HIGHEST_PROTOCOL), _PICKLED
+        size = len(payload)
+        if size > self.max_payload:
+            raise ValueError(f"payload of {size} bytes exceeds the slot size")
+
+        if not self._free.acquire(block, timeout):
+            raise Full
+        buf = self._shm.buf
+        try:
+            with self._push_lock:
+                tail = _COUNTERS.unpack_from(buf, 0)[1]
+                offset = _COUNTERS.size + (tail % self._slots) * self._slot_size
+                _LENGTH.pack_into(buf, offset, size | flag)
+                buf[offset + _LENGTH.size:offset + _LENGTH.size + size] = payload
+                struct.pack_into("<Q", buf, 8, tail + 1)
+        except BaseException:
+            # Nothing was published, give the slot back.
+            self._free.release()
+            raise
+        self._filled.release()
+
+    def pop(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes and returns the element from the front of the queue, waiting for one if it is empty.
+        Raises queue.Empty if none arrived.
+        """
+        if not self._filled.acquire(block, timeout):
+            raise Empty
+        buf = self._shm.buf
+        with self._pop_lock:
+            head = _COUNTERS.unpack_from(buf, 0)[0]
+            offset = _COUNTERS.size + (head % self._slots) * self._slot_size
+            size = _LENGTH.unpack_from(buf, offset)[0]
+            start = offset + _LENGTH.size
+            payload = bytes(buf[start:start + (size & ~_PICKLED)])
+            struct.pack_into("<Q", buf, 0, head + 1)
+        self._free.release()
+        return pickle.loads(payload) if size & _PICKLED else payload
+
+    def close(self) -> None:
+        """Detaches this process from the shared segment."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys the shared segment; call it once, from the creating process."""
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+        self.unlink()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(state["_shm"])
+
+    def __len__(self) -> int:
+        """Returns the number of items in the queue (a snapshot under concurrency)."""
+        head, tail = _COUNTERS.unpack_from(self._shm.buf, 0)
+        return tail - head
+
+    def __bool__(self) -> bool:
+        """Returns True if the queue is not empty, False otherwise."""
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        """Returns a formal, unambiguous string representation of the SharedQueue object."""
+        return f"SharedQueue(name={self.name!r}, slots={self._slots}, slot_size={self._slot_size})"
+
+
+def _produce(queue: SharedQueue, start: int, stop: int) -> None:
+    for val in range(start, stop):
+        queue.push(val)
+    queue.close()
+
+def test_shared_queue():
+    """
+    Tests all functionalities of the SharedQueue class using assertions.
+    Prints a success message only if all tests pass.
+    """
+    from array import array
+
+    with SharedQueue(slots=4, slot_size=64) as q:
+        # 1. FIFO order for bytes and pickled objects
+        assert len(q) == 0 and not q
+        q.push(b"raw")
+        q.push({"id": 1})
+        q.push(bytearray(b"x" * q.max_payload))
+        assert len(q) == 3 and q
+        assert q.pop() == b"raw"
+        assert q.pop() == {"id": 1}
+        assert q.pop() == b"x" * 60
+
+        # 2. Full and empty rings refuse, oversized payloads are rejected
+        for val in range(4):
+            q.push(val)
+        try:
+            q.push(4, timeout=0.01)
+            assert False, "queue.Full was not raised for push() on a full queue"
+        except Full:
+            pass
+        assert [q.pop() for _ in range(4)] == [0, 1, 2, 3]
+        try:
+            q.pop(block=False)
+            assert False, "queue.Empty was not raised for pop() on an empty queue"
+        except Empty:
+            pass
+        try:
+            q.push(b"y" * 61)
+            assert False, "ValueError was not raised for an oversized payload"
+        except ValueError:
+            pass
+
+        # Memoryviews count bytes, not items, and a rejected push keeps every slot
+        wide = memoryview(array('q', [1, 2, 3]))
+        q.push(wide)
+        assert q.pop() == wide.tobytes() and len(wide.tobytes()) == 24
+        try:
+            q.push(memoryview(array('q', range(8))))
+            assert False, "ValueError was not raised for an oversized memoryview"
+        except ValueError:
+            pass
+        for val in range(4):
+            q.push(val, timeout=1)
+        assert [q.pop() for _ in range(4)] == [0, 1, 2, 3]
+
+        # 3. Two producer processes and a consumer in this one, through a ring of 4 slots
+        producers = [multiprocessing.Process(target=_produce, args=(q, start, start + 300))
+                     for start in (0, 1000)]
+        for process in producers:
+            process.start()
+        received = [q.pop(timeout=10) for _ in range(600)]
+        for process in producers:
+            process.join()
+            assert process.exitcode == 0
+        assert sorted(received) == list(range(300)) + list(range(1000, 1300))
+        assert [x for x in received if x < 1000] == list(range(300))
+        assert not q
+
+    print("All tests passed -> SharedQueue -> ! :)")
+
+
+if __name__ == "__main__":
+    test_shared_queue()
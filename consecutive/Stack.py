@@ -1,5 +1,6 @@
 from collections import deque
-from typing import TypeVar, Generic, Iterator
+from itertools import repeat, starmap
+from typing import TypeVar, Generic, Iterable, Iterator, List
 
 # Define a generic TypeVar
 T = TypeVar('T')
@@ -22,6 +23,25 @@ class Stack(Generic[T]):
         """
         return self._container.pop()
 
+    def push_many(self, iterable: Iterable[T]) -> None:
+        """Pushes all items of an iterable in order; the last one ends up on top."""
+        self._container.extend(iterable)
+
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Removes and returns up to n items from the top of the stack,
+        in the order successive pop() calls would return them.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return list(starmap(self._container.pop, repeat((), min(n, len(self._container)))))
+
+    def drain(self) -> List[T]:
+        """Removes and returns all items, top first."""
+        items = list(reversed(self._container))
+        self._container.clear()
+        return items
+
     def __iter__(self) -> Iterator[T]:
         """Provides an iterator from bottom to top of the stack."""
         return iter(self._container)
@@ -78,6 +98,15 @@ def test_stack():
 
     assert str(stack) == "Stack[3, 4 ->"
 
+    stack.push_many(range(5, 9))
+    assert str(stack) == "Stack[3, 4, 5, 6, 7, 8 ->"
+    assert stack.pop_many(2) == [8, 7]
+    assert stack.pop() == 6
+    assert stack.pop_many(0) == []
+    stack.push_many(iter([9]))
+    assert stack.drain() == [9, 5, 4, 3]
+    assert not stack and stack.pop_many(3) == []
+
     print("All tests passed [Stack ! :)")
 
 if __name__ == "__main__":
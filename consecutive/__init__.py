@@ -1,12 +1,30 @@
 from .Queue import Queue, test_queue
 from .Stack import Stack, test_stack
+from .BoundedQueue import BoundedQueue, SPSCQueue, test_bounded_queue
+from .AsyncQueue import AsyncQueue, test_async_queue
+from .RingQueue import RingQueue, test_ring_queue
+from .PriorityQueue import PriorityQueue, IndexedPriorityQueue, RadixHeap, test_priority_queue
+from .SharedQueue import SharedQueue, test_shared_queue
+from .MinMaxStack import MinMaxStack, test_min_max_stack
+from .AggregateQueue import MonotonicQueue, AggregateQueue, test_aggregate_queue
+from .PersistentStack import PersistentStack, TransientStack, test_persistent_stack
 
-__all__ = ["Stack", "Queue"]
-__version__ = "0.1.0"
+__all__ = ["Stack", "Queue", "BoundedQueue", "SPSCQueue", "AsyncQueue", "RingQueue",
+           "PriorityQueue", "IndexedPriorityQueue", "RadixHeap", "SharedQueue",
+           "MinMaxStack", "MonotonicQueue", "AggregateQueue", "PersistentStack", "TransientStack"]
+__version__ = "0.2.0"
 
 def main():
     test_stack()
     test_queue()
+    test_bounded_queue()
+    test_async_queue()
+    test_ring_queue()
+    test_priority_queue()
+    test_shared_queue()
+    test_min_max_stack()
+    test_aggregate_queue()
+    test_persistent_stack()
 
 if __name__ == "__main__":
     print(f"Consecutive [v{__version__}]")
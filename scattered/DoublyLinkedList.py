@@ -0,0 +1,264 @@
+from typing import Generic, Iterator, Optional, TypeVar
+
+"""
+A doubly linked list implementation with sentinel nodes.
+"""
+T = TypeVar('T')
+
+class DNode(Generic[T]):
+    """
+    A single node in a doubly linked list.
+
+    Attributes:
+        data (T): The data stored in the node.
+        prev (Optional[DNode[T]]): A pointer to the previous node (None once removed).
+        next (Optional[DNode[T]]): A pointer to the next node (None once removed).
+    """
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(self, data: T, prev_node: Optional["DNode[T]"] = None,
+                 next_node: Optional["DNode[T]"] = None) -> None:
+        self.data = data
+        self.prev = prev_node
+        self.next = next_node
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the node."""
+        return f"DNode({self.data})"
+
+
+class DoublyLinkedList(Generic[T]):
+    """
+    A doubly linked list with a sentinel node at each end.
+
+    Every node points to both neighbours, and the sentinels mean the first
+    and last nodes have neighbours too, so inserting or removing anywhere
+    needs no special cases. This makes delete_end, and removing a node
+    given its handle (as returned by the insert methods), O(1). Positional
+    access walks from whichever end is closer to the index.
+    """
+    def __init__(self) -> None:
+        """Initializes an empty list: the two sentinels pointing at each other."""
+        self._front: DNode[T] = DNode(None)  # type: ignore # sentinels hold no data
+        self._back: DNode[T] = DNode(None)  # type: ignore
+        self._front.next = self._back
+        self._back.prev = self._front
+        self.__len = 0
+
+    @property
+    def head(self) -> Optional[DNode[T]]:
+        """The first node, or None if the list is empty."""
+        return self._front.next if self.__len else None
+
+    @property
+    def tail(self) -> Optional[DNode[T]]:
+        """The last node, or None if the list is empty."""
+        return self._back.prev if self.__len else None
+
+    def _link_after(self, node: DNode[T], value: T) -> DNode[T]:
+        new_node = DNode(value, node, node.next)
+        node.next.prev = new_node  # type: ignore # a linked node always has a next
+        node.next = new_node
+        self.__len += 1
+        return new_node
+
+    def _unlink(self, node: DNode[T]) -> None:
+        node.prev.next = node.next  # type: ignore # a linked node always has both
+        node.next.prev = node.prev  # type: ignore
+        node.prev = node.next = None
+        self.__len -= 1
+
+    def _node_at(self, index: int) -> DNode[T]:
+        """Returns the node at index, walking from the closer end."""
+        if not (0 <= index < self.__len):
+            raise IndexError("Index out of range")
+
+        if index < self.__len // 2:
+            current = self._front.next
+            for _ in range(index):
+                current = current.next  # type: ignore
+        else:
+            current = self._back.prev
+            for _ in range(self.__len - 1 - index):
+                current = current.prev  # type: ignore
+        return current  # type: ignore
+
+    def insert_front(self, value: T) -> DNode[T]:
+        """
+        Inserts a new node with the given value at the head of the list and returns it.
+
+        Time Complexity: O(1)
+        """
+        return self._link_after(self._front, value)
+
+    def insert_end(self, value: T) -> DNode[T]:
+        """
+        Inserts a new node with the given value at the tail of the list and returns it.
+
+        Time Complexity: O(1)
+        """
+        return self._link_after(self._back.prev, value)  # type: ignore
+
+    def insert_after(self, node: DNode[T], value: T) -> DNode[T]:
+        """
+        Inserts a new node with the given value right after node and returns it.
+
+        Time Complexity: O(1)
+        """
+        if node.next is None:
+            raise ValueError("node is not in a list")
+        return self._link_after(node, value)
+
+    def delete_front(self) -> None:
+        """
+        Removes the node from the head of the list.
+
+        Time Complexity: O(1)
+        """
+        if self.__len:
+            self._unlink(self._front.next)  # type: ignore
+
+    def delete_end(self) -> None:
+        """
+        Removes the node from the tail of the list.
+
+        Time Complexity: O(1), the tail knows its predecessor.
+        """
+        if self.__len:
+            self._unlink(self._back.prev)  # type: ignore
+
+    def remove_node(self, node: DNode[T]) -> T:
+        """
+        Removes the given node from the list and returns its data.
+        The node must belong to this list.
+
+        Time Complexity: O(1)
+        """
+        if node.prev is None or node.next is None:
+            raise ValueError("node is not in a list")
+        self._unlink(node)
+        return node.data
+
+    def get(self, index: int) -> T:
+        """
+        Returns the value of the node at the given index.
+        Time Complexity: O(min(index, n - index))
+        """
+        return self._node_at(index).data
+
+    def delete(self, index: int) -> None:
+        """
+        Deletes the node at the given index.
+        Time Complexity: O(min(index, n - index))
+        """
+        self._unlink(self._node_at(index))
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the list. Time Complexity: O(1)"""
+        return self.__len
+
+    def __iter__(self) -> Iterator[T]:
+        """Allows for iterating over the list's data, head to tail."""
+        current = self._front.next
+        while current is not self._back:
+            yield current.data  # type: ignore
+            current = current.next  # type: ignore
+
+    def __reversed__(self) -> Iterator[T]:
+        """Allows for iterating over the list's data, tail to head."""
+        current = self._back.prev
+        while current is not self._front:
+            yield current.data  # type: ignore
+            current = current.prev  # type: ignore
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the linked list."""
+        if not self.__len:
+            return "DoublyLinkedList()"
+        return f"DoublyLinkedList({ ' <-> '.join(map(str, self)) })"
+
+    def __getitem__(self, index: int) -> T:
+        """Allows for indexing into the list (e.g., list[index])."""
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """Allows for setting values in the list (e.g., list[index] = value)."""
+        self._node_at(index).data = value
+
+    def __delitem__(self, index: int) -> None:
+        """Allows for deleting items from the list (e.g., del list[index])."""
+        self.delete(index)
+
+    def __str__(self) -> str:
+        """Provides a user-friendly string representation of the linked list."""
+        return f"DoublyLinkedList({ ' <-> '.join(map(str, self)) })"
+
+    def __contains__(self, value: T) -> bool:
+        """Allows for checking if a value is in the list (e.g., value in list)."""
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+
+def test_doubly_linked_list():
+    dll = DoublyLinkedList()
+    assert dll.head is None and dll.tail is None
+    assert repr(dll) == "DoublyLinkedList()"
+
+    dll.insert_front(1)
+    dll.insert_front(2)
+    dll.insert_front(3)
+    four = dll.insert_end(4)
+
+    assert [dll.get(i) for i in range(4)] == [3, 2, 1, 4]
+    assert list(reversed(dll)) == [4, 1, 2, 3]
+    assert dll.head.data == 3 and dll.tail is four
+
+    dll.delete_front()
+    dll.delete_end()
+    assert list(dll) == [2, 1] and dll.tail.data == 1
+
+    # Removal by handle and insertion after a node
+    dll = DoublyLinkedList()
+    nodes = [dll.insert_end(value) for value in range(10)]
+    assert dll.remove_node(nodes[4]) == 4
+    assert dll.remove_node(nodes[0]) == 0 and dll.remove_node(nodes[9]) == 9
+    dll.insert_after(nodes[3], 35)
+    assert list(dll) == [1, 2, 3, 35, 5, 6, 7, 8]
+    assert list(reversed(dll)) == [8, 7, 6, 5, 35, 3, 2, 1]
+    try:
+        dll.remove_node(nodes[4])
+        assert False, "ValueError was not raised for a node removed twice"
+    except ValueError:
+        pass
+
+    # Index access from both ends
+    for index, value in enumerate([1, 2, 3, 35, 5, 6, 7, 8]):
+        assert dll[index] == value
+    dll[6] = 70
+    dll[1] = 20
+    del dll[7]
+    del dll[0]
+    assert list(dll) == [20, 3, 35, 5, 6, 70]
+    assert str(dll) == "DoublyLinkedList(20 <-> 3 <-> 35 <-> 5 <-> 6 <-> 70)"
+    assert 35 in dll and 8 not in dll
+    try:
+        dll.get(6)
+        assert False, "IndexError was not raised for an index past the end"
+    except IndexError:
+        pass
+
+    # Draining from the tail is O(1) per call
+    dll = DoublyLinkedList()
+    for value in range(10000):
+        dll.insert_end(value)
+    while dll:
+        dll.delete_end()
+    assert len(dll) == 0 and dll.tail is None
+    dll.delete_end()  # no-op on an empty list, like LinkedList
+
+    print("All tests passed [Doubly<->Linked<->List]! :)")
+
+if __name__ == "__main__":
+    test_doubly_linked_list()
@@ -1,4 +1,4 @@
-from typing import Generic, Iterator, Optional, Self, TypeVar
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, Self, TypeVar
 
 """
 A linked list implementation in Python.
@@ -14,6 +14,9 @@ class Node(Generic[T]):
         data (T): The data stored in the node.
         next (Optional[Node[T]]): A pointer to the next node in the list.
     """
+    # Slots instead of a per-node __dict__ cut the size of a node to about a third.
+    __slots__ = ("data", "next")
+
     def __init__(self, data: T, next_node: Optional[Self] = None) -> None:
         self.data = data
         self.next = next_node
@@ -30,12 +33,62 @@ class LinkedList(Generic[T]):
     This data structure consists of a sequence of nodes, where each node
     points to the next one. It provides O(1) time complexity for insertions
     at the head or tail.
+
+    With a `pool_size`, up to that many nodes unlinked by the delete methods
+    are kept on a free list and reused by the insert methods, instead of
+    going back to the allocator. A deleted node may then reappear with new
+    data, so do not hold on to nodes across deletions when pooling.
     """
-    def __init__(self) -> None:
+    def __init__(self, pool_size: int = 0) -> None:
         """Initializes an empty linked list."""
         self.head: Optional[Node[T]] = None
         self.tail: Optional[Node[T]] = None
         self.__len = 0
+        self.pool_size = pool_size
+        # The free list is chained through the nodes' own next pointers.
+        self._free: Optional[Node[T]] = None
+        self._free_count = 0
+
+    def _new_node(self, value: T, next_node: Optional[Node[T]] = None) -> Node[T]:
+        """Returns a node holding value, from the free list if it has one."""
+        node = self._free
+        if node is None:
+            return Node(value, next_node)
+        self._free = node.next
+        self._free_count -= 1
+        node.data = value
+        node.next = next_node
+        return node
+
+    def _release(self, node: Node[T]) -> None:
+        """Puts an unlinked node on the free list, if there is room."""
+        if self._free_count < self.pool_size:
+            node.data = None  # type: ignore # Do not keep the value alive.
+            node.next = self._free
+            self._free = node
+            self._free_count += 1
+
+    def _link_after(self, node: Node[T], value: T) -> Node[T]:
+        """Links a new node holding value right after node and returns it."""
+        new_node = self._new_node(value, node.next)
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
+        self.__len += 1
+        return new_node
+
+    def _unlink_after(self, previous: Optional[Node[T]]) -> Node[T]:
+        """Unlinks the node after previous (the head if previous is None) and returns it."""
+        node = self.head if previous is None else previous.next
+        assert node is not None, "There should be a node to unlink"
+        if previous is None:
+            self.head = node.next
+        else:
+            previous.next = node.next
+        if node is self.tail:
+            self.tail = previous
+        self.__len -= 1
+        return node
 
     def insert_front(self, value: T) -> None:
         """
@@ -43,7 +96,7 @@ class LinkedList(Generic[T]):
 
         Time Complexity: O(1)
         """
-        new_node = Node(value, self.head)
+        new_node = self._new_node(value, self.head)
         self.head = new_node
 
         # If the list was empty, the new node is also the tail.
@@ -67,7 +120,7 @@ class LinkedList(Generic[T]):
         # this point, 'self.tail' cannot be None.
         assert self.tail is not None, "Tail should not be None if head is not None"
 
-        new_node = Node(value)
+        new_node = self._new_node(value)
         self.tail.next = new_node
         self.tail = new_node
         self.__len += 1
@@ -81,12 +134,14 @@ class LinkedList(Generic[T]):
         if self.head is None:
             return
 
-        self.head = self.head.next
+        node = self.head
+        self.head = node.next
         self.__len -= 1
 
         # If the list became empty after deletion, update the tail as well.
         if self.head is None:
             self.tail = None
+        self._release(node)
 
     def delete_end(self) -> None:
         """
@@ -108,9 +163,11 @@ class LinkedList(Generic[T]):
             current = current.next
 
         # Unlink the last node and update the tail.
+        node = current.next
         current.next = None
         self.tail = current
         self.__len -= 1
+        self._release(node)  # type: ignore # current.next is the old tail
 
     def get(self, index: int) -> T:
         """
@@ -151,8 +208,91 @@ class LinkedList(Generic[T]):
             current = current.next
 
         assert current is not None, "Current should not be None if index is valid"
-        current.next = current.next.next # type: ignore cause current->next could be None
+        node = current.next
+        assert node is not None, "The node to delete should exist if index is valid"
+        current.next = node.next
+
+        # Deleting the last node makes its predecessor the new tail.
+        if node is self.tail:
+            self.tail = current
         self.__len -= 1
+        self._release(node)
+
+    def cursor(self) -> "Cursor[T]":
+        """
+        Returns a cursor on the head of the list, for editing it in one pass.
+
+        Time Complexity: O(1)
+        """
+        return Cursor(self)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """
+        Appends all values of an iterable at the tail of the list.
+
+        The new nodes are chained first and then linked to the tail at once,
+        so `tail` and the length are only updated once.
+
+        Time Complexity: O(k) for k new values
+        """
+        first = last = None
+        count = 0
+        for value in iterable:
+            node = self._new_node(value)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        if last is None:
+            return
+
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.__len += count
+
+    def remove_if(self, pred: Callable[[T], Any]) -> int:
+        """
+        Removes every node whose value satisfies pred and returns how many were removed.
+        The list stays consistent after every removal, so if pred raises, the
+        nodes before the failing one have been filtered and the rest are kept.
+
+        Time Complexity: O(n), a single pass however many nodes are removed.
+        """
+        previous: Optional[Node[T]] = None
+        current = self.head
+        removed = 0
+        while current is not None:
+            following = current.next
+            if pred(current.data):
+                if previous is None:
+                    self.head = following
+                else:
+                    previous.next = following
+                if current is self.tail:
+                    self.tail = previous
+                self.__len -= 1
+                self._release(current)
+                removed += 1
+            else:
+                previous = current
+            current = following
+        return removed
+
+    def map_inplace(self, fn: Callable[[T], T]) -> None:
+        """
+        Replaces every value with fn(value), keeping the nodes.
+
+        Time Complexity: O(n)
+        """
+        current = self.head
+        while current is not None:
+            current.data = fn(current.data)
+            current = current.next
 
     def __len__(self) -> int:
         """Returns the number of nodes in the list. Time Complexity: O(1)"""
@@ -206,6 +346,82 @@ class LinkedList(Generic[T]):
         return False
     
 
+class Cursor(Generic[T]):
+    """
+    A position in a LinkedList that edits it without walking from the head.
+
+    The cursor is on a node, or past the end once it has advanced beyond the
+    tail (it is then falsy). Each operation is O(1), so a full pass that
+    updates, removes or inserts at any number of positions costs O(n) in
+    total, where `ll[i] = v` or `del ll[i]` would cost O(n) each. Changing
+    the list other than through the cursor invalidates it.
+    """
+    __slots__ = ("_list", "_previous", "_node")
+
+    def __init__(self, linked_list: LinkedList[T]) -> None:
+        """Initializes a cursor on the head of linked_list."""
+        self._list = linked_list
+        self._previous: Optional[Node[T]] = None
+        self._node = linked_list.head
+
+    def _current(self) -> Node[T]:
+        if self._node is None:
+            raise IndexError("Cursor is past the end")
+        return self._node
+
+    @property
+    def value(self) -> T:
+        """The value at the cursor. Raises IndexError past the end."""
+        return self._current().data
+
+    def advance(self, steps: int = 1) -> None:
+        """
+        Moves the cursor `steps` nodes towards the tail; moving just past the
+        tail is allowed. Raises IndexError if there are not enough nodes.
+
+        Time Complexity: O(steps)
+        """
+        if steps < 0:
+            raise ValueError("steps must be non-negative")
+        for _ in range(steps):
+            self._previous = self._current()
+            self._node = self._node.next  # type: ignore # _current checked it
+
+    def set(self, value: T) -> None:
+        """Replaces the value at the cursor. Time Complexity: O(1)"""
+        self._current().data = value
+
+    def insert_after(self, value: T) -> None:
+        """
+        Inserts a value right after the cursor, which stays where it is.
+
+        Time Complexity: O(1)
+        """
+        self._list._link_after(self._current(), value)
+
+    def remove_current(self) -> T:
+        """
+        Removes the node at the cursor and returns its value; the cursor
+        moves on to the following node.
+
+        Time Complexity: O(1)
+        """
+        self._current()
+        node = self._list._unlink_after(self._previous)
+        self._node = node.next
+        value = node.data
+        self._list._release(node)
+        return value
+
+    def __bool__(self) -> bool:
+        """Returns True while the cursor is on a node."""
+        return self._node is not None
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the cursor."""
+        return f"Cursor({self._node.data})" if self._node is not None else "Cursor(<end>)"
+
+
 def test_linked_list():
     ll = LinkedList()
     ll.insert_front(1)
@@ -242,6 +458,99 @@ def test_linked_list():
     del ll[0]
     assert len(ll) == 0
 
+    # Deleting the last node by index moves the tail
+    ll = LinkedList()
+    for value in (1, 2, 3):
+        ll.insert_end(value)
+    ll.delete(2)
+    ll.insert_end(4)
+    assert list(ll) == [1, 2, 4] and ll.tail.data == 4
+
+    # Nodes are slot-based, and a pooled list reuses deleted nodes
+    assert not hasattr(Node(1), "__dict__")
+    pooled = LinkedList(pool_size=2)
+    for value in range(5):
+        pooled.insert_end(value)
+    old_head = pooled.head
+    pooled.delete_front()
+    pooled.delete_end()
+    pooled.delete(1)
+    assert pooled._free_count == 2  # the third deleted node exceeded the pool
+    pooled.insert_front(10)
+    pooled.insert_end(20)
+    assert pooled._free_count == 0
+    assert list(pooled) == [10, 1, 3, 20] and len(pooled) == 4
+    assert old_head in (pooled.head, pooled.tail)
+
+    # Bulk operations
+    ll = LinkedList()
+    ll.extend(range(10))
+    ll.extend([])
+    ll.extend(iter([10, 11]))
+    assert list(ll) == list(range(12)) and len(ll) == 12 and ll.tail.data == 11
+    assert ll.remove_if(lambda value: value % 3 == 0) == 4
+    assert list(ll) == [1, 2, 4, 5, 7, 8, 10, 11] and len(ll) == 8 and ll.tail.data == 11
+    assert ll.remove_if(lambda value: value > 9) == 2 and ll.tail.data == 8
+    ll.map_inplace(lambda value: value * 10)
+    assert list(ll) == [10, 20, 40, 50, 70, 80]
+    assert ll.remove_if(lambda value: True) == 6
+    assert len(ll) == 0 and ll.head is None and ll.tail is None
+    ll.extend([1, 2])
+    assert list(ll) == [1, 2] and ll.tail.data == 2
+
+    # A failing predicate leaves a consistent list
+    ll = LinkedList(pool_size=8)
+    ll.extend(range(6))
+
+    def drop_odd_until_four(value: int) -> bool:
+        if value == 4:
+            raise RuntimeError("stop")
+        return value % 2 == 1
+
+    try:
+        ll.remove_if(drop_odd_until_four)
+        assert False, "RuntimeError was not propagated from remove_if()"
+    except RuntimeError:
+        pass
+    assert list(ll) == [0, 2, 4, 5] and len(ll) == 4 and ll.tail.data == 5
+    ll.remove_if(lambda value: value == 5)
+    assert ll.tail.data == 4 and len(ll) == 3
+
+    # One cursor pass: double evens, drop multiples of 3, insert a marker after 5
+    ll = LinkedList(pool_size=4)
+    ll.extend(range(1, 10))
+    cursor = ll.cursor()
+    while cursor:
+        value = cursor.value
+        if value % 3 == 0:
+            assert cursor.remove_current() == value
+            continue
+        if value % 2 == 0:
+            cursor.set(value * 2)
+        if value == 5:
+            cursor.insert_after(55)
+            cursor.advance()
+        cursor.advance()
+    assert list(ll) == [1, 4, 8, 5, 55, 7, 16] and len(ll) == 7 and ll.tail.data == 16
+    assert repr(cursor) == "Cursor(<end>)"
+    for operation in (cursor.advance, cursor.remove_current, lambda: cursor.set(0)):
+        try:
+            operation()
+            assert False, "IndexError was not raised past the end"
+        except IndexError:
+            pass
+
+    # Removing at the head and tail through a cursor keeps head and tail right
+    cursor = ll.cursor()
+    assert cursor.remove_current() == 1 and ll.head.data == 4
+    cursor.advance(5)
+    assert cursor.value == 16 and cursor.remove_current() == 16
+    assert ll.tail.data == 7 and not cursor
+    cursor = ll.cursor()
+    cursor.advance(4)
+    cursor.insert_after(99)
+    assert list(ll) == [4, 8, 5, 55, 7, 99] and ll.tail.data == 99 and len(ll) == 6
+
     print("All tests passed [Linked->List]! :)")
 
 if __name__ == "__main__":
@@ -0,0 +1,356 @@
+import random
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+"""
+An indexable skip list: a linked list with express lanes that know how far they jump.
+"""
+T = TypeVar('T')
+
+# Nodes get at most this many levels, enough for about 2 ** MAX_LEVEL elements.
+MAX_LEVEL = 32
+
+class SkipNode(Generic[T]):
+    """
+    A single node in a skip list.
+
+    Attributes:
+        data (T): The data stored in the node.
+        next (List[SkipNode[T]]): The following node on each of the node's levels.
+        width (List[int]): How many positions each of those links skips.
+    """
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data: T, level: int) -> None:
+        self.data = data
+        self.next: List["SkipNode[T]"] = [None] * level  # type: ignore # set when linked
+        self.width: List[int] = [0] * level
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the node."""
+        return f"SkipNode({self.data})"
+
+
+class SkipList(Generic[T]):
+    """
+    A list with expected O(log(N)) positional access, insertion and deletion.
+
+    Level 0 links all nodes in order, like LinkedList; every node also
+    appears on each higher level with probability 1/2. Each link stores its
+    width, the number of positions it skips, so a search for an index runs
+    down the levels adding widths and skipping about half of what is left
+    per level.
+    """
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """Initializes an empty list; `seed` makes the node levels reproducible."""
+        self._rng = random.Random(seed)
+        # Sentinels at position 0 (before the first element) and len + 1 (after the last).
+        self._end: SkipNode[T] = SkipNode(None, 0)  # type: ignore # sentinels hold no data
+        self._head: SkipNode[T] = SkipNode(None, 1)  # type: ignore
+        self._head.next[0] = self._end
+        self._head.width[0] = 1
+        self.__len = 0
+
+    def _random_level(self) -> int:
+        # One plus the number of trailing zero bits: level k has probability 2 ** -k.
+        bits = self._rng.getrandbits(MAX_LEVEL - 1)
+        return (bits & -bits).bit_length() if bits else MAX_LEVEL
+
+    def _path(self, index: int) -> Tuple[List[SkipNode[T]], List[int]]:
+        """
+        For every level, the last node before position index + 1 (the node
+        holding element `index`) and that node's position.
+        """
+        head = self._head
+        levels = len(head.next)
+        update: List[SkipNode[T]] = [head] * levels
+        positions = [0] * levels
+        node, position = head, 0
+        for level in reversed(range(levels)):
+            while position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def _link(self, update: List[SkipNode[T]], positions: List[int], index: int, value: T) -> None:
+        """Links a new node holding value as element `index`, given `_path(index)`."""
+        level = self._random_level()
+        head = self._head
+        while len(head.next) < level:
+            # A new top level: the head links straight to the end sentinel.
+            head.next.append(self._end)
+            head.width.append(self.__len + 1)
+            update.append(head)
+            positions.append(0)
+
+        node = SkipNode(value, level)
+        for i, previous in enumerate(update):
+            if i < level:
+                skipped = index + 1 - positions[i]
+                node.next[i] = previous.next[i]
+                node.width[i] = previous.width[i] - skipped + 1
+                previous.next[i] = node
+                previous.width[i] = skipped
+            else:
+                previous.width[i] += 1
+        self.__len += 1
+
+    def _unlink(self, update: List[SkipNode[T]]) -> T:
+        """Unlinks the node after update[0], given the `_path` to it, and returns its data."""
+        target = update[0].next[0]
+        for i, previous in enumerate(update):
+            if previous.next[i] is target:
+                previous.width[i] += target.width[i] - 1
+                previous.next[i] = target.next[i]
+            else:
+                previous.width[i] -= 1
+        self.__len -= 1
+        return target.data
+
+    def _node_at(self, index: int) -> SkipNode[T]:
+        if not (0 <= index < self.__len):
+            raise IndexError("Index out of range")
+        return self._path(index)[0][0].next[0]
+
+    def insert(self, index: int, value: T) -> None:
+        """
+        Inserts a value before the given index (len(list) appends).
+        Time Complexity: expected O(log(N))
+        """
+        if not (0 <= index <= self.__len):
+            raise IndexError("Index out of range")
+        update, positions = self._path(index)
+        self._link(update, positions, index, value)
+
+    def insert_front(self, value: T) -> None:
+        """Inserts a value at the head of the list. Time Complexity: expected O(log(N))"""
+        self.insert(0, value)
+
+    def insert_end(self, value: T) -> None:
+        """Inserts a value at the tail of the list. Time Complexity: expected O(log(N))"""
+        self.insert(self.__len, value)
+
+    def delete_front(self) -> None:
+        """Removes the value at the head of the list, if any. Time Complexity: expected O(log(N))"""
+        if self.__len:
+            self.delete(0)
+
+    def delete_end(self) -> None:
+        """Removes the value at the tail of the list, if any. Time Complexity: expected O(log(N))"""
+        if self.__len:
+            self.delete(self.__len - 1)
+
+    def get(self, index: int) -> T:
+        """
+        Returns the value at the given index.
+        Time Complexity: expected O(log(N))
+        """
+        return self._node_at(index).data
+
+    def delete(self, index: int) -> None:
+        """
+        Deletes the value at the given index.
+        Time Complexity: expected O(log(N))
+        """
+        if not (0 <= index < self.__len):
+            raise IndexError("Index out of range")
+        self._unlink(self._path(index)[0])
+
+    def __len__(self) -> int:
+        """Returns the number of values in the list. Time Complexity: O(1)"""
+        return self.__len
+
+    def __iter__(self) -> Iterator[T]:
+        """Allows for iterating over the list's data along the bottom level."""
+        node = self._head.next[0]
+        while node is not self._end:
+            yield node.data
+            node = node.next[0]
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the skip list."""
+        if not self.__len:
+            return f"{type(self).__name__}()"
+        return f"{type(self).__name__}({ ' -> '.join(map(str, self)) })"
+
+    def __getitem__(self, index: int) -> T:
+        """Allows for indexing into the list (e.g., list[index])."""
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """Allows for setting values in the list (e.g., list[index] = value)."""
+        self._node_at(index).data = value
+
+    def __delitem__(self, index: int) -> None:
+        """Allows for deleting items from the list (e.g., del list[index])."""
+        self.delete(index)
+
+    def __str__(self) -> str:
+        """Provides a user-friendly string representation of the skip list."""
+        return f"{type(self).__name__}({ ' -> '.join(map(str, self)) })"
+
+    def __contains__(self, value: Any) -> bool:
+        """Allows for checking if a value is in the list (e.g., value in list)."""
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+
+class SortedSkipList(SkipList[T]):
+    """
+    A skip list that keeps its values in ascending order.
+
+    Values are added with `add` and found by comparing them down the levels,
+    so membership, rank (`bisect_left`/`bisect_right`, `index`) and removal
+    by value are expected O(log(N)), on top of SkipList's positional access.
+    The positional insertion methods are disabled as they could break the order.
+    """
+    def _value_path(self, value: T, right: bool) -> Tuple[List[SkipNode[T]], List[int]]:
+        """Like `_path`, for the position bisect_left (or bisect_right) would return."""
+        head, end = self._head, self._end
+        levels = len(head.next)
+        update: List[SkipNode[T]] = [head] * levels
+        positions = [0] * levels
+        node, position = head, 0
+        for level in reversed(range(levels)):
+            while True:
+                following = node.next[level]
+                if following is end:
+                    break
+                if (value < following.data) if right else not (following.data < value):
+                    break
+                position += node.width[level]
+                node = following
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def add(self, value: T) -> None:
+        """Inserts a value after any equal ones. Time Complexity: expected O(log(N))"""
+        update, positions = self._value_path(value, True)
+        self._link(update, positions, positions[0], value)
+
+    def remove(self, value: T) -> None:
+        """
+        Removes one occurrence of value. Time Complexity: expected O(log(N))
+        Raises ValueError if it is absent.
+        """
+        update, _ = self._value_path(value, False)
+        following = update[0].next[0]
+        if following is self._end or following.data != value:
+            raise ValueError(f"{value!r} not in {type(self).__name__}")
+        self._unlink(update)
+
+    def bisect_left(self, value: T) -> int:
+        """The number of values strictly smaller than value."""
+        return self._value_path(value, False)[1][0]
+
+    def bisect_right(self, value: T) -> int:
+        """The number of values smaller than or equal to value."""
+        return self._value_path(value, True)[1][0]
+
+    def index(self, value: T) -> int:
+        """The position of the first occurrence of value. Raises ValueError if absent."""
+        update, positions = self._value_path(value, False)
+        following = update[0].next[0]
+        if following is self._end or following.data != value:
+            raise ValueError(f"{value!r} not in {type(self).__name__}")
+        return positions[0]
+
+    def __contains__(self, value: Any) -> bool:
+        """Checks if value is in the list. Time Complexity: expected O(log(N))"""
+        following = self._value_path(value, False)[0][0].next[0]
+        return following is not self._end and following.data == value
+
+    def insert(self, index: int, value: T) -> None:
+        raise TypeError("use add(), a SortedSkipList keeps its own order")
+
+    def insert_front(self, value: T) -> None:
+        raise TypeError("use add(), a SortedSkipList keeps its own order")
+
+    def insert_end(self, value: T) -> None:
+        raise TypeError("use add(), a SortedSkipList keeps its own order")
+
+    def __setitem__(self, index: int, value: T) -> None:
+        raise TypeError("use remove() and add(), a SortedSkipList keeps its own order")
+
+
+def test_skip_list():
+    rng = random.Random(24)
+
+    sl = SkipList(seed=1)
+    sl.insert_front(1)
+    sl.insert_front(2)
+    sl.insert_front(3)
+    sl.insert_end(4)
+    assert [sl.get(i) for i in range(4)] == [3, 2, 1, 4]
+    sl.delete_front()
+    sl.delete_end()
+    sl.delete(1)
+    assert list(sl) == [2] and len(sl) == 1
+    assert 2 in sl and 3 not in sl
+    sl[0] = 5
+    assert str(sl) == "SkipList(5)"
+    del sl[0]
+    assert len(sl) == 0 and repr(sl) == "SkipList()"
+    try:
+        sl.get(0)
+        assert False, "IndexError was not raised for an empty list"
+    except IndexError:
+        pass
+
+    # Random positional operations against a Python list
+    sl, reference = SkipList(seed=2), []
+    for step in range(4000):
+        choice = rng.random()
+        if choice < 0.5 or not reference:
+            index = rng.randint(0, len(reference))
+            sl.insert(index, step)
+            reference.insert(index, step)
+        elif choice < 0.75:
+            index = rng.randrange(len(reference))
+            del sl[index]
+            del reference[index]
+        else:
+            index = rng.randrange(len(reference))
+            sl[index] = -step
+            reference[index] = -step
+        if step % 97 == 0:
+            assert list(sl) == reference
+    assert list(sl) == reference and len(sl) == len(reference)
+    assert all(sl[i] == value for i, value in enumerate(reference))
+
+    # The sorted variant
+    ssl = SortedSkipList(seed=3)
+    values = [rng.randint(0, 300) for _ in range(2000)]
+    for value in values:
+        ssl.add(value)
+    values.sort()
+    assert list(ssl) == values and ssl[1000] == values[1000]
+    for probe in (0, 17, 150, 300, 301):
+        assert ssl.bisect_left(probe) == sum(v < probe for v in values)
+        assert ssl.bisect_right(probe) == sum(v <= probe for v in values)
+        assert (probe in ssl) == (probe in values)
+    for value in values[::3]:
+        ssl.remove(value)
+    del values[::3]
+    assert list(ssl) == values
+    assert ssl.index(values[10]) == values.index(values[10])
+    for operation in (lambda: ssl.remove(-1), lambda: ssl.index(-1)):
+        try:
+            operation()
+            assert False, "ValueError was not raised for a missing value"
+        except ValueError:
+            pass
+    try:
+        ssl.insert_end(5)
+        assert False, "TypeError was not raised for insert_end()"
+    except TypeError:
+        pass
+
+    print("All tests passed [Skip->List]! :)")
+
+if __name__ == "__main__":
+    test_skip_list()
@@ -0,0 +1,352 @@
+from array import array
+from typing import Any, Generic, Iterator, MutableSequence, Optional, Tuple, TypeVar
+
+"""
+An unrolled linked list: a linked list of small arrays.
+"""
+T = TypeVar('T')
+
+# Elements per chunk of an UnrolledLinkedList created without a capacity.
+DEFAULT_CHUNK_CAPACITY = 64
+
+class Chunk(Generic[T]):
+    """
+    A single node of an unrolled linked list.
+
+    Attributes:
+        items (MutableSequence[T]): Up to `capacity` elements, a list or an array.array.
+        next (Optional[Chunk[T]]): A pointer to the next chunk in the list.
+    """
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: MutableSequence[T], next_chunk: Optional["Chunk[T]"] = None) -> None:
+        self.items = items
+        self.next = next_chunk
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the chunk."""
+        return f"Chunk({list(self.items)})"
+
+
+class UnrolledLinkedList(Generic[T]):
+    """
+    A linked list whose nodes each hold up to `capacity` elements.
+
+    It has the same interface as LinkedList, but one node per chunk instead
+    of one per element: positional access skips whole chunks, so it is
+    O(N / capacity) plus O(capacity) inside the chunk, and iteration reads
+    the elements of a chunk contiguously. A full chunk is split in half when
+    inserting into it, and a chunk that drops below half full after a delete
+    takes elements from, or merges with, its successor.
+
+    With a `typecode` the chunks are array.array instances, which store
+    numbers unboxed at their native width.
+    """
+    def __init__(self, capacity: int = DEFAULT_CHUNK_CAPACITY, typecode: Optional[str] = None) -> None:
+        """Initializes an empty list with chunks of `capacity` elements."""
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.typecode = typecode
+        self.head: Optional[Chunk[T]] = None
+        self.tail: Optional[Chunk[T]] = None
+        self.__len = 0
+
+    def _new_items(self) -> MutableSequence[T]:
+        return [] if self.typecode is None else array(self.typecode)  # type: ignore
+
+    def _locate(self, index: int) -> Tuple[Optional[Chunk[T]], Chunk[T], int]:
+        """Returns (previous chunk, chunk, offset in chunk) of a valid index."""
+        if not (0 <= index < self.__len):
+            raise IndexError("Index out of range")
+
+        previous, current = None, self.head
+        assert current is not None, "Head should not be None if index is valid"
+        while index >= len(current.items):
+            index -= len(current.items)
+            previous, current = current, current.next
+            assert current is not None
+        return previous, current, index
+
+    def _split(self, chunk: Chunk[T]) -> None:
+        """Moves the upper half of a full chunk into a new chunk after it."""
+        half = len(chunk.items) // 2
+        moved = self._new_items()
+        moved.extend(chunk.items[half:])  # type: ignore
+        del chunk.items[half:]
+        chunk.next = Chunk(moved, chunk.next)
+        if chunk is self.tail:
+            self.tail = chunk.next
+
+    def _rebalance(self, previous: Optional[Chunk[T]], chunk: Chunk[T]) -> None:
+        """Restores the fill invariants after an element was removed from chunk."""
+        if not chunk.items:
+            # Unlink the empty chunk.
+            if previous is None:
+                self.head = chunk.next
+            else:
+                previous.next = chunk.next
+            if chunk is self.tail:
+                self.tail = previous
+            return
+
+        following = chunk.next
+        if following is None or len(chunk.items) >= self.capacity // 2:
+            return
+        if len(chunk.items) + len(following.items) <= self.capacity:
+            # Merge the successor into this chunk.
+            chunk.items.extend(following.items)  # type: ignore
+            chunk.next = following.next
+            if following is self.tail:
+                self.tail = chunk
+        else:
+            # Borrow elements so both end up about equally full.
+            count = (len(following.items) - len(chunk.items)) // 2
+            chunk.items.extend(following.items[:count])  # type: ignore
+            del following.items[:count]
+
+    def _drop_tail(self) -> None:
+        """Unlinks the tail chunk, walking from the head to find its predecessor."""
+        previous = self.head
+        if previous is self.tail:
+            self.head = self.tail = None
+            return
+        while previous.next is not self.tail:  # type: ignore
+            previous = previous.next  # type: ignore
+        previous.next = None  # type: ignore
+        self.tail = previous
+
+    def insert_front(self, value: T) -> None:
+        """
+        Inserts a value at the head of the list.
+
+        Time Complexity: O(capacity)
+        """
+        if self.head is None or len(self.head.items) >= self.capacity:
+            items = self._new_items()
+            items.append(value)
+            self.head = Chunk(items, self.head)
+            if self.tail is None:
+                self.tail = self.head
+        else:
+            self.head.items.insert(0, value)
+        self.__len += 1
+
+    def insert_end(self, value: T) -> None:
+        """
+        Inserts a value at the tail of the list.
+
+        Time Complexity: O(1)
+        """
+        if self.tail is None:
+            self.insert_front(value)
+            return
+
+        if len(self.tail.items) >= self.capacity:
+            # Fill the new chunk before linking it, so a rejected value leaves no empty chunk.
+            items = self._new_items()
+            items.append(value)
+            self.tail.next = Chunk(items)
+            self.tail = self.tail.next
+        else:
+            self.tail.items.append(value)
+        self.__len += 1
+
+    def insert(self, index: int, value: T) -> None:
+        """
+        Inserts a value before the given index (len(list) appends).
+
+        Time Complexity: O(N / capacity + capacity)
+        """
+        if index == self.__len:
+            self.insert_end(value)
+            return
+
+        _, chunk, offset = self._locate(index)
+        if len(chunk.items) >= self.capacity:
+            self._split(chunk)
+            if offset > len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = chunk.next  # type: ignore
+        chunk.items.insert(offset, value)
+        self.__len += 1
+
+    def delete_front(self) -> None:
+        """
+        Removes the value at the head of the list.
+
+        Time Complexity: O(capacity)
+        """
+        if self.head is not None:
+            self.delete(0)
+
+    def delete_end(self) -> None:
+        """
+        Removes the value at the tail of the list.
+
+        Time Complexity: O(1) unless the tail chunk empties, then O(N / capacity)
+        to find the new tail.
+        """
+        if not self.__len:
+            return
+
+        # Empty chunks are never left behind, but skipping them costs nothing.
+        while not self.tail.items:  # type: ignore # a non-empty list has a tail
+            self._drop_tail()
+        self.tail.items.pop()  # type: ignore
+        self.__len -= 1
+        if not self.tail.items:  # type: ignore
+            self._drop_tail()
+
+    def get(self, index: int) -> T:
+        """
+        Returns the value at the given index.
+        Time Complexity: O(N / capacity)
+        """
+        _, chunk, offset = self._locate(index)
+        return chunk.items[offset]
+
+    def delete(self, index: int) -> None:
+        """
+        Deletes the value at the given index.
+        Time Complexity: O(N / capacity + capacity)
+        """
+        previous, chunk, offset = self._locate(index)
+        del chunk.items[offset]
+        self.__len -= 1
+        self._rebalance(previous, chunk)
+
+    def __len__(self) -> int:
+        """Returns the number of values in the list. Time Complexity: O(1)"""
+        return self.__len
+
+    def __iter__(self) -> Iterator[T]:
+        """Allows for iterating over the list's data (e.g., in a for loop)."""
+        current = self.head
+        while current:
+            yield from current.items
+            current = current.next
+
+    def __repr__(self) -> str:
+        """Provides a developer-friendly representation of the linked list."""
+        if self.head is None:
+            return "UnrolledLinkedList()"
+        chunks = []
+        current = self.head
+        while current:
+            chunks.append(f"[{', '.join(map(str, current.items))}]")
+            current = current.next
+        return f"UnrolledLinkedList({' -> '.join(chunks)})"
+
+    def __getitem__(self, index: int) -> T:
+        """Allows for indexing into the list (e.g., list[index])."""
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """Allows for setting values in the list (e.g., list[index] = value)."""
+        _, chunk, offset = self._locate(index)
+        chunk.items[offset] = value
+
+    def __delitem__(self, index: int) -> None:
+        """Allows for deleting items from the list (e.g., del list[index])."""
+        self.delete(index)
+
+    def __str__(self) -> str:
+        """Provides a user-friendly string representation of the linked list."""
+        return f"UnrolledLinkedList({ ' -> '.join(map(str, self)) })"
+
+    def __contains__(self, value: Any) -> bool:
+        """Allows for checking if a value is in the list (e.g., value in list)."""
+        current = self.head
+        while current:
+            if value in current.items:
+                return True
+            current = current.next
+        return False
+
+
+def test_unrolled_linked_list():
+    import random
+    rng = random.Random(23)
+
+    ull = UnrolledLinkedList(capacity=4)
+    ull.insert_front(1)
+    ull.insert_front(2)
+    ull.insert_front(3)
+    ull.insert_end(4)
+    assert [ull.get(i) for i in range(4)] == [3, 2, 1, 4]
+
+    ull.delete_front()
+    ull.delete_end()
+    ull.delete(1)
+    assert list(ull) == [2] and len(ull) == 1
+    assert 2 in ull and 3 not in ull
+    ull[0] = 5
+    del ull[0]
+    assert len(ull) == 0 and ull.head is None and ull.tail is None
+    assert repr(ull) == "UnrolledLinkedList()"
+
+    # Random operations against a Python list, checking the chunk invariants
+    for typecode in (None, 'q'):
+        ull = UnrolledLinkedList(capacity=8, typecode=typecode)
+        reference = []
+        for step in range(3000):
+            choice = rng.random()
+            if choice < 0.2:
+                ull.insert_front(step)
+                reference.insert(0, step)
+            elif choice < 0.4:
+                ull.insert_end(step)
+                reference.append(step)
+            elif choice < 0.6:
+                index = rng.randint(0, len(reference))
+                ull.insert(index, step)
+                reference.insert(index, step)
+            elif reference and choice < 0.75:
+                index = rng.randrange(len(reference))
+                del ull[index]
+                del reference[index]
+            elif reference and choice < 0.85:
+                ull.delete_end()
+                reference.pop()
+            elif reference and choice < 0.9:
+                ull.delete_front()
+                reference.pop(0)
+            elif reference:
+                index = rng.randrange(len(reference))
+                ull[index] = -step
+                reference[index] = -step
+                assert ull[index] == -step
+
+            chunk, last = ull.head, None
+            while chunk:
+                assert 0 < len(chunk.items) <= 8
+                last, chunk = chunk, chunk.next
+            assert last is ull.tail
+        assert list(ull) == reference and len(ull) == len(reference)
+
+    # A value the typed chunks reject leaves the list as it was
+    ull = UnrolledLinkedList(capacity=2, typecode='q')
+    for value in (1, 2):
+        ull.insert_end(value)
+    try:
+        ull.insert_end('x')
+        assert False, "TypeError was not raised for a value the array rejects"
+    except TypeError:
+        pass
+    assert list(ull) == [1, 2] and len(ull) == 2 and ull.head is ull.tail
+    ull.delete_end()
+    ull.delete_end()
+    assert len(ull) == 0 and ull.head is None and ull.tail is None
+
+    assert str(UnrolledLinkedList()) == "UnrolledLinkedList()"
+    try:
+        UnrolledLinkedList().get(0)
+        assert False, "IndexError was not raised for an empty list"
+    except IndexError:
+        pass
+
+    print("All tests passed [Unrolled->Linked->List]! :)")
+
+if __name__ == "__main__":
+    test_unrolled_linked_list()
@@ -1,12 +1,18 @@
 from .LinkedList import LinkedList, test_linked_list
+from .DoublyLinkedList import DoublyLinkedList, test_doubly_linked_list
+from .UnrolledLinkedList import UnrolledLinkedList, test_unrolled_linked_list
+from .SkipList import SkipList, SortedSkipList, test_skip_list
 from .BinaryTree import BinaryTree, test_binary_tree
 from .BinarySearchTree import BinarySearchTree, test_BST
 
-__all__ = ["LinkedList", "BinaryTree", "BinarySearchTree"]
-__version__ = "0.4.1"
+__all__ = ["LinkedList", "DoublyLinkedList", "UnrolledLinkedList", "SkipList", "SortedSkipList", "BinaryTree", "BinarySearchTree"]
+__version__ = "0.5.0"
 
 def main():
     test_linked_list()
+    test_doubly_linked_list()
+    test_unrolled_linked_list()
+    test_skip_list()
     test_binary_tree()
     test_BST()
 
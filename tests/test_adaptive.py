@@ -0,0 +1,49 @@
+import random
+
+from algo.adaptive import SortDecision, smartSort
+from algo.sort import np
+from benchmarks.generators import DISTRIBUTIONS, generate
+
+
+def test_smart_sort_sorts_every_distribution():
+    for distribution in DISTRIBUTIONS:
+        for n in (0, 5, 200, 3000):
+            data = generate(distribution, n)
+            lst = data.copy()
+            decision = smartSort(lst)
+            assert isinstance(decision, SortDecision)
+            assert lst == sorted(data), (distribution, n, decision)
+
+
+def test_smart_sort_decisions():
+    rng = random.Random(50)
+    assert smartSort([3, 1, 2]).algorithm == "insertion"
+    assert smartSort(list(range(5000))).algorithm == "merge"
+    assert smartSort(list(range(5000, 0, -1))).algorithm == "merge"
+    sawtooth = generate("sawtooth", 100000)
+    assert smartSort(sawtooth).runs > 4
+
+    decision = smartSort([rng.randint(0, 1000) for _ in range(5000)])
+    assert decision.algorithm == "count" and decision.integer and decision.value_range <= 1000
+
+    decision = smartSort([rng.randint(0, 2**40) for _ in range(5000)])
+    assert decision.algorithm == ("count" if np is not None else "radix")
+    assert smartSort([rng.randint(0, 2**70) for _ in range(5000)]).algorithm == "radix"
+
+    floats = [rng.random() for _ in range(5000)]
+    assert smartSort(floats.copy()).algorithm == "quick"
+    assert smartSort(floats.copy(), stable=True).algorithm == "merge"
+
+
+def test_smart_sort_with_key_and_mixed_types():
+    rng = random.Random(51)
+    records = [(rng.randint(0, 50), i) for i in range(2000)]
+    lst = records.copy()
+    decision = smartSort(lst, key=lambda r: r[0], reverse=True)
+    assert lst == sorted(records, key=lambda r: r[0], reverse=True)
+    assert decision.algorithm == "count"
+
+    mixed = [rng.randint(0, 100) for _ in range(1000)] + [0.5]
+    lst = mixed.copy()
+    assert smartSort(lst).algorithm in ("quick", "merge")
+    assert lst == sorted(mixed)
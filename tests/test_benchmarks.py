@@ -0,0 +1,59 @@
+from algo.profiling import profileSort
+from benchmarks.bench_sort import Measurement, compare, measure
+from benchmarks.generators import DISTRIBUTIONS, generate, mcilroyKiller
+
+
+def test_generators_shapes():
+    for distribution in DISTRIBUTIONS:
+        for n in (0, 1, 17, 300):
+            data = generate(distribution, n)
+            assert len(data) == n
+            assert data == generate(distribution, n)  # seeded, reproducible
+
+    assert generate("organ-pipe", 6) == [0, 1, 2, 2, 1, 0]
+    assert len(set(generate("few-unique", 1000))) <= 8
+
+
+def test_mcilroy_killer_hurts_naive_quicksort():
+    def naive(lst, low=0, high=None):
+        # Middle-element pivot quicksort, the kind the adversary targets.
+        high = len(lst) - 1 if high is None else high
+        while low < high:
+            pivot = lst[(low + high) // 2]
+            i, j = low, high
+            while i <= j:
+                while lst[i] < pivot:
+                    i += 1
+                while pivot < lst[j]:
+                    j -= 1
+                if i <= j:
+                    lst[i], lst[j] = lst[j], lst[i]
+                    i, j = i + 1, j - 1
+            naive(lst, low, j)
+            low = i
+
+    killer = mcilroyKiller(200, None, naive)
+    random_input = generate("random", 200)
+
+    def comparisons(data):
+        return profileSort(naive, data)[1].comparisons
+
+    assert comparisons(killer) > 3 * comparisons(random_input)
+
+
+def test_measure_and_compare():
+    data = generate("random", 200)
+    result = measure("mergeSort", "random", data, repeat=1)
+    assert result.comparisons and result.moves and result.peak_bytes is not None
+    assert measure("countSort", "random", data, repeat=1).comparisons == 0
+
+    baseline = [{"sorter": "mergeSort", "distribution": "random", "size": 200,
+                 "seconds": 1.0, "comparisons": result.comparisons}]
+    assert compare([result], baseline, 0.5) == []
+
+    slow = Measurement("mergeSort", "random", 200, seconds=2.0, comparisons=result.comparisons * 2)
+    assert len(compare([slow], baseline, 0.5)) == 1
+    assert len(compare([slow], baseline, 0.5, time_threshold=0.5)) == 2
+
+    unknown = Measurement("shellSort", "random", 200, seconds=1.0)
+    assert compare([unknown], baseline, 0.5) == ["shellSort / random / N=200: not in the baseline"]
@@ -0,0 +1,64 @@
+import os
+import random
+import resource
+
+import pytest
+
+from algo import external
+from algo.external import externalSort, readRecords, writeRecords
+
+
+def test_external_sort_spills_many_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(external, "MAX_FAN_IN", 4)  # force intermediate merge passes
+    rng = random.Random(20)
+    data = [rng.randint(-2**63, 2**63 - 1) for _ in range(5000)]
+
+    result = list(externalSort(data, memory_limit=4096, tmpdir=str(tmp_path)))
+    assert result == sorted(data)
+    assert os.listdir(tmp_path) == []  # run files are cleaned up
+
+    assert list(externalSort(data, 4096, reverse=True, algorithm="quick")) == sorted(data, reverse=True)
+
+
+def test_external_sort_record_types(tmp_path):
+    rng = random.Random(21)
+    floats = [rng.uniform(-1, 1) for _ in range(2000)]
+    assert list(externalSort(floats, 2048)) == sorted(floats)
+
+    words = ["".join(rng.choice("abcé") for _ in range(rng.randint(0, 6))) for _ in range(2000)]
+    assert list(externalSort(words, 2048, key=len)) == sorted(words, key=len)
+
+    blobs = [w.encode() for w in words]
+    path = tmp_path / "blobs.bin"
+    assert writeRecords(path, blobs, "bytes") == len(blobs)
+    assert list(readRecords(path, "bytes")) == blobs
+    assert list(externalSort(path, 2048, record_type="bytes")) == sorted(blobs)
+
+    assert list(externalSort([])) == []
+    with pytest.raises(ValueError):
+        list(externalSort(path))
+    with pytest.raises(TypeError):
+        list(externalSort([1, "a"], 1))
+    with pytest.raises(TypeError):
+        list(externalSort([None, 3, 1]))
+
+
+@pytest.mark.skipif(not os.environ.get("DSA_EXTERNAL_SORT_GB"),
+                    reason="set DSA_EXTERNAL_SORT_GB=<size> to run the multi-GB sort")
+def test_external_sort_multi_gb_file_under_256mb(tmp_path):
+    size = int(float(os.environ["DSA_EXTERNAL_SORT_GB"]) * 2**30)
+    count = size // 8
+    rng = random.Random(22)
+    path = tmp_path / "big.bin"
+    writeRecords(path, (rng.getrandbits(63) for _ in range(count)), "int")
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    previous, seen = -1, 0
+    for value in externalSort(path, 256 * 2**20, record_type="int", tmpdir=str(tmp_path)):
+        assert previous <= value
+        previous, seen = value, seen + 1
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    assert seen == count
+    # ru_maxrss is in KiB on Linux; allow for the interpreter and merge buffers.
+    assert (peak - before) * 1024 < 2 * 256 * 2**20
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from algo.parallel import ALGORITHMS, parallelSort
+
+
+def test_parallel_sort_shared_memory_paths():
+    rng = random.Random(10)
+    ints = [rng.randint(-2**62, 2**62) for _ in range(4000)]
+    floats = [rng.uniform(-1e9, 1e9) for _ in range(4000)]
+
+    for algorithm in ("merge", "quick", "radix"):
+        result = parallelSort(ints, workers=3, algorithm=algorithm, threshold=0)
+        assert result == sorted(ints)
+    assert parallelSort(floats, workers=4, threshold=0) == sorted(floats)
+
+
+def test_parallel_sort_pickled_path_is_stable():
+    rng = random.Random(11)
+    huge = [rng.randint(0, 2**80) for _ in range(500)]  # too wide for shared memory
+    assert parallelSort(huge, workers=2, threshold=0) == sorted(huge)
+
+    words = [rng.choice("abcde") * rng.randint(1, 3) for _ in range(500)]
+    assert parallelSort(words, workers=2, algorithm="insertion", threshold=0) == sorted(words)
+
+
+def test_parallel_sort_serial_fallback_and_errors():
+    data = [5, 3, 9, 1]
+    assert parallelSort(data) == [1, 3, 5, 9]
+    assert data == [5, 3, 9, 1]
+    assert parallelSort([]) == []
+
+    with pytest.raises(ValueError):
+        parallelSort(data, algorithm="bogo")
+    with pytest.raises(ValueError):
+        parallelSort(data, workers=0)
+    assert set(ALGORITHMS) >= {"merge", "quick", "count"}
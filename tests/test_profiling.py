@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from algo import sort
+from algo.profiling import SortStats, profileSort
+from algo.selection import nthElement
+from algo.sort import countSort, insertionSort, mergeSort, quickSort
+
+
+def test_profile_sort_counts_and_sorts():
+    rng = random.Random(40)
+    data = [rng.randint(0, 1000) for _ in range(500)]
+
+    lst = data.copy()
+    result, stats = profileSort(insertionSort, lst)
+    assert result is None and lst == sorted(data)
+    assert stats.comparisons > 0 and stats.moves > 0 and stats.max_depth == 0
+
+    lst = data.copy()
+    result, stats = profileSort(mergeSort, lst)
+    assert result == sorted(data) and lst == data  # not in-place
+    assert stats.allocations == 1 and stats.allocated_slots == len(data)
+
+    lst = data.copy()
+    _, stats = profileSort(quickSort, lst, 0, len(lst) - 1, key=lambda x: -x)
+    assert lst == sorted(data, reverse=True)
+    assert 1 <= stats.max_depth <= 2 * len(data).bit_length() + 1
+
+    lst = data.copy()
+    strategy, stats = profileSort(countSort, lst)
+    assert strategy == "dense" and lst == sorted(data)
+    assert stats.comparisons == 0 and stats.moves == len(data)
+
+    lst = data.copy()
+    value, _ = profileSort(nthElement, lst, 10)
+    assert value == sorted(data)[10]
+
+
+def test_profile_sort_leaves_no_patches_behind():
+    originals = (sort._introSort, sort._newBuffer, sort._newKeyList)
+    with pytest.raises(TypeError):
+        profileSort(mergeSort, [1, "a", 2.0, None])
+    assert (sort._introSort, sort._newBuffer, sort._newKeyList) == originals
+    assert SortStats() == SortStats(0, 0, 0, 0, 0)
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from algo.selection import _introSelect, nthElement, partialSort, topK
+
+
+def test_nth_element_places_kth_value():
+    rng = random.Random(30)
+    cases = [
+        [rng.randint(0, 10**6) for _ in range(2000)],
+        [rng.randint(0, 3) for _ in range(2000)],
+        list(range(2000)),
+        list(range(2000, 0, -1)),
+    ]
+    for case in cases:
+        for k in (0, 1, 500, 1999, -1):
+            data = case.copy()
+            value = nthElement(data, k)
+            expected = sorted(case)
+            assert value == data[k] == expected[k]
+            index = k % len(data)
+            assert max(data[:index], default=value) <= value <= min(data[index + 1:], default=value)
+
+    data = cases[0].copy()
+    assert nthElement(data, 10, reverse=True) == sorted(cases[0], reverse=True)[10]
+
+    with pytest.raises(IndexError):
+        nthElement([], 0)
+
+
+def test_median_of_medians_fallback():
+    rng = random.Random(31)
+    data = [rng.randint(0, 500) for _ in range(3000)]
+    expected = sorted(data)
+    _introSelect(data, 0, len(data) - 1, 1234, 0)  # depth 0 forces BFPRT pivots
+    assert data[1234] == expected[1234]
+
+
+def test_partial_sort():
+    rng = random.Random(32)
+    data = [rng.random() for _ in range(1000)]
+    for k in (0, 1, 100, 1000, 5000):
+        partial = data.copy()
+        partialSort(partial, k)
+        assert partial[:k] == sorted(data)[:k]
+        assert sorted(partial) == sorted(data)
+
+    records = [{"score": rng.randint(0, 50)} for _ in range(500)]
+    partial = records.copy()
+    partialSort(partial, 20, key=lambda r: r["score"], reverse=True)
+    assert [r["score"] for r in partial[:20]] == sorted((r["score"] for r in records), reverse=True)[:20]
+
+
+def test_top_k():
+    rng = random.Random(33)
+    scores = [rng.randint(0, 100) for _ in range(5000)]
+    assert topK(iter(scores), 100) == sorted(scores, reverse=True)[:100]
+    assert topK(scores, 0) == []
+    assert topK([3, 1], 5) == [3, 1]
+
+    pairs = [(i, rng.randint(0, 10)) for i in range(300)]
+    expected = sorted(pairs, key=lambda p: p[1], reverse=True)[:25]  # stable: earlier first
+    assert topK(pairs, 25, key=lambda p: p[1]) == expected
@@ -1,18 +1,27 @@
+import random
+from array import array
+
+import pytest
+
 from algo.sort import (
     insertionSort,
     bubbleSort,
     selectionSort,
     mergeSort,
     quickSort,
-    countSort
+    countSort,
+    radixSort,
+    binaryInsertionSort,
+    shellSort,
+    cocktailSort,
+    _shellGaps,
+    np,
 )
 
 def test_all_sorting_functions():
     """
-    Tests all sorting functions with a variety of test cases and prints the results.
+    Tests all sorting functions with a variety of test cases.
     """
-    print("🚀 Starting tests for all sorting algorithms...\n")
-
     # A dictionary mapping function names to the actual function objects
     sorters = {
         "insertionSort": insertionSort,
@@ -21,6 +30,10 @@ def test_all_sorting_functions():
         "mergeSort": mergeSort,
         "quickSort": quickSort,
         "countSort": countSort,
+        "radixSort": radixSort,
+        "binaryInsertionSort": binaryInsertionSort,
+        "shellSort": shellSort,
+        "cocktailSort": cocktailSort,
     }
 
     # A dictionary of test cases to cover different scenarios
@@ -36,55 +49,274 @@ def test_all_sorting_functions():
 
     # Loop through each sorting function and test it with each case
     for func_name, sort_function in sorters.items():
-        print(f"--- Testing: {func_name} ---")
-        success_count = 0
         for case_name, original_list in test_cases.items():
-            
-            # --- PREPARATION ---
             # Create a copy, as most functions sort in-place!
             list_copy = original_list.copy()
-            
+
             # The universally correct answer is given by Python's built-in sorted()
             expected_result = sorted(original_list)
-            
-            # Special handling for countSort, which only accepts non-negative integers
-            if func_name == "countSort" and any(x < 0 for x in list_copy):
-                print(f"  ⚪ SKIPPING: '{case_name}' (contains negative numbers).")
-                continue
-
-            # --- EXECUTION ---
-            try:
-                if func_name == "mergeSort":
-                    # mergeSort is not in-place; it returns the sorted list
-                    actual_result = sort_function(list_copy)
-                else:
-                    # All other functions sort in-place
-                    if func_name == "quickSort":
-                        if list_copy: # Avoid index errors on empty lists
-                            sort_function(list_copy, 0, len(list_copy) - 1)
-                    elif func_name == "countSort":
-                         if list_copy: # Find max value for the function argument
-                            max_val = max(list_copy)
-                            sort_function(list_copy, max_val)
-                    else:
-                        sort_function(list_copy)
-                    
-                    actual_result = list_copy
-
-                # --- VERIFICATION ---
-                if actual_result == expected_result:
-                    print(f"  ✅ PASS: '{case_name}'")
-                    success_count += 1
+
+            if func_name == "mergeSort":
+                # mergeSort is not in-place by default; it returns the sorted list
+                actual_result = sort_function(list_copy)
+            else:
+                if func_name == "quickSort":
+                    sort_function(list_copy, 0, len(list_copy) - 1)
+                elif func_name == "countSort" and all(x >= 0 for x in list_copy) and list_copy:
+                    # With an explicit maximum countSort only takes non-negative ints
+                    sort_function(list_copy, max(list_copy))
                 else:
-                    print(f"  ❌ FAIL: '{case_name}'")
-                    print(f"     Expected: {expected_result}")
-                    print(f"     Got:      {actual_result}")
-            
-            except Exception as e:
-                print(f"  💥 ERROR: '{case_name}' raised an exception: {e}")
-
-        print("-" * (len(func_name) + 14) + "\n")
-
-# To run the tests when you execute the file:
-if __name__ == "__main__":
-    test_all_sorting_functions()
\ No newline at end of file
+                    sort_function(list_copy)
+                actual_result = list_copy
+
+            assert actual_result == expected_result, f"{func_name} failed on '{case_name}'"
+
+
+def test_quick_sort_adversarial_inputs():
+    """quickSort must stay fast and within the recursion limit on ordered input."""
+    rng = random.Random(1)
+    cases = [
+        list(range(5000)),
+        list(range(5000, 0, -1)),
+        [7] * 5000,
+        [rng.randint(0, 3) for _ in range(5000)],
+        [rng.random() for _ in range(5000)],
+    ]
+    for case in cases:
+        list_copy = case.copy()
+        quickSort(list_copy, 0, len(list_copy) - 1)
+        assert list_copy == sorted(case)
+
+
+def test_quick_sort_subrange_and_heap_fallback():
+    from algo.sort import _introSort
+
+    data = [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+    quickSort(data, 2, 7)
+    assert data == [9, 8, 2, 3, 4, 5, 6, 7, 1, 0]
+
+    data = list(range(300, 0, -1))
+    _introSort(data, 0, len(data) - 1, 0)  # depth 0 forces heap sort
+    assert data == sorted(data)
+
+
+def test_merge_sort_runs_and_inplace():
+    rng = random.Random(2)
+    cases = [
+        list(range(1000)),
+        list(range(1000, 0, -1)),
+        list(range(500)) + list(range(500, 0, -1)) + list(range(300)),
+        [rng.randint(0, 50) for _ in range(2000)],
+        [rng.random() for _ in range(1234)],
+    ]
+    for case in cases:
+        original = case.copy()
+        assert mergeSort(case) == sorted(original)
+        assert case == original  # not in-place by default
+
+        result = mergeSort(case, inplace=True)
+        assert result is case
+        assert case == sorted(original)
+
+
+def test_merge_sort_is_stable():
+    rng = random.Random(3)
+
+    class Item:
+        def __init__(self, key, tag):
+            self.key, self.tag = key, tag
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    items = [Item(rng.randint(0, 9), i) for i in range(700)]
+    result = mergeSort(items)
+    assert [(x.key, x.tag) for x in result] == sorted((x.key, x.tag) for x in items)
+
+
+def test_key_and_reverse_are_stable_for_every_sorter():
+    rng = random.Random(4)
+    records = [{"id": i, "score": rng.randint(0, 20)} for i in range(300)]
+
+    def run(name, lst, **kwargs):
+        if name == "mergeSort":
+            return mergeSort(lst, **kwargs)
+        if name == "quickSort":
+            quickSort(lst, 0, len(lst) - 1, **kwargs)
+        elif name == "countSort":
+            countSort(lst, 20, **kwargs)
+        else:
+            globals()[name](lst, **kwargs)
+        return lst
+
+    score = lambda record: record["score"]
+    for name in ["insertionSort", "bubbleSort", "selectionSort", "mergeSort", "quickSort", "countSort",
+                 "binaryInsertionSort", "shellSort", "cocktailSort"]:
+        for reverse in (False, True):
+            expected = sorted(records, key=score, reverse=reverse)
+            assert run(name, records.copy(), key=score, reverse=reverse) == expected, name
+
+        values = [r["score"] for r in records]
+        assert run(name, values.copy(), reverse=True) == sorted(values, reverse=True), name
+
+
+def test_key_with_unhashable_keys():
+    data = [[3, 1], [1, 2], [3, 0], [1, 1]]
+    expected = sorted(data, key=lambda x: [x[0]], reverse=True)
+    assert mergeSort(data, key=lambda x: [x[0]], reverse=True) == expected
+
+    data_copy = data.copy()
+    quickSort(data_copy, 0, len(data_copy) - 1, key=lambda x: [x[0]])
+    assert data_copy == sorted(data, key=lambda x: [x[0]])
+
+
+def test_key_calls_once_per_element():
+    calls = []
+
+    def key(x):
+        calls.append(x)
+        return -x
+
+    data = list(range(50))
+    insertionSort(data, key=key)
+    assert data == list(range(49, -1, -1))
+    assert len(calls) == 50
+
+
+def test_radix_sort_python_backend():
+    rng = random.Random(5)
+    cases = [
+        [rng.randint(-2**63, 2**63 - 1) for _ in range(500)],
+        [rng.randint(-1000, 1000) for _ in range(500)],
+        [3, 3, 3],
+        [1],
+        [],
+    ]
+    for case in cases:
+        for radix_bits in (1, 4, 8, 11):
+            list_copy = case.copy()
+            radixSort(list_copy, radix_bits, backend="python")
+            assert list_copy == sorted(case)
+
+    buffer = array("q", cases[0])
+    radixSort(buffer, reverse=True, backend="python")
+    assert buffer.tolist() == sorted(cases[0], reverse=True)
+
+    words = ["ccc", "a", "bb", "dddd", "ee"]
+    radixSort(words, key=len, backend="python")
+    assert words == ["a", "bb", "ee", "ccc", "dddd"]
+
+
+def test_radix_sort_rejects_bad_input():
+    with pytest.raises(ValueError):
+        radixSort([1, 2], 0)
+    with pytest.raises(TypeError):
+        radixSort([1.5, 0.5], backend="python")
+
+
+def test_numpy_backends():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(6)
+
+    for dtype in (np.int8, np.uint16, np.int32, np.int64, np.uint64):
+        info = np.iinfo(dtype)
+        values = np.array([rng.randint(int(info.min), int(info.max)) for _ in range(3000)], dtype=dtype)
+        expected = np.sort(values)
+        radixSort(values, backend="numpy")
+        assert values.dtype == dtype
+        assert (values == expected).all()
+
+    buffer = array("i", [rng.randint(-10**6, 10**6) for _ in range(3000)])
+    expected_list = sorted(buffer)
+    radixSort(buffer, 16)
+    assert buffer.tolist() == expected_list
+
+    data = [rng.randint(0, 500) for _ in range(5000)]
+    list_copy = data.copy()
+    countSort(list_copy, 500, backend="numpy")
+    assert list_copy == sorted(data)
+
+    ids = np.array(data, dtype=np.uint32)
+    countSort(ids, 500)
+    assert ids.tolist() == sorted(data)
+
+    with pytest.raises(ValueError):
+        countSort(np.array([3, -1, 2]), 3, backend="numpy")
+
+
+def test_count_sort_discovers_range():
+    rng = random.Random(7)
+
+    data = [rng.randint(-50, 50) for _ in range(1000)]
+    list_copy = data.copy()
+    assert countSort(list_copy, backend="python") == "dense"
+    assert list_copy == sorted(data)
+
+    data = [rng.randint(0, 100) for _ in range(1000)] + [2**31, -2**40]
+    list_copy = data.copy()
+    assert countSort(list_copy, backend="python") == "sparse"
+    assert list_copy == sorted(data)
+
+    assert countSort([], backend="python") == "dense"
+    records = [(-3, "a"), (10**12, "b"), (-3, "c"), (5, "d")]
+    assert countSort(records, key=lambda r: r[0], reverse=True, backend="python") == "sparse"
+    assert records == [(10**12, "b"), (5, "d"), (-3, "a"), (-3, "c")]
+
+
+def test_count_sort_array_buffers():
+    rng = random.Random(10)
+    data = [rng.randint(-1000, 1000) for _ in range(500)]
+    backends = ["python"] + (["numpy", "auto"] if np is not None else [])
+    for backend in backends:
+        buffer = array("q", data)
+        countSort(buffer, backend=backend)
+        assert buffer.tolist() == sorted(data)
+
+        buffer = array("q", data + [10**12])
+        countSort(buffer, backend=backend)
+        assert buffer.tolist() == sorted(data + [10**12])
+
+        buffer = array("H", [abs(x) for x in data])
+        countSort(buffer, 1000, reverse=True, backend=backend)
+        assert buffer.typecode == "H"
+        assert buffer.tolist() == sorted((abs(x) for x in data), reverse=True)
+
+
+def test_count_sort_reverse_numpy():
+    np = pytest.importorskip("numpy")
+    values = np.array([3, -1, 2, 3, 0], dtype=np.int32)
+    countSort(values, reverse=True)
+    assert values.tolist() == [3, 3, 2, 0, -1]
+
+
+def test_count_sort_discovers_range_numpy():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(8)
+
+    small = np.array([rng.randint(-128, 127) for _ in range(2000)], dtype=np.int8)
+    expected = np.sort(small)
+    assert countSort(small) == "numpy-dense"
+    assert (small == expected).all()
+
+    wide = np.array([rng.randint(0, 2**64 - 1) for _ in range(2000)], dtype=np.uint64)
+    expected = np.sort(wide)
+    assert countSort(wide) == "numpy-sparse"
+    assert (wide == expected).all()
+
+
+def test_small_buffer_sorts():
+    rng = random.Random(9)
+    assert _shellGaps(1000, "ciura") == [1, 4, 10, 23, 57, 132, 301, 701]
+    assert _shellGaps(1000, "tokuda") == [1, 4, 9, 20, 46, 103, 233, 525]
+    assert _shellGaps(1, "tokuda") == [1]
+
+    for n in (0, 1, 2, 8, 64, 500):
+        data = [rng.randint(0, n) for _ in range(n)]
+        for sorter in (binaryInsertionSort, cocktailSort,
+                       lambda lst: shellSort(lst, "ciura"), lambda lst: shellSort(lst, "tokuda")):
+            list_copy = data.copy()
+            sorter(list_copy)
+            assert list_copy == sorted(data)
+
+    with pytest.raises(ValueError):
+        shellSort([2, 1], "knuth")
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from algo.sortedlist import SortedList, mergeSorted
+
+
+def test_sorted_list_matches_sorted_reference():
+    rng = random.Random(130)
+    values = SortedList(load=8)
+    reference = []
+    for _ in range(40):
+        batch = [rng.randint(0, 300) for _ in range(rng.choice((1, 5, 60)))]
+        if len(batch) == 1:
+            values.add(batch[0])
+        else:
+            values.update(batch)
+        reference = sorted(reference + batch)
+        assert list(values) == reference
+        assert len(values) == len(reference)
+
+    assert list(reversed(values)) == reference[::-1]
+    for index in (0, 1, 57, len(reference) - 1, -1, -20):
+        assert values[index] == reference[index]
+    assert values[10:50] == reference[10:50]
+    assert values[::7] == reference[::7]
+    with pytest.raises(IndexError):
+        values[len(reference)]
+
+    for _ in range(300):
+        value = rng.randint(0, 300)
+        if rng.random() < 0.5:
+            assert values.discard(value) == (value in reference)
+            if value in reference:
+                reference.remove(value)
+        else:
+            index = rng.randrange(len(reference))
+            assert values.pop(index) == reference.pop(index)
+        assert list(values) == reference
+        assert all(len(chunk) <= 16 for chunk in values._lists)
+
+    with pytest.raises(ValueError):
+        values.remove(-1)
+
+
+def test_sorted_list_rank_and_range_queries():
+    data = [5, 1, 3, 3, 9, 7, 3, 1]
+    values = SortedList(data, load=4)
+    assert repr(values) == "SortedList([1, 1, 3, 3, 3, 5, 7, 9])"
+    assert values.bisect_left(3) == 2
+    assert values.bisect_right(3) == 5
+    assert values.bisect_left(10) == 8
+    assert values.count(3) == 3
+    assert values.index(5) == 5
+    assert 7 in values and 4 not in values
+    with pytest.raises(ValueError):
+        values.index(4)
+
+    assert list(values.irange(3, 7)) == [3, 3, 3, 5, 7]
+    assert list(values.irange(3, 7, inclusive=(False, False))) == [5]
+    assert list(values.irange(maximum=1)) == [1, 1]
+    assert list(values.irange(minimum=8)) == [9]
+
+    del values[0]
+    values.remove(9)
+    assert list(values) == [1, 3, 3, 3, 5, 7]
+    assert not SortedList()
+
+
+def test_merge_sorted():
+    rng = random.Random(131)
+    streams = [sorted(rng.randint(0, 50) for _ in range(rng.randint(0, 30))) for _ in range(5)]
+    for count in range(6):
+        expected = sorted(x for stream in streams[:count] for x in stream)
+        assert list(mergeSorted(*(iter(s) for s in streams[:count]))) == expected
+
+    # Stable on ties, keyed and descending.
+    left = [(1, "a"), (2, "a"), (2, "b")]
+    right = [(2, "c"), (3, "c")]
+    merged = list(mergeSorted(left, right, key=lambda pair: pair[0]))
+    assert merged == [(1, "a"), (2, "a"), (2, "b"), (2, "c"), (3, "c")]
+    assert list(mergeSorted([9, 4, 1], [8, 4], reverse=True)) == [9, 8, 4, 4, 1]
+
+    # Lazy: infinite inputs work as long as only a prefix is consumed.
+    evens = (2 * i for i in range(10**18))
+    odds = (2 * i + 1 for i in range(10**18))
+    merged = mergeSorted(evens, odds)
+    assert [next(merged) for _ in range(6)] == [0, 1, 2, 3, 4, 5]